@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os, zipfile, re
+from .patterns import rx
 
 def parse_addenda(tender_zip: str) -> dict:
     items = []
@@ -15,11 +16,11 @@ def parse_addenda(tender_zip: str) -> dict:
                 continue
             text = z.read(info).decode("utf-8", errors="ignore")
             files.add(name)
-            for m in re.findall(r"word\s*limit\s*([0-9]+)", text, flags=re.IGNORECASE):
+            for m in rx.findall(r"word\s*limit\s*([0-9]+)", text, flags=re.IGNORECASE):
                 wl = int(m)
                 items.append({"kind":"word_limit","value":wl,"file":name})
                 overrides["word_limit"] = wl
-            m = re.search(r"weights?\s*:\s*price\s*([0-9]+(?:\.[0-9]+)?)\s*,\s*quality\s*([0-9]+(?:\.[0-9]+)?)", text, flags=re.IGNORECASE)
+            m = rx.search(r"weights?\s*:\s*price\s*([0-9]+(?:\.[0-9]+)?)\s*,\s*quality\s*([0-9]+(?:\.[0-9]+)?)", text, flags=re.IGNORECASE)
             if m:
                 p = float(m.group(1)); q = float(m.group(2))
                 items.append({"kind":"weights","price":p,"quality":q,"file":name})
@@ -1,17 +1,24 @@
 import re
+from .ingest import MemberTable
+from .patterns import rx
+from .proximity import terms
+_FILENAME=("filnavn","filenavn","fil navn","file navn")
+_VALIDITY=("vedståelsesfrist","bid valid","bidvalid")
 def _weights(text):
     out=[]
-    for m in re.finditer(r'([A-Za-zÆØÅæøå \-/]+?)\s*[:\-]?\s*([0-9]{1,3})\s*%', text, flags=re.I):
+    for m in rx.finditer(r'([A-Za-zÆØÅæøå \-/]+?)\s*[:\-]?\s*([0-9]{1,3})\s*%', text, flags=re.I):
         out.append((m.group(1).strip(), int(m.group(2)), m.group(0)))
     return out
 def _env(text):
     rows={}
-    if re.search(r'\bMercell\b',text,re.I): rows["channel"]="Mercell"
-    m=re.search(r'fil(?:e|)-?navn[^0-9]{0,30}(\d{1,3})\s*tegn',text,re.I)
+    ti=terms(text)
+    if ti.has("mercell",prefix=False): rows["channel"]="Mercell"
+    # the regex runs only where the token index has both ends of it close together
+    m=rx.search_within(r'fil(?:e|)-?navn[^0-9]{0,30}(\d{1,3})\s*tegn',text,ti.near((_FILENAME,("tegn",)),64),re.I)
     if m: rows["filename_limit_chars"]=m.group(1)
-    m=re.search(r'\bspråk[^:\n]*[:]\s*(norsk|norwegian)',text,re.I)
+    m=rx.search(r'\bspråk[^:\n]*[:]\s*(norsk|norwegian)',text,re.I)
     if m: rows["language"]="nb-NO"
-    m=re.search(r'(vedståelsesfrist|bid\s*valid)\s*[: ]\s*(\d{1,2})\s*måneder',text,re.I)
+    m=rx.search_within(r'(vedståelsesfrist|bid\s*valid)\s*[: ]\s*(\d{1,2})\s*måneder',text,ti.near((_VALIDITY,("måneder",)),48),re.I)
     if m: rows["bid_validity_months"]=m.group(2)
     return rows
 def diff(base_txt, add_txt):
@@ -29,14 +36,15 @@ def diff(base_txt, add_txt):
             diffs.append({"field":"env:"+k,"before":str(bv),"after":str(av),"source_old":"","source_new":""})
     return diffs
 def scan(zf):
+    return scan_members(MemberTable.from_zipfile(zf))
+def scan_members(members):
     base=None; adds=[]
-    for zi in zf.infolist():
-        if zi.is_dir(): continue
-        n=zi.filename
+    for m in members.with_ext(".txt"):
+        n=m.name
         if n.lower()=="itt.txt":
-            base=zf.read(n).decode("utf-8","ignore")
-        if re.search(r'(tillegg|endring|oppklaring|klarifisering|q&a|qa).*\.txt$', n, flags=re.I):
-            adds.append((n, zf.read(n).decode("utf-8","ignore")))
+            base=members.text(n)
+        if rx.search(r'(tillegg|endring|oppklaring|klarifisering|q&a|qa).*\.txt$', n, flags=re.I):
+            adds.append((n, members.text(n)))
     out=[]
     if base and adds:
         for name,txt in adds:
@@ -0,0 +1,86 @@
+from __future__ import annotations
+import glob, json, os, traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from .receipt_bin import receipt_lines
+from .receipt_log import ReceiptLog
+from .registry import RUNNERS, load_runner
+
+def find_tender_zips(spec: str) -> List[str]:
+    if os.path.isdir(spec):
+        spec = os.path.join(spec, "*.zip")
+    return sorted(p for p in glob.glob(spec) if p.lower().endswith(".zip"))
+
+def tender_name(zip_path: str) -> str:
+    return os.path.splitext(os.path.basename(zip_path))[0]
+
+def run_one(runner: str, zip_path: str, out_dir: str, extra: Optional[List[str]] = None) -> Dict:
+    """Run one runner on one tender zip in this process and return its summary line."""
+    mod = load_runner(runner)
+    argv = ["--tender-zip", zip_path, "--out", out_dir] + list(extra or [])
+    try:
+        record = mod.run(mod.build_parser().parse_args(argv))
+        return {"tender": tender_name(zip_path), "tender_zip": zip_path, "runner": runner, "out": out_dir, "ok": True, "record": record}
+    except SystemExit as e:
+        err = f"argument error (exit {e.code})"
+    except Exception as e:
+        err = "".join(traceback.format_exception_only(type(e), e)).strip()
+    return {"tender": tender_name(zip_path), "tender_zip": zip_path, "runner": runner, "out": out_dir, "ok": False, "error": err}
+
+def _job(job):
+    return run_one(*job)
+
+def _since_argv(since_root: Optional[str], zip_path: str) -> List[str]:
+    prev = os.path.join(since_root, tender_name(zip_path)) if since_root else None
+    return ["--since", prev] if prev and os.path.isdir(prev) else []
+
+def run_batch(zips: List[str], out_root: str, runner: str = "digest", workers: Optional[int] = None, extra: Optional[List[str]] = None, since_root: Optional[str] = None) -> str:
+    os.makedirs(out_root, exist_ok=True)
+    jobs = [(runner, z, os.path.join(out_root, tender_name(z)), list(extra or []) + _since_argv(since_root, z)) for z in zips]
+    summary_path = os.path.join(out_root, "batch_summary.jsonl")
+    def write(results):
+        # the tenders' receipts also go, in zip order, into one append-only log at out_root whose
+        # root.txt is re-published after each tender, so a long batch is verifiable at any point.
+        # Lines are copied as they are, so each tender's stretch of the log hashes as its own log does;
+        # a failed tender adds nothing, whatever an earlier run left in its out dir.
+        with open(summary_path, "w", encoding="utf-8", newline="\n") as f, \
+                ReceiptLog(os.path.join(out_root, "receipts.jsonl"), resume=False) as log:
+            for res in results:
+                f.write(json.dumps(res, ensure_ascii=False, sort_keys=True) + "\n")
+                if res["ok"]:
+                    for rp in sorted(glob.glob(os.path.join(glob.escape(res["out"]), "**", "proof", "receipts.jsonl"), recursive=True)):
+                        for line in receipt_lines(rp):
+                            log.append_line(line if line.endswith(b"\n") else line + b"\n")
+                log.checkpoint(os.path.join(out_root, "root.txt"))
+    if workers == 1:
+        write(map(_job, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            write(ex.map(_job, jobs, chunksize=1))
+    return summary_path
+
+def main(argv=None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(prog="pcc-batch", description="Digest a directory or glob of tender zips over a process pool. Unrecognised options are passed to the runner.")
+    ap.add_argument("--tenders", required=True, help="Directory of .zip files or a glob")
+    ap.add_argument("--out", required=True, help="Output root; one <tender>/ tree per zip")
+    ap.add_argument("--runner", default="digest", choices=sorted(RUNNERS))
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count; 1 runs in-process)")
+    ap.add_argument("--since", help="Previous batch --out; each tender re-uses <since>/<tender> when present")
+    args, extra = ap.parse_known_args(argv)
+    zips = find_tender_zips(args.tenders)
+    if not zips:
+        print(json.dumps({"error": f"no tender zips match {args.tenders}"}))
+        return 2
+    summary = run_batch(zips, args.out, runner=args.runner, workers=args.workers, extra=extra, since_root=args.since)
+    failed = 0
+    with open(summary, "r", encoding="utf-8") as f:
+        for line in f:
+            if not json.loads(line)["ok"]:
+                failed += 1
+    print(json.dumps({"summary": summary, "tenders": len(zips), "failed": failed}))
+    return 0 if failed == 0 else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,8 @@
 from __future__ import annotations
 import time, uuid
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Tuple
-from .canonical import canonical_json
-from .merkle import merkle_root
+from typing import List, Dict, Any, Iterable
+from . import merkle
 from .version import VERSION, GIT_SHA, DECISION_SCHEMA_VERSION
 ISO_FMT = "%Y-%m-%dT%H:%M:%SZ"
 @dataclass
@@ -42,20 +41,5 @@ def build_decision(tool: str, asset_id: str, token: str, decision: str, posture:
     if pack: record["pack"] = pack
     if registry_sha: record["registry_sha"] = registry_sha
     return record
-def write_receipts_and_root(receipts_path: str, root_path: str, rows: List[dict]) -> str:
-    def key(r: dict) -> Tuple:
-        return (r.get("asset_id",""), r.get("token",""), r.get("ts",""), r.get("type",""))
-    sorted_rows = sorted(rows, key=key)
-    with open(receipts_path, "wb") as f:
-        for r in sorted_rows:
-            f.write(canonical_json(r))
-    with open(receipts_path, "rb") as f:
-        lines = f.read().splitlines(keepends=True)
-    root = merkle_root(lines)
-    with open(root_path, "w", encoding="utf-8", newline="\n") as f:
-        f.write(f"root: {root}\n")
-        f.write(f"lines: {len(lines)}\n")
-        f.write(f"ts: {utc_now_iso()}\n")
-        f.write(f"tool_version: {VERSION}\n")
-        f.write(f"git_sha: {GIT_SHA}\n")
-    return root
+def write_receipts_and_root(receipts_path: str, root_path: str, rows: Iterable[dict]) -> str:
+    return merkle.write_receipts_and_root(receipts_path, root_path, rows)
@@ -0,0 +1,264 @@
+from __future__ import annotations
+import hashlib, json, os, sys
+from typing import Any, Callable, Dict, List, Optional
+from .version import VERSION
+from .watchdog import DEFAULT_BUDGET_S, ExtractorTimeout, time_budget
+# ingest, bedrock, pickle and tempfile are imported where used, so a runner's build_parser
+# (add_cache_args) stays cheap
+
+DEFAULT_MAX_MB = 512
+MANIFEST_FILE = "members.json"
+EXTRACTS_FILE = "extracts.pkl"
+
+_code_shas: Dict[str, str] = {}
+
+def _fn_id(fn: Callable) -> str:
+    return f"{fn.__module__}.{fn.__qualname__}"
+
+def code_sha(fn: Callable) -> str:
+    """sha256 of the source file defining fn (of its bytecode when there is no file), once per module."""
+    mod = fn.__module__
+    sha = _code_shas.get(mod)
+    if sha is None:
+        path = getattr(sys.modules.get(mod), "__file__", None)
+        try:
+            with open(path, "rb") as f:
+                sha = hashlib.sha256(f.read()).hexdigest()
+        except (OSError, TypeError):
+            code = fn.__code__
+            sha = hashlib.sha256(code.co_code + repr(code.co_consts).encode("utf-8")).hexdigest()
+        _code_shas[mod] = sha
+    return sha
+
+def cache_key(fn: Callable, args) -> str:
+    """Key an extractor call by (member sha256s, extractor and its module's code, pcc VERSION).
+
+    Member arguments contribute their content hash, a whole MemberTable the
+    hash of its (name, sha256) list; any other argument (the src_file labels
+    the runners pass) contributes its repr. Editing an extractor's module
+    changes its keys, so results of the old code are not served.
+    """
+    from .ingest import Member, MemberTable
+    h = hashlib.sha256()
+    h.update(f"{VERSION}\0{_fn_id(fn)}\0{code_sha(fn)}".encode("utf-8"))
+    for a in args:
+        if isinstance(a, Member):
+            part = f"sha256:{a.sha256}"
+        elif isinstance(a, MemberTable):
+            part = "table:" + hashlib.sha256("".join(f"{m.name}\0{m.sha256}\n" for m in a).encode("utf-8")).hexdigest()
+        else:
+            part = repr(a)
+        h.update(b"\0" + part.encode("utf-8"))
+    return h.hexdigest()
+
+def _blank(x):
+    if isinstance(x, tuple):
+        return tuple(_blank(v) for v in x)
+    if isinstance(x, (list, dict, str, bool, int, float)):
+        return type(x)()
+    return None
+
+def empty_result(fn: Callable, args):
+    """What fn returns when it finds nothing: its result on empty inputs, with every value emptied."""
+    from .ingest import Member, MemberTable
+    return _blank(fn(*["" if isinstance(a, Member) else MemberTable([]) if isinstance(a, MemberTable) else a for a in args]))
+
+def _atomic_write(path: str, data: bytes) -> None:
+    import tempfile
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def load_manifest(run_dir: str) -> Dict:
+    try:
+        with open(os.path.join(run_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def load_extracts(run_dir: str) -> Dict[str, bytes]:
+    """Recorded extractor results of a previous run; empty if it has none or another pcc version wrote them."""
+    import pickle
+    if load_manifest(run_dir).get("tool_version") != VERSION:
+        return {}
+    try:
+        with open(os.path.join(run_dir, EXTRACTS_FILE), "rb") as f:
+            return pickle.load(f)
+    except Exception:  # missing, truncated, or not what save_run wrote: nothing to reuse
+        return {}
+
+class ExtractCache:
+    """On-disk, content-addressed cache of extractor results.
+
+    Entries live under ``<cache_dir>/<key[:2]>/<key>.pkl``. A hit refreshes the
+    entry's mtime; when the directory grows past ``max_bytes`` the least
+    recently used entries are evicted. With ``cache_dir=None`` every call runs
+    the extractor directly.
+
+    Every result of a run is also recorded and written next to its outputs by
+    save_run(); ``since`` loads those of a previous run so calls whose member
+    hashes are unchanged are answered without running the extractor.
+
+    Entries and extracts.pkl are pickles, and loading a pickle can run any
+    code it names: cache_dir and since must be directories only trusted
+    users can write to.
+
+    An extractor that runs past ``budget_s`` is abandoned: the call returns
+    an empty result of the same shape, nothing is cached, and the timeout is
+    reported through timeout_receipts()/timeout_checks().
+    """
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_MB << 20, since: Optional[str] = None,
+                 budget_s: Optional[float] = DEFAULT_BUDGET_S):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.reused = 0
+        self._sizes: Optional[Dict[str, int]] = None
+        self.recorded: Dict[str, bytes] = {}
+        self.since = since
+        self.prev: Dict[str, bytes] = load_extracts(since) if since else {}
+        self.budget_s = budget_s
+        self.timeouts: List[Dict[str, Any]] = []
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".pkl")
+
+    def call(self, fn: Callable, *args) -> Any:
+        import pickle
+        from .ingest import Member
+        key = cache_key(fn, args)
+        blob = self.prev.get(key)
+        reused = blob is not None
+        if not reused and self.cache_dir:
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    blob = f.read()
+                os.utime(path)
+            except OSError:
+                pass
+        if blob is not None:
+            # counted once the entry loads; one that does not (corrupt, or naming a class or module
+            # since renamed) is a miss, and a cache file holding it is dropped
+            try:
+                out = pickle.loads(blob)
+            except Exception:
+                if not reused:
+                    self._drop(self._path(key))
+            else:
+                self.recorded[key] = blob
+                if reused:
+                    self.reused += 1
+                else:
+                    self.hits += 1
+                return out
+        self.misses += 1
+        for a in args:
+            # fold each text member once per run; rx reuses it for every pattern the extractor tries
+            if isinstance(a, Member) and a.norm is not None and a.norm.text is a.text:
+                a.norm.folded
+        try:
+            with time_budget(self.budget_s):
+                out = fn(*[a.text if isinstance(a, Member) else a for a in args])
+        except ExtractorTimeout:
+            src = next((a.name for a in args if isinstance(a, Member)), None)
+            self.timeouts.append({"extractor": _fn_id(fn), "source_file": src, "budget_s": self.budget_s})
+            return empty_result(fn, args)
+        # snapshot now: runners stamp and extend the rows they get back
+        blob = pickle.dumps(out, protocol=pickle.HIGHEST_PROTOCOL)
+        self.recorded[key] = blob
+        if self.cache_dir:
+            self._put(self._path(key), blob)
+        return out
+
+    def save_run(self, out_dir: str, members: MemberTable) -> Dict:
+        """Write this run's member manifest and extractor results for a later --since."""
+        import pickle
+        cur = {m.name: m.sha256 for m in members}
+        manifest: Dict[str, Any] = {"tool_version": VERSION, "members": cur}
+        if self.since:
+            prev = load_manifest(self.since).get("members", {})
+            manifest["since"] = {
+                "dir": self.since,
+                "added": sorted(n for n in cur if n not in prev),
+                "changed": sorted(n for n in cur if n in prev and prev[n] != cur[n]),
+                "removed": sorted(n for n in prev if n not in cur),
+                "reused": self.reused, "rerun": self.misses,
+            }
+        os.makedirs(out_dir, exist_ok=True)
+        _atomic_write(os.path.join(out_dir, EXTRACTS_FILE), pickle.dumps(self.recorded, protocol=pickle.HIGHEST_PROTOCOL))
+        _atomic_write(os.path.join(out_dir, MANIFEST_FILE), json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8"))
+        return manifest
+
+    def timeout_receipts(self) -> List[Dict[str, Any]]:
+        return [{"type": "extractor_timeout", **t} for t in self.timeouts]
+
+    def timeout_checks(self) -> List[Check]:
+        from .bedrock import Check
+        return [Check(token="tender:extract:skipped", ok=False, details=f"{t['extractor']} exceeded {t['budget_s']:g}s",
+                      source=t["source_file"]) for t in self.timeouts]
+
+    def _scan(self) -> Dict[str, int]:
+        if self._sizes is None:
+            self._sizes = {}
+            for d, _, files in os.walk(self.cache_dir):
+                for n in files:
+                    if n.endswith(".pkl"):
+                        p = os.path.join(d, n)
+                        self._sizes[p] = os.path.getsize(p)
+        return self._sizes
+
+    def _drop(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        if self._sizes is not None:
+            self._sizes.pop(path, None)
+
+    def _put(self, path: str, blob: bytes) -> None:
+        _atomic_write(path, blob)
+        sizes = self._scan()
+        sizes[path] = os.path.getsize(path)
+        self._evict(keep=path)
+
+    def _evict(self, keep: str) -> None:
+        sizes = self._sizes
+        total = sum(sizes.values())
+        if total <= self.max_bytes:
+            return
+        def mtime(p):
+            try:
+                return os.path.getmtime(p)
+            except OSError:
+                return 0.0
+        for p in sorted(sizes, key=mtime):
+            if total <= self.max_bytes:
+                break
+            if p == keep:
+                continue
+            try:
+                os.remove(p)
+            except OSError:
+                pass
+            total -= sizes.pop(p)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "reused": self.reused}
+
+def add_cache_args(ap) -> None:
+    ap.add_argument("--cache-dir", help="Directory for the content-addressed extraction cache (pickles: trusted writers only)")
+    ap.add_argument("--cache-max-mb", type=int, default=DEFAULT_MAX_MB)
+    ap.add_argument("--since", help="Previous --out of this pack; extractors whose inputs are unchanged are not re-run "
+                                    "(its extracts.pkl is unpickled: trusted dirs only)")
+    ap.add_argument("--extract-budget", type=float, default=DEFAULT_BUDGET_S,
+                    help="Wall-clock seconds per extractor call before it is skipped (0 = unbounded)")
+
+def cache_from_args(args) -> ExtractCache:
+    return ExtractCache(args.cache_dir, max_bytes=args.cache_max_mb << 20, since=getattr(args, "since", None),
+                        budget_s=getattr(args, "extract_budget", DEFAULT_BUDGET_S))
@@ -1,7 +1,53 @@
 from __future__ import annotations
-import json
+import json, math
+from json.encoder import encode_basestring
+from operator import itemgetter
+from typing import Callable, Dict, Optional, Tuple
+
+# the reference form: json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")),
+# with the encoder built once rather than per call
+_generic = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode
+MAX_SHAPES = 1024
+
+def _float(v: float) -> str:
+    return float.__repr__(v) if math.isfinite(v) else _generic(v)
+
+_SCALARS: Dict[type, Callable] = {
+    str: encode_basestring, int: int.__repr__, float: _float,
+    bool: lambda v: "true" if v else "false", type(None): lambda v: "null",
+}
+_shapes: Dict[Tuple, Optional[Tuple[Callable, str]]] = {}
+
+def _shape(keys: Tuple) -> Optional[Tuple[Callable, str]]:
+    # values in canonical key order and the line around them; None sends the row to _generic
+    if not all(type(k) is str for k in keys):
+        return None
+    sk = sorted(keys)
+    tpl = "{" + ",".join(encode_basestring(k).replace("%", "%%") + ":%s" for k in sk) + "}\n"
+    if len(sk) > 1:
+        return itemgetter(*sk), tpl
+    return (lambda d, k=sk[0]: (d[k],)) if sk else (lambda d: ()), tpl
+
 def canonical_json(obj) -> bytes:
-    s = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-    if not s.endswith("\n"):
-        s += "\n"
-    return s.encode("utf-8")
+    """obj as one canonical JSON line: sorted keys, no spaces, UTF-8, newline-terminated.
+
+    Receipts of one type share a key set, so the sorted key order and the line
+    around the values are worked out once per key set (as the row lists its
+    keys) and kept; a row then costs one encode per value and one %-format.
+    Scalars of exact type str, int, float, bool and None are encoded here as
+    json does; anything else, and rows whose keys are not all str, goes
+    through json's own encoder, so the bytes match json.dumps either way.
+    """
+    if type(obj) is dict:
+        keys = tuple(obj)
+        shape = _shapes.get(keys, False)
+        if shape is False:
+            if len(_shapes) >= MAX_SHAPES:  # a flood of one-off key sets; the hot ones come back at once
+                _shapes.clear()
+            shape = _shapes[keys] = _shape(keys)
+        if shape is not None:
+            get, tpl = shape
+            enc = _SCALARS.get
+            return (tpl % tuple([encode_basestring(v) if type(v) is str else (enc(type(v)) or _generic)(v)
+                                 for v in get(obj)])).encode("utf-8")
+    return (_generic(obj) + "\n").encode("utf-8")
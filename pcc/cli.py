@@ -0,0 +1,24 @@
+from __future__ import annotations
+import sys
+from .registry import COMMANDS, resolve
+
+def _usage(out) -> None:
+    out.write("usage: pcc <command> [options]\n\ncommands:\n")
+    w = max(len(c) for c in COMMANDS)
+    for c in sorted(COMMANDS):
+        out.write(f"  {c.ljust(w)}  {COMMANDS[c][2]}\n")
+
+def main(argv=None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        _usage(sys.stdout)
+        return 0
+    cmd = argv[0].replace("_", "-")
+    if cmd not in COMMANDS:
+        sys.stderr.write(f"pcc: unknown command {argv[0]!r}\n")
+        _usage(sys.stderr)
+        return 2
+    return resolve(cmd)(argv[1:])
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+from __future__ import annotations
+import fnmatch, json, os, re, unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+# family -> sections; a pack belongs to a family when it has a member matching
+# each section. Alternatives within a section are separated by "|".
+# Kept in step with "Runner globs" in docs/OPERATOR.md.
+FAMILY_GLOBS: Dict[str, List[str]] = {
+    "ns8406_simple": [
+        "Konkurransegrunnlag*.txt",
+        "*NS 8406*.txt|*NS8406*.txt",
+        "*BESK*NS3420*.txt|*Beskrivelse*.txt",
+        "*MOP*.txt",
+        "*Overvåk*.txt",
+    ],
+    "ssa_v": [
+        "*Konkurransebestemmelser*.txt",
+        "*SSA-V*generell*.txt",
+        "*Bilag*5*SLA*.txt",
+        "*Databehandleravtale*.txt",
+        "*Servicetilgangsavtale*.txt",
+        "*Kundens tekniske plattform*.txt|*Kundens_tekniske_plattform*.txt",
+        "*Kravspesifikasjon*.txt",
+        "*Prisskjema*.txt",
+    ],
+    "multilot_office": [
+        "*Konkurransebestemmelser*kontorrekvisita*.txt|*Konkurransebestemmelser*batterier*.txt",
+        "*Bilag 1* Prisskjema*.txt",
+        "*Bilag 2* Kravspesifikasjon*.txt",
+        "*Bilag 13* Rammeavtale*.txt",
+        "*Bilag 7* Logistikkbetingelser*.txt",
+        "*Bilag 9* Elektronisk samhandlingsavtale*.txt",
+    ],
+    "renhold_facility": [
+        "*Konkurransebestemmelser*Renhold*.txt",
+        "*Bilag 1* Kravspesifikasjon*.txt",
+        "*Bilag 2* Prisskjema*.txt",
+        "*Rammeavtale* Renhold*.txt",
+        "*Bilag 3* AKRIM*.txt",
+        "*Bilag 4* Egenrapportering*.txt",
+    ],
+    "dps": [
+        "*Kvalifikasjonsgrunnlag*Dynamisk*.txt|*Kvalifikasjonsgrunnlag*DPS*.txt|*DPS*kvalifikasjon*.txt",
+        "*SSA-B*generell*.txt",
+        "*SSA-B*bilag*.txt",
+        "*DPA*2020*.txt|*Databehandleravtale*2020*.txt",
+    ],
+    "ns8407_total": [
+        "*Tilbudsinvitasjon*.txt",
+        "*Tilbudsskjema*.txt",
+        "*Avtaledokument*totalentreprise*.txt|IIA3*Avtaledokument*.txt",
+        "*Totalentrepriseboka*.txt|*TEBOK*.txt",
+        "*Funksjonsprogram*.txt",
+        "*SHA-plan*.txt|*SHA_plan*.txt",
+        "*Forretningsrutiner*8407*.txt",
+    ],
+    "hso_byggc": [
+        "*Konkurranseskjema*.txt",
+        "*Avtaledokument*.txt",
+        "*Endringsbestemmelser*.txt",
+        "C21*.txt",
+    ],
+    "hmn_invasive": [
+        "*Konkurransebestemmelser*Invasive*.txt",
+        "*Vedlegg 02*Kravspesifikasjon*.txt",
+        "*Vedlegg 03*Prisskjema*.txt",
+        "*Vedlegg 07*Rammeavtale*.txt",
+    ],
+}
+
+MIN_SCORE = 0.5
+
+def _norm(name: str) -> str:
+    n = unicodedata.normalize("NFC", os.path.basename(name)).casefold()
+    # .pdf members are converted to <stem>.txt before the runners see them
+    return n[:-4] + ".txt" if n.endswith(".pdf") else n
+
+@lru_cache(maxsize=None)
+def _matcher() -> Tuple[re.Pattern, List[Tuple[str, int]]]:
+    """One regex for every glob of every family.
+
+    Each glob sits in its own optional zero-width lookahead, so a single
+    match() against a member name reports every glob it satisfies.
+    """
+    parts, slots = [], []
+    for fam, sections in FAMILY_GLOBS.items():
+        for i, sec in enumerate(sections):
+            for g in sec.split("|"):
+                parts.append(f"(?:(?=({fnmatch.translate(_norm(g))})))?")
+                slots.append((fam, i))
+    return re.compile("".join(parts)), slots
+
+def score_names(names: Iterable[str]) -> List[Dict]:
+    """Score every family against the member names, best first."""
+    rx, slots = _matcher()
+    hits: Dict[str, Dict[int, str]] = {f: {} for f in FAMILY_GLOBS}
+    for name in names:
+        m = rx.match(_norm(name))
+        for k, g in enumerate(m.groups()):
+            if g is not None:
+                fam, sec = slots[k]
+                hits[fam].setdefault(sec, name)
+    out = []
+    for fam, sections in FAMILY_GLOBS.items():
+        h = hits[fam]
+        out.append({"family": fam, "score": round(len(h) / len(sections), 3), "hits": len(h), "sections": len(sections),
+                    "matched": {sections[i]: n for i, n in sorted(h.items())}})
+    out.sort(key=lambda r: (-r["score"], -r["hits"]))
+    return out
+
+def detect(names: Iterable[str], min_score: float = MIN_SCORE) -> List[str]:
+    """Families that cover at least min_score of their sections, best first."""
+    return [r["family"] for r in score_names(names) if r["score"] >= min_score and r["hits"] >= 2]
+
+def zip_names(zip_path: str) -> List[str]:
+    import zipfile
+    with zipfile.ZipFile(zip_path) as zf:
+        return [i.filename for i in zf.infolist() if not i.is_dir()]
+
+def main(argv=None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(prog="pcc-detect", description="Score runner families for a tender zip by member names")
+    ap.add_argument("--tender-zip", required=True)
+    ap.add_argument("--min-score", type=float, default=MIN_SCORE)
+    args = ap.parse_args(argv)
+    names = zip_names(args.tender_zip)
+    scores = score_names(names)
+    print(json.dumps({"tender_zip": args.tender_zip, "families": detect(names, args.min_score), "scores": scores}, ensure_ascii=False))
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
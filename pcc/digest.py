@@ -1,36 +1,11 @@
-import argparse, json, os, zipfile
-from datetime import datetime, timezone
+import argparse, json, os
 from .version import VERSION
-from .bedrock import build_decision, Check
-from .merkle import write_receipts_and_root
-from .service_levels import extract as extract_service_levels
-from .contract_terms import extract as extract_contract_terms
-from .krav_csv import extract_from_zip as extract_krav_csv
-from .itt import extract as extract_itt
-from .price_schema import extract as extract_price_schema
-from .extract_hmn_invasive import extract_itt, extract_prisskjema, extract_ramme
-from .matrix import write_criteria_and_formula_csv, write_submission_checklist_csv, write_variants_csv
-from .underlag_nv_text import extract_constants as extract_nv_text
-from .submission_checklist import extract_from_itt as extract_subm_itt
-from .criteria_and_formula import extract_from_itt as extract_cf_itt
-from .contract_eie_meglerstandard import extract as extract_eie
-from .contract_leie_statsbygg import extract as extract_leie
-from .variants import detect_from_path
-from .formula_detect import scan_zip_for_formula
-from .addenda_diff import scan as scan_addenda
-from .matrix import (
-    write_service_levels_csv,
-    write_contract_terms_csv,
-    write_requirements_matrix_csv,
-    write_evaluation_items_csv,
-    write_price_schema_csv,
-    write_forms_constraints_csv, write_criteria_and_formula_csv, write_submission_checklist_csv, write_variants_csv, write_criteria_and_formula_csv, write_submission_checklist_csv, write_variants_csv, write_criteria_and_formula_csv, write_submission_checklist_csv, write_variants_csv, write_variants_csv, write_addenda_diff_csv,
-)
 
 TOOL = "tender-digest"
 PACK = "tender-core"
 
 def _iso_now():
+    from datetime import datetime, timezone
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 def _asset_id_from(path, kind):
@@ -38,26 +13,113 @@ def _asset_id_from(path, kind):
     name = os.path.splitext(base)[0]
     return f"tender:{kind}/{name}"
 
-def _read_text_from_zip(zf, name):
-    try:
-        return zf.read(name).decode("utf-8", "ignore")
-    except KeyError:
-        return None
-
 def _stamp_rows(rows, ts):
     for r in rows:
         if "ts" not in r:
             r["ts"] = ts
     return rows
 
-def main():
+def build_parser():
+    # pcc.cache, pcc.pdftext and pcc.detect hold the shared options; imported here, and the
+    # rest of the digest in run(), so `pcc digest --help` loads no extraction machinery
+    from .cache import add_cache_args
+    from .detect import FAMILY_GLOBS
+    from .pdftext import add_pdf_args
     p = argparse.ArgumentParser()
     p.add_argument("--tender-zip", required=True)
     p.add_argument("--offer-zip")
     p.add_argument("--out", required=True)
     p.add_argument("--posture", default="advice")
     p.add_argument("--registry-sha")
-    args = p.parse_args()
+    p.add_argument("--family", default="auto", choices=["auto", "generic"] + sorted(FAMILY_GLOBS),
+                   help="Runner family; auto picks by member names, generic skips dispatch")
+    add_cache_args(p)
+    add_pdf_args(p)
+    return p
+
+def _family_argv(args, out, fam):
+    argv = ["--tender-zip", args.tender_zip, "--out", out, "--posture", args.posture, "--cache-max-mb", str(args.cache_max_mb),
+            "--pdf-converter", args.pdf_converter, "--extract-budget", str(args.extract_budget)]
+    if args.pdf_workers:
+        argv += ["--pdf-workers", str(args.pdf_workers)]
+    if args.cache_dir:
+        argv += ["--cache-dir", args.cache_dir]
+    if args.since:
+        # a multi-family run keeps each family's state under <since>/<family>
+        nested = os.path.join(args.since, fam)
+        argv += ["--since", nested if os.path.isdir(nested) else args.since]
+    return argv
+
+def dispatch(args):
+    """Hand the pack to its runner family, or return None for the generic digest.
+
+    One family writes into --out as if it had been run directly; several each
+    get --out/<family>/ and the returned record carries one check per family.
+    """
+    from .bedrock import build_decision, Check
+    from .detect import detect, score_names, zip_names
+    from .registry import load_runner
+    if args.family == "generic":
+        return None
+    if args.family == "auto":
+        names = zip_names(args.tender_zip)
+        fams = detect(names)
+        os.makedirs(args.out, exist_ok=True)
+        with open(os.path.join(args.out, "detect.json"), "w", encoding="utf-8", newline="\n") as f:
+            json.dump({"families": fams, "scores": score_names(names)}, f, ensure_ascii=False, indent=2)
+    else:
+        fams = [args.family]
+    if not fams:
+        return None
+    if len(fams) == 1:
+        mod = load_runner(fams[0])
+        return mod.run(mod.build_parser().parse_args(_family_argv(args, args.out, fams[0])))
+    checks = []; blocked = None
+    for fam in fams:
+        mod = load_runner(fam)
+        out = os.path.join(args.out, fam)
+        rec = mod.run(mod.build_parser().parse_args(_family_argv(args, out, fam)))
+        ok = rec["decision"] == "allow"
+        if not ok and blocked is None:
+            blocked = rec["token"]
+        checks.append(Check(token=f"tender:family:{fam}", ok=ok, details=f"out={out}; token={rec['token']}", source=None))
+        checks.extend(Check(**c) for c in rec["checks"] if c["token"] == "tender:extract:skipped")
+    return build_decision(TOOL, _asset_id_from(args.tender_zip, "pack"), token=blocked or "ok", decision="block" if blocked else "allow",
+                          posture=args.posture, checks=checks, pack=PACK, registry_sha=args.registry_sha)
+
+def run(args):
+    record = dispatch(args)
+    if record is not None:
+        return record
+    from .patterns import rx
+    rx.reset()
+    # extractors are imported here so --help and the pcc dispatcher stay cheap
+    from .bedrock import build_decision, Check
+    from .merkle import write_receipts_and_root
+    from .service_levels import extract as extract_service_levels
+    from .contract_terms import extract as extract_contract_terms
+    from .krav_csv import extract_from_members as extract_krav_csv
+    from .itt import extract as extract_itt
+    from .price_schema import extract_from_members as extract_price_schema
+    from .extract_hmn_invasive import extract_itt as extract_hmn_itt, extract_price as extract_prisskjema, extract_contract as extract_ramme
+    from .underlag_nv_text import extract_constants as extract_nv_text
+    from .submission_checklist import extract_from_itt as extract_subm_itt
+    from .criteria_and_formula import extract_from_itt as extract_cf_itt
+    from .contract_eie_meglerstandard import extract as extract_eie
+    from .contract_leie_statsbygg import extract as extract_leie
+    from .pdftext import members_from_args
+    from .cache import cache_from_args
+    from .variants import detect_from_members
+    from .formula_detect import scan_members_for_formula
+    from .addenda_diff import scan_members as scan_addenda
+    from .matrix import (
+        write_service_levels_csv,
+        write_contract_terms_csv,
+        write_requirements_matrix_csv,
+        write_evaluation_items_csv,
+        write_price_schema_csv,
+        write_forms_constraints_csv, write_criteria_and_formula_csv, write_submission_checklist_csv, write_variants_csv, write_addenda_diff_csv,
+    )
 
     os.makedirs(args.out, exist_ok=True)
     proof_dir = os.path.join(args.out, "proof")
@@ -66,75 +128,70 @@ def main():
     os.makedirs(matrix_dir, exist_ok=True)
 
     now_ts = _iso_now()
-    tender_members = []
-    with zipfile.ZipFile(args.tender_zip, "r") as z:
-        # hmn_invasive_call
-        itt_txt=None; pris_txt=None; ramme_txt=None
-        for zi in z.infolist():
-            name=zi.filename.lower()
-            if name.endswith('.txt') and ('konkurransebestemmelser' in name or 'itt' in name):
-                itt_txt = z.read(zi.filename).decode('utf-8','ignore')
-            if name.endswith('.txt') and 'prisskjema' in name:
-                pris_txt = z.read(zi.filename).decode('utf-8','ignore')
-            if name.endswith('.txt') and 'rammeavtale' in name:
-                ramme_txt = z.read(zi.filename).decode('utf-8','ignore')
-
-        if itt_txt:
-            fc, subm, cf, rc = extract_itt(itt_txt, 'Konkurransebestemmelser.pdf')
-            if fc: write_forms_constraints_csv(matrix_dir, fc)
-            if subm: write_submission_checklist_csv(matrix_dir, subm)
-            if cf: write_criteria_and_formula_csv(matrix_dir, cf)
-            rows.extend(_stamp_rows(rc, now_ts))
-        if pris_txt:
-            consts, rc2 = extract_prisskjema(pris_txt, 'Vedlegg 03 Prisskjema.pdf')
-            if consts:
-                from .matrix import write_price_schema_csv
-                write_price_schema_csv(matrix_dir, 'Prisskjema', [], consts)
-            rows.extend(_stamp_rows(rc2, now_ts))
-        if ramme_txt:
-            terms, rc3 = extract_ramme(ramme_txt, 'Vedlegg 07 Rammeavtale.docx')
-            if terms:
-                from .matrix import write_contract_terms_csv
-                write_contract_terms_csv(matrix_dir, terms)
-            rows.extend(_stamp_rows(rc3, now_ts))
-    
-        cf_rows=[]
-        cf_total=None
-        cf_model=False
-        cf_scoring=None
-        nv_consts={}
-        nv_written=False
-        nv_written=False
-        nv_receipts=[]
-        itt_text=None
-        for zi in z.infolist():
-            if zi.is_dir():
-                continue
-            n=zi.filename.lower()
-            if n.endswith('itt.txt'):
-                itt_text=z.read(zi.filename).decode('utf-8','ignore')
-            if n.endswith('.txt') and ('underlag' in n or 'nåverdi' in n or 'npv' in n or 'prisskjema' in n):
-                t=z.read(zi.filename).decode('utf-8','ignore')
-                c, rc = extract_nv_text(t)
-                if c:
-                    nv_consts.update(c)
-                    nv_receipts.extend(rc)
-        if itt_text:
-            cf_rows, cf_total, cf_model, cf_scoring, cf_receipts = extract_cf_itt(itt_text)
-
-        for zi in z.infolist():
-            if not zi.is_dir():
-                tender_members.append({"name": zi.filename, "size": zi.file_size})
-        bilag10_txt = _read_text_from_zip(z, "Bilag10.txt")
-        ramme_txt = _read_text_from_zip(z, "Rammeavtale.txt")
-        itt_txt    = _read_text_from_zip(z, "ITT.txt")
-        req_rows, eval_rows, krav_receipts = extract_krav_csv(z, _asset_id_from(args.tender_zip,"pack"))
-        price_entries, price_receipts = extract_price_schema(z, _asset_id_from(args.tender_zip,"pack"))
-
+    asset_id = _asset_id_from(args.tender_zip, "pack")
     rows = []
-    formula_ok=False
-    formula_receipts=[]
     checks = []
+    members = members_from_args(args)
+    xc = cache_from_args(args)
+    tender_members = [{"name": m.name, "size": m.size} for m in members if m.source is None]
+
+    # hmn_invasive_call
+    hmn_itt=None; pris=None; hmn_ramme=None
+    for m in members.with_ext(".txt"):
+        name=m.lname
+        if 'konkurransebestemmelser' in name or 'itt' in name:
+            hmn_itt = m
+        if 'prisskjema' in name:
+            pris = m
+        if 'rammeavtale' in name:
+            hmn_ramme = m
+
+    if hmn_itt and hmn_itt.text:
+        fc, subm, cf, rc = xc.call(extract_hmn_itt, hmn_itt, 'Konkurransebestemmelser.pdf')
+        if fc: write_forms_constraints_csv(matrix_dir, fc)
+        if subm: write_submission_checklist_csv(matrix_dir, subm)
+        if cf: write_criteria_and_formula_csv(matrix_dir, cf)
+        rows.extend(_stamp_rows(rc, now_ts))
+    if pris and pris.text:
+        consts, rc2 = xc.call(extract_prisskjema, pris, 'Vedlegg 03 Prisskjema.pdf')
+        if consts:
+            write_price_schema_csv(matrix_dir, 'Prisskjema', [], consts)
+        rows.extend(_stamp_rows(rc2, now_ts))
+    if hmn_ramme and hmn_ramme.text:
+        terms, rc3 = xc.call(extract_ramme, hmn_ramme, 'Vedlegg 07 Rammeavtale.docx')
+        if terms:
+            write_contract_terms_csv(matrix_dir, terms)
+        rows.extend(_stamp_rows(rc3, now_ts))
+
+    cf_rows=[]
+    cf_total=None
+    cf_model=False
+    cf_scoring=None
+    nv_consts={}
+    nv_written=False
+    nv_receipts=[]
+    itt_text=None
+    for m in members.with_ext(".txt"):
+        n=m.lname
+        if n.endswith('itt.txt'):
+            itt_text=members.get(m.name)
+        if 'underlag' in n or 'nåverdi' in n or 'npv' in n or 'prisskjema' in n:
+            c, rc = xc.call(extract_nv_text, m)
+            if c:
+                nv_consts.update(c)
+                nv_receipts.extend(rc)
+    if itt_text and itt_text.text:
+        cf_rows, cf_total, cf_model, cf_scoring, cf_receipts = xc.call(extract_cf_itt, itt_text)
+
+    bilag10 = members.get("Bilag10.txt")
+    ramme = members.get("Rammeavtale.txt")
+    itt = members.get("ITT.txt")
+    req_rows, eval_rows, krav_receipts = xc.call(extract_krav_csv, members, asset_id)
+    price_entries, price_receipts = xc.call(extract_price_schema, members, asset_id)
+    vrows = xc.call(detect_from_members, members)
+    formula_ok, formula_receipts = xc.call(scan_members_for_formula, members, asset_id)
+    addenda_rows = xc.call(scan_addenda, members)
+
     rows.append({"type":"summary","asset_id":_asset_id_from(args.tender_zip,"pack"),
                  "docs_total":len(tender_members),"bytes_total":sum(m["size"] for m in tender_members),"ts":now_ts})
     checks.append(Check(token="tender:pack:parse_ok", ok=True,
@@ -147,15 +204,22 @@ def main():
         checks.append(Check(token="tender:krav:matrices_built", ok=True,
                             details=f"req={len(req_rows)}; eval={len(eval_rows)}", source=None))
 
-    if itt_txt:
-        itt_rows, itt_checks = extract_itt(itt_txt, _asset_id_from(args.tender_zip,"pack"))
+    if formula_ok:
+        rows.extend(_stamp_rows(formula_receipts, now_ts))
+        checks.append(Check(token="tender:criteria:price_model_present", ok=True, details=formula_receipts[0]["source_file"], source=None))
+
+    if addenda_rows:
+        write_addenda_diff_csv(matrix_dir, addenda_rows)
+
+    if itt and itt.text:
+        itt_rows, itt_checks = xc.call(extract_itt, itt, _asset_id_from(args.tender_zip,"pack"))
         fc_rows = [ r for r in itt_rows if r.get("type") in ("submission","forms") ]
         if fc_rows:
             write_forms_constraints_csv(matrix_dir, fc_rows)
         rows.extend(_stamp_rows(itt_rows, now_ts))
-        if itt_text:
-            cf_rows, cf_total, cf_model, cf_scoring, cf_receipts = extract_cf_itt(itt_text)
-            subm_rows = extract_subm_itt(itt_text)
+        if itt_text and itt_text.text:
+            cf_rows, cf_total, cf_model, cf_scoring, cf_receipts = xc.call(extract_cf_itt, itt_text)
+            subm_rows = xc.call(extract_subm_itt, itt_text)
             if subm_rows:
                 write_submission_checklist_csv(matrix_dir, subm_rows)
                 rows.append({'type':'submission_manifest','asset_id':_asset_id_from(args.tender_zip,'pack'),'count':len(subm_rows),'ts':now_ts})
@@ -167,10 +231,7 @@ def main():
                 r['model_anchor']='Prisskjema'
             write_criteria_and_formula_csv(matrix_dir, cf_rows)
             rows.extend(_stamp_rows(cf_receipts, now_ts))
-        if nv_consts:
-            from .matrix import write_price_schema_csv
         if nv_consts and not nv_written:
-            from .matrix import write_price_schema_csv
             write_price_schema_csv(matrix_dir, 'UnderlagNV_text', [], nv_consts)
             rows.extend(_stamp_rows(nv_receipts, now_ts))
             nv_written=True
@@ -192,28 +253,36 @@ def main():
             write_price_schema_csv(matrix_dir, sheet, header, constants)
         rows.extend(_stamp_rows(price_receipts, now_ts))
 
-    if bilag10_txt:
-        features, svc_receipts = extract_service_levels(bilag10_txt, _asset_id_from(args.tender_zip,"pack"))
+    if bilag10 and bilag10.text:
+        features, svc_receipts = xc.call(extract_service_levels, bilag10, _asset_id_from(args.tender_zip,"pack"))
         rows.extend(_stamp_rows(svc_receipts, now_ts))
         write_service_levels_csv(matrix_dir, features)
         checks.append(Check(token="tender:service:levels_matrix_built", ok=len(features)>0,
                             details=f"features={len(features)}", source=None))
 
-    if ramme_txt:
-        terms, ct_receipts = extract_contract_terms(ramme_txt, _asset_id_from(args.tender_zip,"pack"))
+    if ramme and ramme.text:
+        terms, ct_receipts = xc.call(extract_contract_terms, ramme, _asset_id_from(args.tender_zip,"pack"))
         rows.extend(_stamp_rows(ct_receipts, now_ts))
         write_contract_terms_csv(matrix_dir, terms)
         checks.append(Check(token="tender:contract:terms_extracted", ok=len(terms)>0,
                             details=f"keys={len(terms)}", source=None))
 
+    rows.extend(_stamp_rows(xc.timeout_receipts(), now_ts))
+    checks.extend(xc.timeout_checks())
     terms = {}
     receipts_path = os.path.join(proof_dir, "receipts.jsonl")
     root_path = os.path.join(proof_dir, "root.txt")
     write_receipts_and_root(receipts_path, root_path, rows)
+    xc.save_run(args.out, members)
+    rx.dump(os.path.join(args.out, "pattern_stats.json"))
 
-    asset_id = _asset_id_from(args.tender_zip, "pack")
     record = build_decision(TOOL, asset_id, token="ok", decision="allow", posture=args.posture,
                             checks=checks, pack=PACK, registry_sha=args.registry_sha)
+    return record
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    record = run(args)
     print(json.dumps(record, ensure_ascii=False))
     print(record["reason"])
     return record["exit_code"]
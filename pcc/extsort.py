@@ -0,0 +1,71 @@
+from __future__ import annotations
+import heapq, itertools, pickle, tempfile
+from typing import Any, Callable, Iterator, Optional
+
+MEM_BYTES = 64 << 20
+BATCH = 1024  # items per pickle record in a run file
+
+class ExternalSort:
+    """Items sorted by key in about mem_bytes of memory, however many are added.
+
+    Past mem_bytes the buffer is sorted and spilled to a temp file as a run;
+    iterating k-way merges the runs back. Like sorted() the sort is stable:
+    equal keys come back in the order they were added. Input that arrives in
+    order is neither sorted nor merged, only read back run after run. Callers
+    pass each item's size, since only they know what it holds.
+    """
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None, mem_bytes: int = MEM_BYTES, tmp_dir: Optional[str] = None):
+        self.key, self.mem_bytes, self.tmp_dir = key, mem_bytes, tmp_dir
+        self.ordered, self._last = True, None
+        self._buf, self._used, self._runs = [], 0, []
+
+    @property
+    def spilled(self) -> int:
+        return len(self._runs)
+
+    def add(self, item, size: int) -> None:
+        k = item if self.key is None else self.key(item)
+        if self._last is not None and k < self._last[0]:
+            self.ordered = False
+        self._last = (k,)
+        self._buf.append(item)
+        self._used += size
+        if self._used >= self.mem_bytes:
+            self._spill()
+
+    def _sort(self) -> None:
+        # once out of order everything buffered is sorted; before that it already is
+        if not self.ordered:
+            self._buf.sort(key=self.key)
+
+    def _spill(self) -> None:
+        self._sort()
+        f = tempfile.TemporaryFile(dir=self.tmp_dir)
+        for i in range(0, len(self._buf), BATCH):
+            pickle.dump(self._buf[i:i + BATCH], f, pickle.HIGHEST_PROTOCOL)
+        f.seek(0)
+        self._runs.append(f)
+        self._buf, self._used = [], 0
+
+    @staticmethod
+    def _read(f) -> Iterator:
+        while True:
+            try:
+                yield from pickle.load(f)
+            except EOFError:
+                return
+
+    def __iter__(self) -> Iterator:
+        if not self._runs:
+            self._sort()
+            yield from self._buf
+            return
+        if self._buf:
+            self._spill()
+        runs = [self._read(f) for f in self._runs]
+        try:
+            # heapq.merge breaks ties by run, and runs are in arrival order, so the merge stays stable
+            yield from itertools.chain(*runs) if self.ordered else heapq.merge(*runs, key=self.key)
+        finally:
+            for f in self._runs:
+                f.close()
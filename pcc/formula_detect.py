@@ -1,33 +1,56 @@
 import re
+from .ingest import MemberTable
+from .patterns import rx
+from .proximity import terms
+# the line separators of str.splitlines()
+_SEPS='\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029'
+_LINE_END=re.compile('[%s]' % _SEPS)
+# r1..r3 as proximity terms, for the cross-line proximity pass
+_LOWEST=("laveste pris","laveste kostnad","laveste total pris","laveste total kostnad","laveste totalpris","laveste totalkostnad",
+         "lavestepris","lavestekostnad","lowest price","lowest cost","lowest total price","lowest total cost","lowestprice","lowestcost")
+_POINTS=("poeng","score","points")
+_PROPORTIONAL=("propor","forholdsmessig")
 def detect_formula_in_text(text):
     r1=r'(laveste\s*(total)?\s*(pris|kostnad)|lowest\s*(total\s*)?(price|cost))'
     r2=r'(poeng|score|points)'
     r3=r'(proporsjon|propor|proportional|forholdsmessig)'
     win=150
-    for line in text.splitlines():
-        s=line.strip()
-        if re.search(r1,s,re.I) and re.search(r2,s,re.I) and re.search(r3,s,re.I):
+    # one pass for r1 over the whole text; only lines holding an r1 hit are tried further
+    hits=[m.span() for m in rx.finditer(r1,text,re.I)]
+    if not hits:
+        return False,""
+    lo=hi=-1
+    for a,b in hits:
+        if a<=hi:
+            continue  # line already tried
+        for m in _LINE_END.finditer(text,max(lo,hi,0),a):
+            lo=m.end()
+        lo=max(lo,0)
+        m=_LINE_END.search(text,a)
+        hi=m.start() if m else len(text)
+        if b>hi:
+            continue
+        s=text[lo:hi].strip()
+        if rx.search(r2,s,re.I) and rx.search(r3,s,re.I):
             return True,s
-    text2=re.sub(r'\s+',' ',text)
-    for m in re.finditer(r'.{1,%d}'%win,text2,re.S):
-        s=m.group(0)
-        if re.search(r1,s,re.I) and re.search(r2,s,re.I) and re.search(r3,s,re.I):
-            return True,s.strip()
+    # the three terms may sit on different lines: any span of win chars holding all three,
+    # whitespace runs counted as one char as in the collapsed text the window was meant for
+    for a,b in terms(text).near((_LOWEST,_POINTS,_PROPORTIONAL),win,collapse_ws=True):
+        return True," ".join(text[a:b].split())
     return False,""
 def scan_zip_for_formula(zf, asset_id):
+    return scan_members_for_formula(MemberTable.from_zipfile(zf), asset_id)
+def scan_members_for_formula(members, asset_id):
     receipts=[]
     found=False
     snippet=""
     src_file=""
-    for zi in zf.infolist():
-        if zi.is_dir(): continue
-        if not zi.filename.lower().endswith(".txt"): continue
-        t=zf.read(zi.filename).decode("utf-8","ignore")
-        ok,snip=detect_formula_in_text(t)
+    for m in members.with_ext(".txt"):
+        ok,snip=detect_formula_in_text(m.text)
         if ok:
             found=True
             snippet=snip
-            src_file=zi.filename
+            src_file=m.name
             break
     if found:
         receipts.append({"type":"price_formula","asset_id":asset_id,"pattern":"proportional_lowest_max=10","source_file":src_file,"source_snippet":snippet})
@@ -1,9 +1,35 @@
 from __future__ import annotations
 import os, zipfile, hashlib
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 ALLOWED_EXT = {".pdf", ".docx", ".txt", ".csv", ".xlsx"}
+TEXT_EXT = {".txt", ".csv"}
+CHUNK_SIZE = 1 << 20
+PREVIEW_BYTES = 2000
 def sha256_hex(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
-def iter_zip_members(zip_path: str):
+def hash_member(zf: zipfile.ZipFile, info: zipfile.ZipInfo, keep: int | None = None, chunk_size: int = CHUNK_SIZE) -> Tuple[str, bytes]:
+    """Stream one member through sha256 in fixed-size chunks.
+
+    Returns the hex digest and the first ``keep`` bytes (all bytes when
+    ``keep`` is None). Only the retained prefix and the hash state are held.
+    """
+    h = hashlib.sha256()
+    kept = []
+    left = keep
+    with zf.open(info, "r") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            h.update(chunk)
+            if left is None:
+                kept.append(chunk)
+            elif left > 0:
+                kept.append(chunk[:left])
+                left -= len(kept[-1])
+    return h.hexdigest(), b"".join(kept)
+def iter_zip_members(zip_path: str, stream: bool = True, chunk_size: int = CHUNK_SIZE):
     out = []
     with zipfile.ZipFile(zip_path, "r") as z:
         for info in z.infolist():
@@ -11,14 +37,101 @@ def iter_zip_members(zip_path: str):
                 continue
             name = info.filename
             ext = os.path.splitext(name)[1].lower()
-            data = z.read(info)
+            if stream:
+                sha, head = hash_member(z, info, keep=PREVIEW_BYTES, chunk_size=chunk_size)
+            else:
+                data = z.read(info)
+                sha, head = sha256_hex(data), data[:PREVIEW_BYTES]
             out.append({
                 "name": name,
                 "ext": ext,
                 "size": info.file_size,
-                "sha256": sha256_hex(data),
+                "sha256": sha,
                 "allowed": ext in ALLOWED_EXT,
                 "is_text": ext in {".txt", ".csv"},
-                "preview": data[:2000].decode("utf-8", errors="ignore") if ext in {".txt", ".csv"} else ""
+                "preview": head.decode("utf-8", errors="ignore") if ext in {".txt", ".csv"} else ""
             })
     return out
+
+@dataclass
+class Member:
+    name: str
+    ext: str
+    size: int
+    sha256: str
+    data: Optional[bytes] = None
+    _text: Optional[str] = field(default=None, repr=False)
+    _norm: Optional["NormText"] = field(default=None, repr=False, compare=False)
+    source: Optional[str] = None  # member this one was derived from (e.g. the .pdf of a converted .txt)
+    @property
+    def is_text(self) -> bool:
+        return self.ext in TEXT_EXT
+    @property
+    def lname(self) -> str:
+        return self.name.lower()
+    @property
+    def text(self) -> Optional[str]:
+        if self._text is None and self.data is not None:
+            self._text = self.data.decode("utf-8", "ignore")
+        return self._text
+    @property
+    def norm(self) -> Optional["NormText"]:
+        """Normalized view of text (normalize_text rules), its casefolded form and raw offsets; built once."""
+        if self._norm is None and self.text is not None:
+            from .normtext import NormText
+            self._norm = NormText(self.text)
+        return self._norm
+
+class MemberTable:
+    """Every file member of a tender zip, decompressed once.
+
+    Text members (.txt/.csv) keep their bytes and decode on first use; other
+    members are streamed through the hash and only keep name, size and sha256.
+    Lookups by name follow ZipFile.read semantics: for duplicate names the
+    last entry wins.
+    """
+    def __init__(self, members: Iterable[Member]):
+        self.members: List[Member] = list(members)
+        self.by_name: Dict[str, Member] = {m.name: m for m in self.members}
+    @classmethod
+    def from_zipfile(cls, zf: zipfile.ZipFile) -> "MemberTable":
+        out = []
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            name = info.filename
+            ext = os.path.splitext(name)[1].lower()
+            sha, data = hash_member(zf, info, keep=None if ext in TEXT_EXT else 0)
+            out.append(Member(name=name, ext=ext, size=info.file_size, sha256=sha,
+                              data=data if ext in TEXT_EXT else None))
+        return cls(out)
+    @classmethod
+    def from_zip(cls, zip_path: str) -> "MemberTable":
+        with zipfile.ZipFile(zip_path, "r") as z:
+            return cls.from_zipfile(z)
+    def __iter__(self) -> Iterator[Member]:
+        return iter(self.members)
+    def __len__(self) -> int:
+        return len(self.members)
+    def get(self, name: str) -> Optional[Member]:
+        return self.by_name.get(name)
+    def text(self, name: str) -> Optional[str]:
+        m = self.by_name.get(name)
+        return m.text if m is not None else None
+    def first(self, names: Iterable[str]) -> Tuple[Optional[str], Optional[str]]:
+        for n in names:
+            m = self.by_name.get(n)
+            if m is not None and m.data is not None:
+                return m.text, n
+        return None, None
+    def find(self, names: Iterable[str]) -> Optional[Member]:
+        for n in names:
+            m = self.by_name.get(n)
+            if m is not None and m.data is not None:
+                return m
+        return None
+    def with_ext(self, *exts: str) -> List[Member]:
+        return [m for m in self.members if m.ext in exts]
+    def add(self, m: Member) -> None:
+        self.members.append(m)
+        self.by_name[m.name] = m
@@ -1,4 +1,6 @@
-import csv, io, re, hashlib
+import csv, io
+from .ingest import MemberTable
+from .patterns import rx
 def _norm(s): return (s or "").strip()
 def _prompt_kind(text):
     t=text.lower(); kinds=[]
@@ -16,22 +18,18 @@ def _criterion(val):
     if "leverandør" in l or "leverandoer" in l or "leverandortjenester" in l: return "Leverandørtjenester"
     return v
 def _value_hint(s):
-    m=re.search(r'(\d+)\s*(måneder|måned|år|stk|v|kv)', s.lower())
+    m=rx.search(r'(\d+)\s*(måneder|måned|år|stk|v|kv)', s.lower())
     if m: return m.group(0)
-    m2=re.search(r'230v|110v|24\s*måneder|10\s*år', s.lower())
+    m2=rx.search(r'230v|110v|24\s*måneder|10\s*år', s.lower())
     if m2: return m2.group(0)
     return ""
-def _read_csv_from_zip(zf, name):
-    with zf.open(name, "r") as f: data=f.read()
-    text=data.decode("utf-8","ignore")
-    return text, list(csv.reader(io.StringIO(text))), hashlib.sha256(data).hexdigest()
 def extract_from_zip(zf, asset_id):
+    return extract_from_members(MemberTable.from_zipfile(zf), asset_id)
+def extract_from_members(members, asset_id):
     req_rows=[]; eval_rows=[]; receipts=[]
-    for zi in zf.infolist():
-        if zi.is_dir(): continue
-        if not zi.filename.lower().endswith(".csv"): continue
-        if "krav" not in zi.filename.lower(): continue
-        text, rows, sheet_hash = _read_csv_from_zip(zf, zi.filename)
+    for m in members.with_ext(".csv"):
+        if "krav" not in m.lname: continue
+        text=m.text; rows=list(csv.reader(io.StringIO(text))); sheet_hash=m.sha256
         if not rows: continue
         header=[h.strip() for h in rows[0]]
         cols={h:i for i,h in enumerate(header)}
@@ -50,13 +48,13 @@ def extract_from_zip(zf, asset_id):
                 continue
             if _is_req(typ):
                 kind="mandatory_info" if typ.replace(" ","").lower().startswith("m(") else "mandatory"
-                row={"req_id":kravnr or "","section":section,"kind":kind,"prompt_kind":_prompt_kind(krav),"value_hint":_value_hint(krav),"krav_text":krav,"source_file":zi.filename,"source_sheet":zi.filename,"source_row":i}
+                row={"req_id":kravnr or "","section":section,"kind":kind,"prompt_kind":_prompt_kind(krav),"value_hint":_value_hint(krav),"krav_text":krav,"source_file":m.name,"source_sheet":m.name,"source_row":i}
                 req_rows.append(row)
-                receipts.append({"type":"krav_req","asset_id":asset_id,"req_id":kravnr or "","section":section,"kind":kind,"prompt_kind":row["prompt_kind"],"sheet_hash":sheet_hash,"snippet":krav[:120],"file":zi.filename,"row":i})
+                receipts.append({"type":"krav_req","asset_id":asset_id,"req_id":kravnr or "","section":section,"kind":kind,"prompt_kind":row["prompt_kind"],"sheet_hash":sheet_hash,"snippet":krav[:120],"file":m.name,"row":i})
             elif _is_eval(typ):
                 crit=_criterion(r[cols["Tildelingskriterium"]]) if has_crit and cols["Tildelingskriterium"]<len(r) else ""
-                row={"eval_id":kravnr or "","section":section,"priority_rank":_priority(typ),"criterion":crit,"prompt_kind":_prompt_kind(krav),"krav_text":krav,"source_file":zi.filename,"source_sheet":zi.filename,"source_row":i}
+                row={"eval_id":kravnr or "","section":section,"priority_rank":_priority(typ),"criterion":crit,"prompt_kind":_prompt_kind(krav),"krav_text":krav,"source_file":m.name,"source_sheet":m.name,"source_row":i}
                 eval_rows.append(row)
-                receipts.append({"type":"krav_eval","asset_id":asset_id,"eval_id":kravnr or "","section":section,"priority_rank":row["priority_rank"],"criterion":crit,"sheet_hash":sheet_hash,"snippet":krav[:120],"file":zi.filename,"row":i})
+                receipts.append({"type":"krav_eval","asset_id":asset_id,"eval_id":kravnr or "","section":section,"priority_rank":row["priority_rank"],"criterion":crit,"sheet_hash":sheet_hash,"snippet":krav[:120],"file":m.name,"row":i})
     receipts.append({"type":"krav_summary","asset_id":asset_id,"req_count":len(req_rows),"eval_count":len(eval_rows)})
     return req_rows, eval_rows, receipts
@@ -0,0 +1,110 @@
+from __future__ import annotations
+import hashlib, io, json, os
+from typing import Dict, List, Optional, Tuple
+from .canonical import canonical_json
+
+MANIFEST_FORMAT = "pcc-manifest-v1"
+COVERED = ("matrix",)
+
+class _Digest:
+    __slots__ = ("sha", "size")
+    def __init__(self):
+        self.sha, self.size = hashlib.sha256(), 0
+    def update(self, b) -> None:
+        self.sha.update(b); self.size += len(b)
+
+class _Tee(io.RawIOBase):
+    """Raw file whose bytes are hashed as they are flushed to it."""
+    def __init__(self, raw: io.FileIO, digest: _Digest):
+        self._raw, self._digest = raw, digest
+    def writable(self) -> bool:
+        return True
+    def write(self, b) -> int:
+        n = self._raw.write(b)
+        self._digest.update(memoryview(b)[:n])
+        return n
+    def fileno(self) -> int:
+        return self._raw.fileno()
+    def close(self) -> None:
+        if not self.closed:
+            self._raw.close()
+        super().close()
+
+def _hash_file(path: str, d: _Digest) -> _Digest:
+    with open(path, "rb") as f:
+        for b in iter(lambda: f.read(1 << 20), b""):
+            d.update(b)
+    return d
+
+class FileHashes:
+    """sha256 and size of the run's output files, taken from the bytes as they are written.
+
+    Writers open files through files.open() instead of open(); the run's
+    manifest then costs no read of what was just written. A file appended to
+    keeps its running digest, and a rewrite starts a new one.
+    """
+    def __init__(self):
+        self._files: Dict[str, _Digest] = {}
+
+    def open(self, path: str, mode: str = "w", encoding: Optional[str] = None, newline: Optional[str] = None):
+        """open() for "w", "a", "wb" and "ab"."""
+        key = os.path.abspath(path)
+        append = mode.startswith("a")
+        d = self._files.get(key) if append else None
+        if d is None:
+            # appending to a file this process did not write: hash what is there once
+            d = _hash_file(path, _Digest()) if append and os.path.exists(path) else _Digest()
+            self._files[key] = d
+        f = io.BufferedWriter(_Tee(io.FileIO(path, "a" if append else "w"), d))
+        if "b" in mode:
+            return f
+        return io.TextIOWrapper(f, encoding=encoding or "locale", newline=newline)
+
+    def digest(self, path: str) -> Tuple[str, int]:
+        d = self._files.get(os.path.abspath(path)) or _hash_file(path, _Digest())
+        return d.sha.hexdigest(), d.size
+
+    def forget(self, top: str) -> None:
+        top = os.path.join(os.path.abspath(top), "")
+        for k in [k for k in self._files if k.startswith(top)]:
+            del self._files[k]
+
+files = FileHashes()
+
+def build_manifest(out_dir: str, extra: List[str] = ()) -> dict:
+    """Digests of every file under out_dir/matrix plus extra, paths relative to out_dir.
+
+    Files written through files.open() are not read again; anything else found
+    there (left by an earlier run into the same --out) is hashed from disk.
+    """
+    paths = list(extra)
+    for sub in COVERED:
+        for dirpath, _, names in os.walk(os.path.join(out_dir, sub)):
+            paths.extend(os.path.join(dirpath, n) for n in names)
+    entries = []
+    for p in paths:
+        sha, size = files.digest(p)
+        entries.append({"path": os.path.relpath(p, out_dir).replace(os.sep, "/"), "sha256": sha, "bytes": size})
+    entries.sort(key=lambda e: e["path"])
+    return {"format": MANIFEST_FORMAT, "files": entries}
+
+def write_manifest(out_dir: str, manifest_path: str, extra: List[str] = ()) -> str:
+    """Write the manifest (one canonical JSON line) and return its sha256, which root.txt carries."""
+    b = canonical_json(build_manifest(out_dir, extra))
+    with open(manifest_path, "wb") as f:
+        f.write(b)
+    files.forget(out_dir)
+    return hashlib.sha256(b).hexdigest()
+
+def check_manifest(manifest_path: str, want_sha: Optional[str]) -> dict:
+    """Re-hash the files a manifest lists (relative to the directory above its own) against it and its root.txt digest."""
+    with open(manifest_path, "rb") as f:
+        b = f.read()
+    bound = bool(want_sha) and hashlib.sha256(b).hexdigest() == want_sha
+    out_dir = os.path.dirname(os.path.dirname(os.path.abspath(manifest_path)))
+    listed, bad = json.loads(b)["files"], []
+    for e in listed:
+        p = os.path.join(out_dir, *e["path"].split("/"))
+        if not os.path.exists(p) or _hash_file(p, _Digest()).sha.hexdigest() != e["sha256"]:
+            bad.append(e["path"])
+    return {"bound": bound, "files": len(listed), "mismatched": bad}
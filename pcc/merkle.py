@@ -1,29 +1,250 @@
-import hashlib, json, os
-from datetime import datetime, timezone
-from .version import VERSION
+import hashlib, os
+from .version import GIT_SHA, VERSION
 
-def merkle_root(lines):
+# root.txt carries "root_format: merkle-v1" for tree roots. Without it the root is
+# the legacy flat form: one running sha256 over the receipts file, kept verifiable.
+ROOT_FORMAT = "merkle-v1"
+FLAT_FORMAT = "flat-sha256"
+BUF_SIZE = 1 << 20
+MANIFEST_NAME = "manifest.json"
+
+def flat_root(lines):
     h = hashlib.sha256()
     for b in lines:
         h.update(b)
     return h.hexdigest()
 
-def _canon_line(obj):
-    return (json.dumps(obj, ensure_ascii=False, separators=(',', ':'), sort_keys=True) + '\n').encode('utf-8')
+def leaf_hash(line: bytes) -> bytes:
+    """Leaf of one receipts line, without its newline (RFC 6962: sha256(0x00 || data))."""
+    if line.endswith(b'\n'):
+        line = line[:-1]
+    return hashlib.sha256(b'\x00' + line).digest()
 
-def write_receipts_and_root(receipts_path, root_path, rows):
-    os.makedirs(os.path.dirname(receipts_path), exist_ok=True)
-    os.makedirs(os.path.dirname(root_path), exist_ok=True)
-    canon_lines = [_canon_line(r) for r in rows]
-    with open(receipts_path, 'wb') as f:
-        for b in canon_lines:
-            f.write(b)
-    root_hex = merkle_root(canon_lines)
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b'\x01' + left + right).digest()
+
+def _split(n):
+    # largest power of two below n
+    return 1 << ((n - 1).bit_length() - 1)
+
+class TreeBuilder:
+    """Root of the RFC 6962 tree over leaves added one at a time, in O(log n) memory.
+
+    The stack holds the roots of the complete subtrees seen so far, largest
+    first, one per set bit of size; folding them from the right gives the tree
+    that splits each range at the largest power of two below its size.
+    """
+    def __init__(self):
+        self.size = 0
+        self._stack = []
+    @classmethod
+    def resume(cls, size: int, peaks) -> "TreeBuilder":
+        """A builder continuing from a saved size and stack (its peaks, largest first)."""
+        if len(peaks) != bin(size).count('1'):
+            raise ValueError(f"{len(peaks)} peaks do not fit {size} leaves")
+        t = cls()
+        t.size, t._stack = size, list(peaks)
+        return t
+    @property
+    def peaks(self):
+        return list(self._stack)
+    def add(self, line: bytes) -> None:
+        self.add_hash(leaf_hash(line))
+    def add_hash(self, h: bytes) -> None:
+        n, st = self.size, self._stack
+        while n & 1:
+            h = hashlib.sha256(b'\x01' + st.pop() + h).digest()
+            n >>= 1
+        st.append(h)
+        self.size += 1
+    def root(self) -> bytes:
+        if not self._stack:
+            return hashlib.sha256(b'').digest()
+        h = self._stack[-1]
+        for left in reversed(self._stack[:-1]):
+            h = node_hash(left, h)
+        return h
+
+def merkle_root(lines):
+    t = TreeBuilder()
+    for b in lines:
+        t.add(b)
+    return t.root().hex()
+
+def proof_ranges(index, size):
+    """Leaf ranges [lo, hi) whose subtree roots form the audit path of leaf index, deepest first."""
+    if not 0 <= index < size:
+        raise IndexError(f"leaf {index} not in a tree of {size}")
+    out = []
+    lo, hi = 0, size
+    while hi - lo > 1:
+        k = _split(hi - lo)
+        if index - lo < k:
+            out.append((lo + k, hi)); hi = lo + k
+        else:
+            out.append((lo, lo + k)); lo += k
+    return out[::-1]
+
+def inclusion_proof(hashes, index, size=None):
+    """Audit path of leaf index, deepest sibling first, from one pass over the leaf hashes.
+
+    hashes may be any iterable (iter_leaf_hashes over a file, say) when size is
+    given; each leaf goes into the one sibling subtree that holds it.
+    """
+    if size is None:
+        hashes = list(hashes); size = len(hashes)
+    ranges = proof_ranges(index, size)
+    trees = [TreeBuilder() for _ in ranges]
+    order = sorted(range(len(ranges)), key=lambda j: ranges[j][0])
+    it = iter(order)
+    j = next(it, None)
+    for i, h in enumerate(hashes):
+        while j is not None and i >= ranges[j][1]:
+            j = next(it, None)
+        if j is not None and ranges[j][0] <= i:
+            trees[j].add_hash(h)
+    return [t.root() for t in trees]
+
+def root_from_proof(leaf: bytes, index: int, size: int, path):
+    """Root implied by a leaf hash and its audit path (RFC 9162 2.1.3.2), or None when the path does not fit size."""
+    if not 0 <= index < size:
+        return None
+    fn, sn, r = index, size - 1, leaf
+    for p in path:
+        if sn == 0:
+            return None
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            while not fn & 1 and fn:
+                fn >>= 1; sn >>= 1
+        else:
+            r = node_hash(r, p)
+        fn >>= 1; sn >>= 1
+    return r if sn == 0 else None
+
+def _leaf_hashes(chunks):
+    # each line's hash is fed segment by segment as the chunks arrive, so a line
+    # may span chunks and nothing but the current chunk is held
+    h = None
+    for buf in chunks:
+        a, n = 0, len(buf)
+        with memoryview(buf) as mv:
+            while a < n:
+                if h is None:
+                    h = hashlib.sha256(b'\x00')
+                b = buf.find(b'\n', a)
+                if b < 0:
+                    h.update(mv[a:]); break
+                h.update(mv[a:b])
+                yield h.digest()
+                h, a = None, b + 1
+    if h is not None:
+        yield h.digest()
+
+def _chunks(f, buf_size, use_mmap=False):
+    # with mmap the file is mapped one window at a time, so resident pages stay bounded too
+    if use_mmap:
+        import mmap
+        size = os.fstat(f.fileno()).st_size
+        win = max(mmap.ALLOCATIONGRANULARITY, buf_size // mmap.ALLOCATIONGRANULARITY * mmap.ALLOCATIONGRANULARITY)
+        for off in range(0, size, win):
+            with mmap.mmap(f.fileno(), min(win, size - off), access=mmap.ACCESS_READ, offset=off) as mm:
+                yield mm
+        return
+    buf = bytearray(buf_size)
+    view = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            return
+        yield buf if n == buf_size else bytes(view[:n])
+
+def _bin_lines(path, buf_size):
+    # the canonical lines of a binary receipts file, or None for a JSONL one; a JSONL line never starts
+    # with NUL, so pcc.receipt_bin is only imported once the first byte says the file is binary
+    with open(path, 'rb') as f:
+        if f.read(1) != b'\x00':
+            return None
+    from .receipt_bin import is_binary, iter_lines
+    return iter_lines(path, buf_size) if is_binary(path) else None
+
+def iter_leaf_hashes(path, buf_size=BUF_SIZE, use_mmap=False, start=0):
+    """Leaf hashes of the lines of a receipts file from byte start, read in fixed-size buffers (or mmap windows).
+
+    A binary receipts file (pcc.receipt_bin) is hashed over the canonical lines it decodes to, from the start.
+    """
+    lines = _bin_lines(path, buf_size)
+    if lines is not None:
+        if start:
+            raise ValueError(f'{path} is a binary receipts file; it is hashed from the start')
+        for line in lines:
+            yield hashlib.sha256(b'\x00' + line[:-1]).digest()
+        return
+    with open(path, 'rb') as f:
+        f.seek(start)
+        yield from _leaf_hashes(_chunks(f, buf_size, use_mmap and not start))
+
+def file_root(path, fmt=ROOT_FORMAT, buf_size=BUF_SIZE, use_mmap=False):
+    """(root hex, line count) of a receipts file in the given root format, in memory independent of its size."""
+    bin_lines = _bin_lines(path, buf_size) if fmt == FLAT_FORMAT else None
+    if bin_lines is not None:
+        h, lines = hashlib.sha256(), 0
+        for line in bin_lines:
+            h.update(line); lines += 1
+        return h.hexdigest(), lines
+    if fmt == FLAT_FORMAT:
+        h, lines, last = hashlib.sha256(), 0, b'\n'
+        with open(path, 'rb') as f:  # one sequential read; mmap buys nothing here
+            for buf in _chunks(f, buf_size):
+                h.update(buf); lines += buf.count(b'\n'); last = buf[-1:]
+        return h.hexdigest(), lines + (last != b'\n')
+    t = TreeBuilder()
+    for d in iter_leaf_hashes(path, buf_size, use_mmap):
+        t.add_hash(d)
+    return t.root().hex(), t.size
+
+def read_root(path):
+    """root.txt as a dict; "root_format" defaults to the flat form, and a bare hex line is taken as its root."""
+    out = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if ':' in line:
+                k, v = line.split(':', 1)
+                out.setdefault(k.strip(), v.strip())
+            elif line and 'root' not in out:
+                out['root'] = line
+    out.setdefault('root_format', FLAT_FORMAT)
+    return out
+
+def write_root_file(root_path, root_hex, lines, manifest_sha=None):
+    from datetime import datetime, timezone
     ts = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
     with open(root_path, 'w', encoding='utf-8', newline='\n') as g:
         g.write(f'root: {root_hex}\n')
-        g.write(f'lines: {len(canon_lines)}\n')
+        g.write(f'root_format: {ROOT_FORMAT}\n')
+        g.write(f'lines: {lines}\n')
+        if manifest_sha:
+            g.write(f'manifest: {manifest_sha}\n')
         g.write(f'ts: {ts}\n')
         g.write(f'tool_version: {VERSION}\n')
-        g.write('git_sha: dev\n')
-    return root_hex
+        g.write(f'git_sha: {GIT_SHA}\n')
+
+def write_receipts_and_root(receipts_path, root_path, rows):
+    """Write receipts.jsonl in receipt order, the run's manifest and root.txt.
+
+    rows may be any iterable; they go through a ReceiptSink, so memory stays
+    bounded however many there are, and each line feeds the tree and the
+    file digest as it is written. The manifest (proof/manifest.json) lists
+    the receipts and every file under <out>/matrix; root.txt binds it by its
+    sha256.
+    """
+    from .manifest import write_manifest
+    from .receipt_sink import ReceiptSink
+    os.makedirs(os.path.dirname(root_path), exist_ok=True)
+    with ReceiptSink(receipts_path) as sink:
+        sink.extend(rows)
+    manifest_sha = write_manifest(os.path.dirname(os.path.dirname(os.path.abspath(receipts_path))),
+                                  os.path.join(os.path.dirname(root_path), MANIFEST_NAME), [receipts_path])
+    write_root_file(root_path, sink.root, sink.size, manifest_sha)
+    return sink.root
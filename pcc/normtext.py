@@ -0,0 +1,93 @@
+from __future__ import annotations
+import re, unicodedata
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+
+_COMBINING = "\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f"
+_DASHES = {"•": "-", "–": "-", "—": "-"}
+_MARKERS = ("\r", "\t", "\u00A0", "  ", "•", "–", "—")
+# everything normalize_text changes: line ends, blank runs, NBSP/tab, bullets and dashes,
+# and (when the text is not NFC already) a base character followed by combining marks
+_CHANGE = re.compile(r"\r\n?|[ \t\u00A0]{2,}|[\t\u00A0•–—]")
+_CHANGE_NFC = re.compile(_CHANGE.pattern + r"|[^\r\n \t\u00A0][" + _COMBINING + "]+")
+
+def normalize_text(s: str) -> str:
+    # same rules as scripts/normalize_text.py
+    s = s.replace("\u00A0", " ")
+    s = s.replace("\r\n", "\n").replace("\r", "\n")
+    s = unicodedata.normalize("NFC", s)
+    s = s.replace("•", "-").replace("–", "-").replace("—", "-")
+    s = re.sub(r"[ \t]+", " ", s)
+    return s
+
+def _replace(seg: str) -> str:
+    c = seg[0]
+    if c == "\r":
+        return "\n"
+    if c in " \t\u00A0":
+        return " "
+    if len(seg) == 1:
+        return _DASHES[c]
+    return unicodedata.normalize("NFC", seg)
+
+class OffsetMap:
+    """Normalized position -> raw position, stored as breakpoints where the shift changes."""
+    __slots__ = ("norm", "raw")
+    def __init__(self, norm: List[int], raw: List[int]):
+        self.norm, self.raw = norm, raw
+    def __call__(self, i: int) -> int:
+        k = bisect_right(self.norm, i) - 1
+        return self.raw[k] + (i - self.norm[k])
+
+class NormText:
+    """One member's text normalized as normalize_text does, with a casefolded view and a way back to raw offsets.
+
+    text is the raw string itself when it is already normalized (the usual
+    case after pdftext), so nothing is copied. folded has the same length as
+    text and is computed on first use; it is shared with the pattern
+    registry so rx.* calls on text do not fold it again.
+    """
+    __slots__ = ("raw", "text", "_map", "_folded")
+    def __init__(self, raw: str):
+        self.raw = raw
+        self._folded: Optional[str] = None
+        nfc = unicodedata.is_normalized("NFC", raw)
+        if nfc and not any(c in raw for c in _MARKERS):
+            self.text, self._map = raw, None
+            return
+        parts: List[str] = []
+        nb, rb = [0], [0]
+        i = n = 0
+        for m in (_CHANGE if nfc else _CHANGE_NFC).finditer(raw):
+            a, b = m.span()
+            parts.append(raw[i:a])
+            n += a - i
+            rep = _replace(m.group())
+            parts.append(rep)
+            n += len(rep)
+            i = b
+            if len(rep) != b - a:
+                nb.append(n); rb.append(b)
+        parts.append(raw[i:])
+        text = "".join(parts)
+        # NFC outside base+combining clusters (singletons) keeps the length; anything else
+        # (Hangul jamo) is composed without tracking, so offsets after it are approximate
+        self.text = text if unicodedata.is_normalized("NFC", text) else unicodedata.normalize("NFC", text)
+        self._map = OffsetMap(nb, rb)
+
+    @property
+    def folded(self) -> str:
+        if self._folded is None:
+            from .patterns import fold, rx
+            self._folded = fold(self.text)
+            rx.share_fold(self.text, self._folded)
+        return self._folded
+
+    def raw_pos(self, i: int) -> int:
+        return i if self._map is None else self._map(i)
+
+    def raw_span(self, a: int, b: int) -> Tuple[int, int]:
+        """Raw span covering the normalized span a:b, including whatever collapsed into it."""
+        if self._map is None:
+            return a, b
+        return self._map(a), (self._map(b) if b < len(self.text) else len(self.raw))
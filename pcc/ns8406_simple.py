@@ -1,26 +1,26 @@
-import argparse, os, zipfile
+import argparse, os
 from .bedrock import build_decision, Check
 from .merkle import write_receipts_and_root
+from .pdftext import add_pdf_args, members_from_args
+from .patterns import rx
+from .cache import add_cache_args, cache_from_args
 from .matrix import (
     write_forms_constraints_csv, write_criteria_and_formula_csv,
-    write_requirements_matrix_csv, write_contract_terms_csv
+    write_requirements_matrix_csv, write_contract_terms_csv, write_price_schema_csv
 )
 from .extract_ns8406_simple import extract_ns8406_itt, extract_ns8406_contract, extract_ns3420_boq, extract_ns8406_env_sha, extract_ns8406_mop, extract_ns8406_overvaking
 
-def _read(zf, names):
-    for n in names:
-        try:
-            return zf.read(n).decode("utf-8","ignore"), n
-        except KeyError:
-            continue
-    return None, None
-
-def main():
+def build_parser():
     ap = argparse.ArgumentParser()
     ap.add_argument("--tender-zip", required=True)
     ap.add_argument("--out", required=True)
     ap.add_argument("--posture", default="advice")
-    args = ap.parse_args()
+    add_cache_args(ap)
+    add_pdf_args(ap)
+    return ap
+
+def run(args):
+    rx.reset()
 
     os.makedirs(args.out, exist_ok=True)
     proof_dir  = os.path.join(args.out, "proof");  os.makedirs(proof_dir, exist_ok=True)
@@ -28,65 +28,77 @@ def main():
 
     rows, checks = [], []
 
-    with zipfile.ZipFile(args.tender_zip,"r") as z:
-        itt_txt,_  = _read(z, ["Konkurransegrunnlag - Rossevann VV (E01).txt",
-                               "Konkurransegrunnlag - Rossevann VV.txt",
-                               "Konkurransegrunnlag.txt"])
-        c03_txt,_  = _read(z, ["Vedlegg 03 - Standard kontraktsbestemmelser NS 8406.txt",
-                               "Standard kontraktsbestemmelser NS 8406.txt",
-                               "NS8406_kontraktsbestemmelser.txt"])
+    members = members_from_args(args)
+    xc = cache_from_args(args)
+    itt = members.find(["Konkurransegrunnlag - Rossevann VV (E01).txt",
+                        "Konkurransegrunnlag - Rossevann VV.txt",
+                        "Konkurransegrunnlag.txt"])
+    c03 = members.find(["Vedlegg 03 - Standard kontraktsbestemmelser NS 8406.txt",
+                        "Standard kontraktsbestemmelser NS 8406.txt",
+                        "NS8406_kontraktsbestemmelser.txt"])
 
-        besk_txt,_ = _read(z, [
-            "10260224-TVF-BESK-001_E01_REV01.txt",
-            "NS3420_beskrivelse.txt",
-            "Beskrivelse.txt"
-        ])
+    besk = members.find([
+        "10260224-TVF-BESK-001_E01_REV01.txt",
+        "NS3420_beskrivelse.txt",
+        "Beskrivelse.txt"
+    ])
+    mop = members.find(["Miljøoppfølgingsplan (MOP).txt", "MOP.txt"])
+    ov = members.find(["Overvåkningsplan.txt", "Overvåkingsplan.txt"])
 
-        if itt_txt:
-            fc, cf, req, rc = extract_ns8406_itt(itt_txt, "Konkurransegrunnlag_RossevannVV_E01.pdf")
-            if fc:   write_forms_constraints_csv(matrix_dir, fc)
-            if cf:   write_criteria_and_formula_csv(matrix_dir, cf)
-            if req:  write_requirements_matrix_csv(matrix_dir, req)
-            rows.extend(rc)
+    if itt:
+        fc, cf, req, rc = xc.call(extract_ns8406_itt, itt, "Konkurransegrunnlag_RossevannVV_E01.pdf")
+        if fc:   write_forms_constraints_csv(matrix_dir, fc)
+        if cf:   write_criteria_and_formula_csv(matrix_dir, cf)
+        if req:  write_requirements_matrix_csv(matrix_dir, req)
+        rows.extend(rc)
 
-            if cf: checks.append(Check(token="tender:criteria:weights_disclosed", ok=True, details=f"{len(cf)} rows", source=None))
+        if cf: checks.append(Check(token="tender:criteria:weights_disclosed", ok=True, details=f"{len(cf)} rows", source=None))
 
-        if c03_txt:
-            terms, creq, rc2 = extract_ns8406_contract(c03_txt, "Vedlegg03_NS8406_standardbestemmelser.pdf")
-            if terms: write_contract_terms_csv(matrix_dir, terms)
-            if creq:  write_requirements_matrix_csv(matrix_dir, creq)
-            rows.extend(rc2)
-            checks.append(Check(token="tender:contract:family", ok=True, details="NS8406", source=None))
-        if besk_txt:
-            ps_rows, rc3 = extract_ns3420_boq(besk_txt, "TVF-BESK-001_E01_REV01.pdf")
-            for r in ps_rows:
-                write_price_schema_csv(matrix_dir, r["sheet"], r["headers"], r["constants"])
-            req_rows, rc4 = extract_ns8406_env_sha(besk_txt, "TVF-BESK-001_E01_REV01.pdf")
-            if req_rows:
-                write_requirements_matrix_csv(matrix_dir, req_rows)
-            rows.extend(rc3 + rc4)
-        if mop_txt:
-            m_terms, m_reqs, m_rc = extract_ns8406_mop(mop_txt, "MOP.pdf")
-            if m_terms:
-                write_contract_terms_csv(matrix_dir, m_terms)
-            if m_reqs:
-                write_requirements_matrix_csv(matrix_dir, m_reqs)
-            rows.extend(m_rc)
-        if ov_txt:
-            o_terms, o_reqs, o_rc = extract_ns8406_overvaking(ov_txt, "Overvåkningsplan.pdf")
-            if o_terms:
-                write_contract_terms_csv(matrix_dir, o_terms)
-            if o_reqs:
-                write_requirements_matrix_csv(matrix_dir, o_reqs)
-            rows.extend(o_rc)
+    if c03:
+        terms, creq, rc2 = xc.call(extract_ns8406_contract, c03, "Vedlegg03_NS8406_standardbestemmelser.pdf")
+        if terms: write_contract_terms_csv(matrix_dir, terms)
+        if creq:  write_requirements_matrix_csv(matrix_dir, creq)
+        rows.extend(rc2)
+        checks.append(Check(token="tender:contract:family", ok=True, details="NS8406", source=None))
+    if besk:
+        ps_rows, rc3 = xc.call(extract_ns3420_boq, besk, "TVF-BESK-001_E01_REV01.pdf")
+        for r in ps_rows:
+            write_price_schema_csv(matrix_dir, r["sheet"], r["headers"], r["constants"])
+        req_rows, rc4 = xc.call(extract_ns8406_env_sha, besk, "TVF-BESK-001_E01_REV01.pdf")
+        if req_rows:
+            write_requirements_matrix_csv(matrix_dir, req_rows)
+        rows.extend(rc3 + rc4)
+    if mop:
+        m_terms, m_reqs, m_rc = xc.call(extract_ns8406_mop, mop, "MOP.pdf")
+        if m_terms:
+            write_contract_terms_csv(matrix_dir, m_terms)
+        if m_reqs:
+            write_requirements_matrix_csv(matrix_dir, m_reqs)
+        rows.extend(m_rc)
+    if ov:
+        o_terms, o_reqs, o_rc = xc.call(extract_ns8406_overvaking, ov, "Overvåkningsplan.pdf")
+        if o_terms:
+            write_contract_terms_csv(matrix_dir, o_terms)
+        if o_reqs:
+            write_requirements_matrix_csv(matrix_dir, o_reqs)
+        rows.extend(o_rc)
 
+    rows.extend(xc.timeout_receipts())
+    checks.extend(xc.timeout_checks())
     receipts = os.path.join(proof_dir, "receipts.jsonl")
     root     = os.path.join(proof_dir, "root.txt")
     write_receipts_and_root(receipts, root, rows)
+    xc.save_run(args.out, members)
+    rx.dump(os.path.join(args.out, "pattern_stats.json"))
 
     asset_id = f"tender:pack/{os.path.splitext(os.path.basename(args.tender_zip))[0]}"
     record = build_decision("ns8406-simple-digest", asset_id, token="ok", decision="allow",
                             posture=args.posture, checks=checks, pack="tender-core", registry_sha=None)
+    return record
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    record = run(args)
     print(record)
     print(record["reason"])
     return 0
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os, zipfile, re
+from .patterns import rx
 
 def _read_texts(zip_path: str):
     texts = []
@@ -35,7 +36,7 @@ def detect_prohibited_conditions(offer_zip: str) -> dict:
     for name, txt in _read_texts(offer_zip):
         for pat in _PROHIBITED_PATTERNS:
             for line in txt.splitlines():
-                if re.search(pat, line, flags=re.IGNORECASE):
+                if rx.search(pat, line, flags=re.IGNORECASE):
                     hits.append(line.strip())
                     files.add(name)
     return {"found": bool(hits), "files": sorted(files), "sample_lines": hits[:3], "count": len(hits)}
@@ -51,7 +52,7 @@ def find_word_limit_in_tender(tender_zip: str) -> int | None:
             if ext not in {".txt", ".csv"}:
                 continue
             txt = z.read(info).decode("utf-8", errors="ignore")
-            m = re.search(r"word\s*limit\s*([0-9]+)", txt, flags=re.IGNORECASE)
+            m = rx.search(r"word\s*limit\s*([0-9]+)", txt, flags=re.IGNORECASE)
             if m:
                 limit = int(m.group(1))
     return limit
@@ -59,7 +60,7 @@ def find_word_limit_in_tender(tender_zip: str) -> int | None:
 def offer_word_count(offer_zip: str) -> int:
     total = 0
     for _, txt in _read_texts(offer_zip):
-        total += len([w for w in re.findall(r"\b\w+\b", txt)])
+        total += len([w for w in rx.findall(r"\b\w+\b", txt)])
     return total
 
 def check_format_ok(tender_zip: str, offer_zip: str, limit_override: int | None = None) -> dict:
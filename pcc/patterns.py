@@ -0,0 +1,297 @@
+from __future__ import annotations
+import json, re
+from re import _casefix, _constants as C, _parser
+from time import perf_counter_ns
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+MIN_ANCHOR = 3
+PREFILTER_MIN_CHARS = 4096
+
+# str.lower() plus the extra case equivalences re.IGNORECASE applies (ſ~s,
+# K~k, ...), each class mapped to one representative. U+0130 is lowered to
+# plain "i" first, as sre does, so folding never changes the length.
+_FOLD: Dict[str, str] = {}
+for _k, _extra in _casefix._EXTRA_CASES.items():
+    _rep = chr(min((_k,) + _extra))
+    for _c in (_k,) + _extra:
+        if chr(_c) != _rep:
+            _FOLD[chr(_c)] = _rep
+_FOLD_RX = re.compile("[" + "".join(sorted(_FOLD)) + "]")
+
+def fold(s: str) -> str:
+    s = s.replace("\u0130", "i").lower()
+    return _FOLD_RX.sub(lambda m: _FOLD[m.group()], s) if _FOLD_RX.search(s) else s
+
+def _flag_names(flags: int) -> str:
+    return "|".join(f.name for f in re.RegexFlag if f is not re.UNICODE and f.value & flags and f.name)
+
+def _required(items) -> Optional[Tuple[str, ...]]:
+    """Literals one of which every match must contain, or None.
+
+    Walks the parsed pattern: runs of LITERALs are required, as are groups
+    and repeats with min >= 1, and a branch is required when each arm has a
+    required literal. Of the candidates, the one whose shortest literal is
+    longest wins.
+    """
+    cands: List[Tuple[str, ...]] = []
+    run: List[str] = []
+    for op, av in items:
+        if op is C.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            cands.append(("".join(run),)); run = []
+        if op is C.SUBPATTERN:
+            r = _required(av[-1])
+        elif op is C.BRANCH:
+            arms = [_required(b) for b in av[1]]
+            r = None if any(a is None for a in arms) else tuple(x for a in arms for x in a)
+        elif op in (C.MAX_REPEAT, C.MIN_REPEAT, getattr(C, "POSSESSIVE_REPEAT", None)) and av[0] >= 1:
+            r = _required(av[2])
+        else:
+            r = None
+        if r:
+            cands.append(r)
+    if run:
+        cands.append(("".join(run),))
+    return max(cands, key=lambda c: min(len(x) for x in c)) if cands else None
+
+def anchors(pattern, flags: int = 0) -> Optional[Tuple[str, ...]]:
+    """Folded required literals of a str pattern, or None when it has none worth checking."""
+    if not isinstance(pattern, str):
+        return None
+    try:
+        r = _required(_parser.parse(pattern, flags).data)
+    except Exception:
+        return None
+    if not r or min(len(x) for x in r) < MIN_ANCHOR:
+        return None
+    return tuple(sorted({fold(x) for x in r}))
+
+class PatternStat:
+    __slots__ = ("rx", "anchors", "calls", "hits", "skips", "ns", "compile_ns")
+    def __init__(self, pattern, flags: int):
+        t0 = perf_counter_ns()
+        self.rx = re.compile(pattern, flags)
+        self.anchors = anchors(pattern, flags)
+        self.compile_ns = perf_counter_ns() - t0
+        self.calls = self.hits = self.skips = self.ns = 0
+    def record(self, t0: int, hit: bool) -> None:
+        self.ns += perf_counter_ns() - t0
+        self.calls += 1
+        if hit:
+            self.hits += 1
+
+class CountedPattern:
+    """A compiled pattern whose calls are counted against its registry entry."""
+    def __init__(self, reg: "PatternRegistry", st: PatternStat):
+        self._reg, self._st = reg, st
+    def search(self, string, *a):
+        return self._reg._one(self._st, self._st.rx.search, string, *a)
+    def match(self, string, *a):
+        return self._reg._one(self._st, self._st.rx.match, string, *a)
+    def fullmatch(self, string, *a):
+        return self._reg._one(self._st, self._st.rx.fullmatch, string, *a)
+    def findall(self, string, *a):
+        return self._reg._all(self._st, string, *a)
+    def finditer(self, string, *a):
+        return self._reg._iter(self._st, string, *a)
+    def sub(self, repl, string, count=0):
+        return self._reg._sub(self._st, repl, string, count)
+    def split(self, string, maxsplit=0):
+        return self._reg._split(self._st, string, maxsplit)
+    def __getattr__(self, name):
+        return getattr(self._st.rx, name)
+
+class PatternRegistry:
+    """Every pattern the extractors use, compiled once, with call/hit/time counters.
+
+    The functions mirror the re module (rx.search(pattern, string, flags=re.I)
+    and so on) but keep their own unbounded table keyed by (pattern, flags)
+    instead of re's bounded cache. reset() zeroes the counters between runs;
+    stats()/dump() export them.
+
+    Each pattern also carries the literals a match must contain. On long
+    texts, which are folded once and remembered, a pattern none of whose
+    literals occur is answered without running the regex. The many rules
+    that miss a document then cost a substring check instead of a scan.
+    """
+    def __init__(self):
+        self._by_key: Dict[Tuple[Any, int], PatternStat] = {}
+        self._text: Optional[str] = None
+        self._folded = ""
+        self._present: Dict[str, bool] = {}
+        self._shared: Dict[int, Tuple[str, str]] = {}
+
+    def share_fold(self, text: str, folded: str) -> None:
+        """Take folded as fold(text) instead of folding text again (see ingest.Member.norm)."""
+        self._shared[id(text)] = (text, folded)
+
+    def folded(self, text: str) -> str:
+        """fold(text), reusing a fold shared for text or the one the prefilter holds."""
+        if text is self._text:
+            return self._folded
+        k = self._shared.get(id(text))
+        return k[1] if k is not None and k[0] is text else fold(text)
+
+    def _absent(self, st: PatternStat, string) -> bool:
+        if st.anchors is None or type(string) is not str or len(string) < PREFILTER_MIN_CHARS:
+            return False
+        if string is not self._text:
+            self._text, self._folded, self._present = string, self.folded(string), {}
+        for a in st.anchors:
+            hit = self._present.get(a)
+            if hit is None:
+                hit = self._present[a] = a in self._folded
+            if hit:
+                return False
+        st.calls += 1
+        st.skips += 1
+        return True
+
+    def get(self, pattern, flags: int = 0) -> PatternStat:
+        key = (pattern, int(flags))
+        st = self._by_key.get(key)
+        if st is None:
+            st = self._by_key[key] = PatternStat(pattern, flags)
+        return st
+
+    def _one(self, st, fn, string, *a):
+        if self._absent(st, string):
+            return None
+        t0 = perf_counter_ns()
+        m = fn(string, *a)
+        st.record(t0, m is not None)
+        return m
+    def _all(self, st, string, *a):
+        if self._absent(st, string):
+            return []
+        t0 = perf_counter_ns()
+        out = st.rx.findall(string, *a)
+        st.record(t0, bool(out))
+        return out
+    def _iter(self, st, string, *a) -> Iterator[re.Match]:
+        if self._absent(st, string):
+            return
+        t0 = perf_counter_ns()
+        it = st.rx.finditer(string, *a)
+        found = False
+        while True:
+            m = next(it, None)
+            st.ns += perf_counter_ns() - t0
+            if m is None:
+                break
+            found = True
+            yield m
+            t0 = perf_counter_ns()
+        st.calls += 1
+        st.hits += found
+    def _sub(self, st, repl, string, count=0):
+        if self._absent(st, string):
+            return string
+        t0 = perf_counter_ns()
+        out, n = st.rx.subn(repl, string, count)
+        st.record(t0, n > 0)
+        return out
+    def _split(self, st, string, maxsplit=0):
+        if self._absent(st, string):
+            return [string]
+        t0 = perf_counter_ns()
+        out = st.rx.split(string, maxsplit)
+        st.record(t0, len(out) > 1)
+        return out
+
+    def compile(self, pattern, flags: int = 0) -> CountedPattern:
+        return CountedPattern(self, self.get(pattern, flags))
+    def search(self, pattern, string, flags: int = 0):
+        st = self.get(pattern, flags)
+        return self._one(st, st.rx.search, string)
+    def match(self, pattern, string, flags: int = 0):
+        st = self.get(pattern, flags)
+        return self._one(st, st.rx.match, string)
+    def fullmatch(self, pattern, string, flags: int = 0):
+        st = self.get(pattern, flags)
+        return self._one(st, st.rx.fullmatch, string)
+    def findall(self, pattern, string, flags: int = 0):
+        return self._all(self.get(pattern, flags), string)
+    def finditer(self, pattern, string, flags: int = 0):
+        return self._iter(self.get(pattern, flags), string)
+    def sub(self, pattern, repl, string, count: int = 0, flags: int = 0):
+        return self._sub(self.get(pattern, flags), repl, string, count)
+    def split(self, pattern, string, maxsplit: int = 0, flags: int = 0):
+        return self._split(self.get(pattern, flags), string, maxsplit)
+
+    def search_within(self, pattern, string, spans: Iterable[Tuple[int, int]], flags: int = 0):
+        """First match lying inside one of the (start, end) spans, tried in order; one call in the stats."""
+        st = self.get(pattern, flags)
+        if self._absent(st, string):
+            return None
+        t0 = perf_counter_ns()
+        m = None
+        for a, b in spans:
+            m = st.rx.search(string, a, b)
+            if m is not None:
+                break
+        st.record(t0, m is not None)
+        return m
+
+    def literals(self, text: str, needles: Iterable[str]) -> Dict[str, List[Tuple[int, int]]]:
+        """Case-insensitive spans of every needle in text, overlaps included.
+
+        The text is folded once; each needle is then located with str.find,
+        which runs in C. Needles that do not occur are left out.
+        """
+        if text is not self._text:
+            self._text, self._folded, self._present = text, self.folded(text), {}
+        f = self._folded
+        out: Dict[str, List[Tuple[int, int]]] = {}
+        for n in needles:
+            fn = fold(n)
+            i = f.find(fn)
+            while i >= 0 and fn:
+                out.setdefault(n, []).append((i, i + len(fn)))
+                i = f.find(fn, i + 1)
+        return out
+
+    def reset(self) -> None:
+        for st in self._by_key.values():
+            st.calls = st.hits = st.skips = st.ns = 0
+        self._text, self._folded, self._present = None, "", {}
+        self._shared = {}
+
+    def stats(self, top: Optional[int] = None) -> List[Dict]:
+        """Patterns called since the last reset, most time first."""
+        rows = [{"pattern": st.rx.pattern, "flags": _flag_names(st.rx.flags), "calls": st.calls, "hits": st.hits, "skips": st.skips,
+                 "ms": round(st.ns / 1e6, 3), "compile_ms": round(st.compile_ns / 1e6, 3)}
+                for st in self._by_key.values() if st.calls]
+        rows.sort(key=lambda r: (-r["ms"], r["pattern"]))
+        return rows[:top] if top else rows
+
+    def dump(self, path: str) -> None:
+        rows = self.stats()
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            json.dump({"patterns": len(self._by_key), "called": len(rows), "calls": sum(r["calls"] for r in rows),
+                       "ms": round(sum(r["ms"] for r in rows), 3), "stats": rows}, f, ensure_ascii=False, indent=1)
+
+rx = PatternRegistry()
+
+def main(argv=None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(prog="pcc-patterns", description="Merge pattern_stats.json files of one or more runs and list the costliest patterns")
+    ap.add_argument("stats", nargs="+", help="pattern_stats.json files")
+    ap.add_argument("--top", type=int, default=20)
+    args = ap.parse_args(argv)
+    merged: Dict[Tuple[str, str], Dict] = {}
+    for p in args.stats:
+        with open(p, "r", encoding="utf-8") as f:
+            for r in json.load(f)["stats"]:
+                m = merged.setdefault((r["pattern"], r["flags"]), {"pattern": r["pattern"], "flags": r["flags"], "calls": 0, "hits": 0, "ms": 0.0})
+                m["calls"] += r["calls"]; m["hits"] += r["hits"]; m["ms"] = round(m["ms"] + r["ms"], 3)
+    rows = sorted(merged.values(), key=lambda r: (-r["ms"], r["pattern"]))
+    total = sum(r["ms"] for r in rows) or 1.0
+    for r in rows[:args.top]:
+        print(json.dumps({**r, "share": round(r["ms"] / total, 4)}, ensure_ascii=False))
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,124 @@
+from __future__ import annotations
+import importlib, os, re, shutil
+from typing import Dict, List, Optional, Tuple
+# ingest, normtext, subprocess and the thread pool are imported where a conversion runs, so
+# runners building their parser (add_pdf_args) do not load them for --help
+
+PAGES_PER_JOB = 8
+
+class PopplerConverter:
+    """pdftotext -layout, one subprocess per page range."""
+    id = "poppler-layout"
+    @staticmethod
+    def available() -> bool:
+        return bool(shutil.which("pdftotext") and shutil.which("pdfinfo"))
+    def page_count(self, path: str) -> int:
+        import subprocess
+        out = subprocess.run(["pdfinfo", path], capture_output=True, text=True, check=True).stdout
+        m = re.search(r"^Pages:\s+(\d+)", out, re.M)
+        return int(m.group(1)) if m else 0
+    def convert(self, path: str, first: int, last: int) -> str:
+        import subprocess
+        p = subprocess.run(["pdftotext", "-layout", "-enc", "UTF-8", "-f", str(first), "-l", str(last), path, "-"],
+                           capture_output=True, check=True)
+        return p.stdout.decode("utf-8", "ignore")
+
+class StubConverter:
+    """Offline stand-in: treats the file as UTF-8 text with pages split on form feeds."""
+    id = "stub"
+    @staticmethod
+    def available() -> bool:
+        return True
+    def _pages(self, path: str) -> List[str]:
+        with open(path, "rb") as f:
+            return f.read().decode("utf-8", "ignore").split("\f")
+    def page_count(self, path: str) -> int:
+        return len(self._pages(path))
+    def convert(self, path: str, first: int, last: int) -> str:
+        return "".join(p + "\f" for p in self._pages(path)[first - 1:last])
+
+CONVERTERS = {"poppler": PopplerConverter, "stub": StubConverter}
+
+def get_converter(name: str):
+    """"auto" (poppler when installed, else None), "off", a CONVERTERS key or "module:Class"."""
+    if name == "off":
+        return None
+    if name == "auto":
+        return PopplerConverter() if PopplerConverter.available() else None
+    if name in CONVERTERS:
+        return CONVERTERS[name]()
+    mod, _, attr = name.partition(":")
+    return getattr(importlib.import_module(mod), attr)()
+
+def _cache_path(cache_dir: str, sha: str, conv) -> str:
+    return os.path.join(cache_dir, "pdftext", sha[:2], f"{sha}.{conv.id}.txt")
+
+def convert_pdf_members(zip_path: str, members: MemberTable, conv, cache_dir: Optional[str] = None,
+                        workers: Optional[int] = None) -> List[Member]:
+    """Add a <stem>.txt member for every .pdf member that has no text sibling.
+
+    Page ranges of all PDFs that are not already cached (by PDF sha256) go
+    through one thread pool; the converter does the work in subprocesses.
+    """
+    import tempfile, zipfile
+    from concurrent.futures import ThreadPoolExecutor
+    from .ingest import Member, sha256_hex
+    from .normtext import normalize_text
+    todo = [m for m in members.with_ext(".pdf") if os.path.splitext(m.name)[0] + ".txt" not in members.by_name]
+    texts: Dict[str, str] = {}  # by PDF sha256, so identical PDFs convert once
+    pending: Dict[str, Member] = {}
+    for m in todo:
+        if m.sha256 in texts or m.sha256 in pending:
+            continue
+        if cache_dir:
+            try:
+                with open(_cache_path(cache_dir, m.sha256, conv), "r", encoding="utf-8") as f:
+                    texts[m.sha256] = f.read()
+                continue
+            except OSError:
+                pass
+        pending[m.sha256] = m
+    if pending:
+        with tempfile.TemporaryDirectory(prefix="pcc-pdf-") as td, zipfile.ZipFile(zip_path) as zf:
+            paths = {}
+            for sha, m in pending.items():
+                paths[sha] = os.path.join(td, sha + ".pdf")
+                with zf.open(m.name) as src, open(paths[sha], "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+            jobs: List[Tuple[str, int, int]] = []
+            for sha in pending:
+                n = conv.page_count(paths[sha])
+                jobs.extend((sha, a, min(a + PAGES_PER_JOB - 1, n)) for a in range(1, n + 1, PAGES_PER_JOB))
+            with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 2) as ex:
+                parts = list(ex.map(lambda j: conv.convert(paths[j[0]], j[1], j[2]), jobs))
+        for sha in pending:
+            texts[sha] = normalize_text("".join(p for j, p in zip(jobs, parts) if j[0] == sha))
+            if cache_dir:
+                path = _cache_path(cache_dir, sha, conv)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                    f.write(texts[sha])
+                os.replace(tmp, path)
+    added = []
+    for m in todo:
+        data = texts[m.sha256].encode("utf-8")
+        t = Member(name=os.path.splitext(m.name)[0] + ".txt", ext=".txt", size=len(data), sha256=sha256_hex(data), data=data, source=m.name)
+        members.add(t)
+        added.append(t)
+    return added
+
+def add_pdf_args(ap) -> None:
+    ap.add_argument("--pdf-converter", default="auto",
+                    help="PDF to text: auto (poppler if installed), off, " + ", ".join(CONVERTERS) + " or module:Class")
+    ap.add_argument("--pdf-workers", type=int, default=None, help="Parallel page-range conversions (default: CPU count)")
+
+def members_from_args(args) -> MemberTable:
+    """The tender zip's member table, with converted text for .pdf members."""
+    from .ingest import MemberTable
+    members = MemberTable.from_zip(args.tender_zip)
+    conv = get_converter(getattr(args, "pdf_converter", "auto"))
+    if conv is not None and members.with_ext(".pdf"):
+        convert_pdf_members(args.tender_zip, members, conv, cache_dir=getattr(args, "cache_dir", None),
+                            workers=getattr(args, "pdf_workers", None))
+    return members
@@ -0,0 +1,38 @@
+from __future__ import annotations
+def main(argv=None) -> int:
+    import argparse, json, sys
+    from .merkle import ROOT_FORMAT, file_root, inclusion_proof, iter_leaf_hashes, read_root
+    from .receipt_bin import receipt_lines
+    ap = argparse.ArgumentParser(prog="pcc-prove", description="Emit a Merkle inclusion proof for one receipt of receipts.jsonl")
+    ap.add_argument("--receipts", required=True, help="Path to receipts.jsonl (or its binary form)")
+    ap.add_argument("--receipt-index", type=int, required=True, help="0-based line of the receipt to prove")
+    ap.add_argument("--root", help="root.txt the proof must match (a merkle-v1 root)")
+    ap.add_argument("--out", help="Write the proof here instead of stdout")
+    args = ap.parse_args(argv)
+    # two streaming passes (root and size, then the path), so memory does not grow with the file
+    root, size = file_root(args.receipts)
+    if not 0 <= args.receipt_index < size:
+        ap.error(f"--receipt-index {args.receipt_index} out of range: {size} receipts")
+    if args.root:
+        meta = read_root(args.root)
+        if meta["root_format"] != ROOT_FORMAT:
+            sys.stderr.write(f"pcc-prove: {args.root} is a {meta['root_format']} root, which has no inclusion proofs; re-run to get a {ROOT_FORMAT} root\n")
+            return 2
+        if meta.get("root") != root:
+            sys.stderr.write(f"pcc-prove: receipts do not match {args.root}\n")
+            return 1
+    for i, line in enumerate(receipt_lines(args.receipts)):
+        if i == args.receipt_index:
+            break
+    path = inclusion_proof(iter_leaf_hashes(args.receipts), args.receipt_index, size)
+    proof = {"proof_format": ROOT_FORMAT, "receipt": (line[:-1] if line.endswith(b"\n") else line).decode("utf-8"), "index": args.receipt_index,
+             "size": size, "path": [h.hex() for h in path], "root": root}
+    s = json.dumps(proof, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8", newline="\n") as f:
+            f.write(s + "\n")
+    else:
+        print(s)
+    return 0
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,119 @@
+from __future__ import annotations
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from .patterns import fold, rx
+
+# tokens are letter runs and digit runs, so "30tegn" and "Bilag10" hold two each
+_TOKEN = re.compile(r"[^\W\d_]+|\d+")
+_LETTERS, _DIGITS = r"[^\W\d_]", r"\d"
+_WS_RUN = re.compile(r"\s{2,}")
+MEMO = 8
+
+def term_pattern(term: str, prefix: bool = True) -> str:
+    """Regex for term as a run of consecutive tokens (see TermIndex)."""
+    words = _TOKEN.findall(fold(term))
+    if not words:
+        raise ValueError(f"no tokens in term {term!r}")
+    cls = [_DIGITS if w[0].isdigit() else _LETTERS for w in words]
+    out = []
+    for i, w in enumerate(words):
+        if i:
+            out.append(r"[\W_]+" if cls[i] == cls[i - 1] else r"[\W_]*")
+        out.append(re.escape(w))
+        if not i:  # the token starts here; checked after the literal so the regex engine can scan for it
+            out.append(f"(?<!{cls[0]}.{{{len(w)}}})")
+    out.append(f"{cls[-1]}*" if prefix else f"(?!{cls[-1]})")
+    return "".join(out)
+
+class TermIndex:
+    """Positions of terms in one text, for lookups and "a term of each set within N chars" queries.
+
+    A term is one or more words and matches a run of consecutive tokens,
+    case-insensitively. Every word but the last must equal its token; the last
+    is a prefix of its token unless prefix=False, so "propor" finds
+    "proporsjonal" and "laveste pris" finds "Laveste\\nprisen". The postings of
+    a term set are collected by one rx pass over the text on first use and
+    kept, so asking again, or from another module, costs nothing. Spans are
+    offsets into the text and can go straight to rx.search_within.
+    """
+    def __init__(self, text: str):
+        self.text = text
+        self._folded: Optional[str] = None
+        self._hits: Dict[Tuple[Tuple[str, ...], bool], List[Tuple[int, int]]] = {}
+        self._runs: Optional[Tuple[List[int], List[int]]] = None
+
+    def _collapsed(self, a: int, b: int) -> int:
+        # length of text[a:b] with each whitespace run counted as one char (re.sub(r"\s+", " ")), for a
+        # and b outside runs, which term hits are: runs are kept as their ends and the chars dropped so far
+        if self._runs is None:
+            ends, dropped, n = [], [0], 0
+            for m in _WS_RUN.finditer(self.text):
+                n += m.end() - m.start() - 1
+                ends.append(m.end()); dropped.append(n)
+            self._runs = ends, dropped
+        ends, dropped = self._runs
+        return b - a - (dropped[bisect_right(ends, b)] - dropped[bisect_right(ends, a)])
+
+    @property
+    def folded(self) -> str:
+        # terms are folded too, so the regexes run without re.I, which keeps sre's literal scan;
+        # fold is idempotent, so the folded text is shared as its own fold for the prefilter
+        if self._folded is None:
+            self._folded = rx.folded(self.text)
+            rx.share_fold(self._folded, self._folded)
+        return self._folded
+
+    def _pattern(self, terms: Tuple[str, ...], prefix: bool) -> str:
+        return "|".join(term_pattern(t, prefix) for t in terms)
+
+    def hits(self, terms: Iterable[str], prefix: bool = True) -> List[Tuple[int, int]]:
+        """(start, end) of every match of any of terms, in text order."""
+        key = (tuple(terms), prefix)
+        out = self._hits.get(key)
+        if out is None:
+            out = self._hits[key] = [m.span() for m in rx.finditer(self._pattern(*key), self.folded)]
+        return out
+
+    def has(self, term: str, prefix: bool = True) -> bool:
+        key = ((term,), prefix)
+        if key in self._hits:
+            return bool(self._hits[key])
+        return rx.search(self._pattern(*key), self.folded) is not None
+
+    def near(self, sets: Sequence[Iterable[str]], window: int, prefix: bool = True,
+             collapse_ws: bool = False) -> Iterator[Tuple[int, int]]:
+        """Spans of at most window chars holding a hit of each set, by start.
+
+        With collapse_ws a whitespace run counts as one char, as in text that
+        went through re.sub(r"\s+", " "), so column padding (pdftotext
+        -layout) does not push terms apart; spans are still raw offsets.
+        One sweep over the hit lists: at each step the earliest current hit is
+        replaced by the next one of its set, so after the postings are in the
+        cost is linear in the number of hits (times the number of sets).
+        """
+        lists = [self.hits(ts, prefix) for ts in sets]
+        if not lists or not all(lists):
+            return
+        cur = [0] * len(lists)
+        while True:
+            spans = [l[j] for l, j in zip(lists, cur)]
+            k = min(range(len(spans)), key=lambda x: spans[x][0])
+            a, b = spans[k][0], max(e for _, e in spans)
+            if b - a <= window or collapse_ws and self._collapsed(a, b) <= window:
+                yield a, b
+            cur[k] += 1
+            if cur[k] == len(lists[k]):
+                return
+
+_memo: Dict[int, TermIndex] = {}
+
+def terms(text: str) -> TermIndex:
+    """The TermIndex of text; the last few texts are kept, so modules scanning the same member share postings."""
+    ti = _memo.get(id(text))
+    if ti is not None and ti.text is text:
+        return ti
+    if len(_memo) >= MEMO:
+        del _memo[next(iter(_memo))]
+    ti = _memo[id(text)] = TermIndex(text)
+    return ti
@@ -0,0 +1,242 @@
+from __future__ import annotations
+import json
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+# A binary receipts file is MAGIC, then one record per receipt: a varint byte
+# length and that many bytes. A record starts with its shape: 2*id for a shape
+# seen before, or 1 followed by a new shape, which takes the next id. A new
+# shape is a varint n and then n-1 keys (varint length + key as JSON text),
+# sorted as canonical JSON sorts them; n = 0 is the shape of a receipt kept
+# whole. Then one value per key, each a varint t and:
+#   t & 3 == 0: t >> 2 bytes of JSON text
+#   t & 3 == 2: the same, and the text takes the next id in the file's value table
+#   t & 3 == 1: value table entry t >> 2
+# Keys and values are stored as their canonical JSON text, so a record decodes
+# to exactly its canonical_json line. Hashes and roots are therefore those of
+# the JSONL file it came from.
+MAGIC = b"\x00pcc-receipts-bin-v1\n"
+BUF_SIZE = 1 << 20
+INTERN_MAX = 64       # longest value text (bytes) that goes into the table
+MAX_PIECES = 1 << 17  # bounds the table, and so encoder and decoder memory
+_RAW = object()  # shape key of receipts kept whole
+
+_encode = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode
+_SMALL = [bytes((i,)) for i in range(0x80)]
+
+def _uv(n: int) -> bytes:
+    if n < 0x80:
+        return _SMALL[n]
+    out = bytearray()
+    while n >= 0x80:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+def _read_uv(buf, i: int):
+    n = shift = 0
+    while True:
+        b = buf[i]
+        i += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, i
+        shift += 7
+
+def is_binary(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+class BinWriter:
+    """Encoder for one binary receipts file; write_row() takes the rows canonical_json would."""
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        self._order = {}   # keys in row order -> keys in canonical order
+        self._shapes = {}  # keys in canonical order (or _RAW) -> shape id
+        self._pieces = {}  # value -> table id
+        self.rows = 0
+        f.write(MAGIC)
+
+    def _shape(self, sk, parts: list) -> None:
+        sid = self._shapes.get(sk)
+        if sid is not None:
+            parts.append(_uv(sid << 1))
+            return
+        self._shapes[sk] = len(self._shapes)
+        parts.append(b"\x01")
+        if sk is _RAW:
+            parts.append(b"\x00")
+            return
+        parts.append(_uv(len(sk) + 1))
+        for k in sk:
+            kb = _encode(k).encode("utf-8")
+            parts.append(_uv(len(kb))); parts.append(kb)
+
+    def write_row(self, row) -> None:
+        parts = []
+        sk = self._order.get(tuple(row)) if isinstance(row, dict) else _RAW
+        if sk is None:
+            ks = tuple(row)
+            sk = self._order[ks] = tuple(sorted(ks)) if all(type(k) is str for k in ks) else _RAW
+        self._shape(sk, parts)
+        if sk is _RAW:
+            b = _encode(row).encode("utf-8")
+            parts.append(_uv(len(b) << 2)); parts.append(b)
+        else:
+            pieces = self._pieces
+            for k in sk:
+                v = row[k]
+                t = type(v)
+                # str values are their own key; other scalars go by (type, value), as True == 1 == 1.0
+                ik = v if t is str else (t, v) if v is None or t is bool or t is int or t is float else None
+                pid = pieces.get(ik) if ik is not None else None
+                if pid is not None:
+                    parts.append(_uv(pid << 2 | 1))
+                    continue
+                b = _encode(v).encode("utf-8")
+                if ik is not None and len(b) <= INTERN_MAX and len(pieces) < MAX_PIECES:
+                    pieces[ik] = len(pieces)
+                    parts.append(_uv(len(b) << 2 | 2))
+                else:
+                    parts.append(_uv(len(b) << 2))
+                parts.append(b)
+        body = b"".join(parts)
+        self._f.write(_uv(len(body)) + body)
+        self.rows += 1
+
+    def write_rows(self, rows: Iterable) -> None:
+        for r in rows:
+            self.write_row(r)
+
+def _decode(buf: bytes, i: int, end: int, shapes: list, table: list) -> bytes:
+    t = buf[i]; i += 1
+    if t & 1:
+        n, i = _read_uv(buf, i)
+        if n == 0:
+            shapes.append((b"%b\n", 1))
+        else:
+            keys = []
+            for _ in range(n - 1):
+                l, i = _read_uv(buf, i)
+                keys.append(buf[i:i + l].replace(b"%", b"%%") + b":%b"); i += l
+            shapes.append((b"{" + b",".join(keys) + b"}\n", n - 1))
+        template, nf = shapes[-1]
+    else:
+        if t >= 0x80:
+            t, i = _read_uv(buf, i - 1)
+        template, nf = shapes[t >> 1]
+    vals = []
+    add = vals.append
+    for _ in range(nf):
+        # varints of one and two bytes (table ids below 8192) are read inline
+        t = buf[i]
+        if t < 0x80:
+            i += 1
+        elif buf[i + 1] < 0x80:
+            t = t & 0x7F | buf[i + 1] << 7; i += 2
+        else:
+            t, i = _read_uv(buf, i)
+        if t & 1:
+            add(table[t >> 2])
+            continue
+        v = buf[i:i + (t >> 2)]; i += t >> 2
+        if t & 2:
+            table.append(v)
+        add(v)
+    if i != end:
+        raise ValueError("binary receipt record does not match its length")
+    return template % tuple(vals)
+
+def iter_lines(path: str, buf_size: int = BUF_SIZE) -> Iterator[bytes]:
+    """canonical_json line (newline included) of each receipt in a binary file, read in buf_size pieces."""
+    shapes, table = [], []
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a binary receipts file")
+        buf, i, eof = b"", 0, False
+        while True:
+            while len(buf) - i < 10 and not eof:
+                more = f.read(buf_size)
+                eof = not more
+                buf, i = buf[i:] + more, 0
+            if i == len(buf):
+                return
+            try:
+                n, j = _read_uv(buf, i)
+            except IndexError:
+                raise ValueError(f"{path} ends in a partial record") from None
+            while len(buf) - j < n and not eof:
+                more = f.read(max(buf_size, n))
+                eof = not more
+                buf, j, i = buf[i:] + more, j - i, 0
+            if len(buf) - j < n:
+                raise ValueError(f"{path} ends in a partial record")
+            yield _decode(buf, j, j + n, shapes, table)
+            i = j + n
+
+def receipt_lines(path: str, buf_size: int = BUF_SIZE) -> Iterator[bytes]:
+    """Lines of a receipts file in either format, as bytes; a binary file yields its canonical_json lines."""
+    if is_binary(path):
+        yield from iter_lines(path, buf_size)
+        return
+    with open(path, "rb") as f:
+        yield from f
+
+def pack(src: str, dst: str) -> int:
+    """Encode receipts.jsonl as a binary file; returns the number of receipts.
+
+    Only canonical logs pack: a record decodes to the canonical_json line of
+    its row, so any other line (blank, spaced, keys unsorted, no final
+    newline) would come back as different bytes and change the root. Such a
+    file raises ValueError and dst is removed.
+    """
+    import os
+    from .canonical import canonical_json
+    dec = json.JSONDecoder().decode
+    try:
+        with open(src, "rb") as f, open(dst, "wb") as g:
+            w = BinWriter(g)
+            for n, line in enumerate(f, 1):
+                row = dec(line.decode("utf-8")) if line.strip() else line
+                if row is line or canonical_json(row) != line:
+                    raise ValueError(f"{src} line {n} is not a canonical receipt line; packing it would change the root")
+                w.write_row(row)
+    except ValueError:
+        os.remove(dst)
+        raise
+    return w.rows
+
+def export(src: str, dst: Optional[str] = None) -> int:
+    """Write the canonical JSONL of a binary receipts file (to stdout without dst); returns the number of receipts."""
+    import sys
+    n = 0
+    g = open(dst, "wb") if dst else sys.stdout.buffer
+    try:
+        for line in iter_lines(src):
+            g.write(line); n += 1
+    finally:
+        if dst:
+            g.close()
+    return n
+
+def main(argv=None) -> int:
+    import argparse, os, sys
+    ap = argparse.ArgumentParser(prog="pcc-receipts", description="Convert receipts between canonical JSONL and the compact binary format")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("pack", help="receipts.jsonl -> binary")
+    p.add_argument("src"); p.add_argument("dst")
+    e = sub.add_parser("export", help="binary -> canonical receipts.jsonl (byte for byte what was packed, if it was canonical)")
+    e.add_argument("src"); e.add_argument("dst", nargs="?")
+    args = ap.parse_args(argv)
+    if args.cmd == "pack":
+        try:
+            n = pack(args.src, args.dst)
+        except ValueError as e:
+            sys.stderr.write(f"pcc-receipts: {e}\n")
+            return 1
+        print(json.dumps({"receipts": n, "jsonl_bytes": os.path.getsize(args.src), "bin_bytes": os.path.getsize(args.dst)}))
+    else:
+        export(args.src, args.dst)
+    return 0
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,26 +1,132 @@
 from __future__ import annotations
-import json
+import itertools, json, os
+from typing import Dict, Iterable, Iterator, Optional
+from .canonical import canonical_json
+from .extsort import MEM_BYTES, ExternalSort
+from .merkle import ROOT_FORMAT, read_root
+from .receipt_bin import is_binary, receipt_lines
+
+# lines are compared a block at a time; a block of BLOCK lines at a multiple of
+# BLOCK is one complete subtree of the merkle-v1 tree
+BLOCK = 1 << 12
+_SEP = b"\x1f"  # never appears raw in JSON text
+# built once: loads() would set up a decoder per call
+_decode = json.JSONDecoder().decode
+
+def _ident(row) -> bytes:
+    # only groups rows, so any stable spelling will do; repr escapes newlines and control characters
+    if not isinstance(row, dict):
+        return b"()"
+    return repr((row.get("type"), row.get("key"), row.get("asset_id"))).encode("utf-8")
+
+def _blocks(path: str) -> Iterator[list]:
+    lines = receipt_lines(path)
+    while True:
+        blk = list(itertools.islice(lines, BLOCK))
+        if not blk:
+            return
+        yield blk
+
+def _record(line: bytes, canonical: bool) -> Optional[bytes]:
+    # sort record: identity, then the canonical line, so one identity's rows meet in the merge
+    line = line.rstrip(b"\n") if canonical else line.strip()
+    if not line:
+        return None
+    row = _decode(line.decode("utf-8"))
+    if not canonical:
+        line = canonical_json(row)[:-1]
+    return _ident(row) + _SEP + line
+
+def _join(a: Iterable[bytes], b: Iterable[bytes], stats: dict) -> Iterator[tuple]:
+    a, b = iter(a), iter(b)
+    x, y = next(a, None), next(b, None)
+    while x is not None or y is not None:
+        if y is None or (x is not None and x < y):
+            yield "removed", x
+            x = next(a, None)
+        elif x is None or y < x:
+            yield "added", y
+            y = next(b, None)
+        else:
+            stats["unchanged"] += 1
+            x, y = next(a, None), next(b, None)
+
+def _root(path: str, root_path: Optional[str]) -> Optional[dict]:
+    if root_path is None:
+        p = os.path.join(os.path.dirname(os.path.abspath(path)), "root.txt")
+        root_path = p if os.path.exists(p) else None
+    return read_root(root_path) if root_path else None
+
+def diff_receipts(old_path: str, new_path: str, old_root: Optional[str] = None, new_root: Optional[str] = None,
+                  mem_bytes: int = MEM_BYTES, tmp_dir: Optional[str] = None, stats: Optional[dict] = None) -> Iterator[dict]:
+    """Typed differences between two receipts logs, in memory bounded by mem_bytes whatever their size.
+
+    Yields {"op": "added"|"removed", "row": ...} and, where exactly one row
+    with a "key" left and one came back under the same (type, key, asset_id),
+    {"op": "changed", "type", "key", "asset_id", "old", "new"}; rows compare by
+    their canonical JSON, as a multiset. Roots default to root.txt beside each
+    log. Two merkle-v1 roots that agree end the diff without reading either
+    log; otherwise the logs are read in step and every aligned BLOCK-line
+    subtree the two hold byte for byte is dropped unparsed. The rest is
+    external-sorted by identity and merge-joined. merkle-v1 and binary logs
+    are canonical as written, so only other logs are re-serialized. Either
+    log may be binary (pcc.receipt_bin). Roots are taken as given;
+    pcc-verify is what checks them.
+    """
+    st = stats if stats is not None else {}
+    st.update(old_lines=0, new_lines=0, skipped=0, unchanged=0, added=0, removed=0, changed=0)
+    ra, rb = _root(old_path, old_root), _root(new_path, new_root)
+    merkle_a = bool(ra) and ra["root_format"] == ROOT_FORMAT
+    merkle_b = bool(rb) and rb["root_format"] == ROOT_FORMAT
+    if merkle_a and merkle_b and ra["root"] == rb["root"] and ra.get("lines") == rb.get("lines"):
+        n = int(ra.get("lines") or 0)
+        st.update(old_lines=n, new_lines=n, skipped=n)
+        return
+    # binary logs decode to canonical lines
+    canon_a, canon_b = merkle_a or is_binary(old_path), merkle_b or is_binary(new_path)
+    sa, sb = ExternalSort(None, mem_bytes, tmp_dir), ExternalSort(None, mem_bytes, tmp_dir)
+    for x, y in itertools.zip_longest(_blocks(old_path), _blocks(new_path), fillvalue=[]):
+        st["old_lines"] += len(x); st["new_lines"] += len(y)
+        if x == y:
+            st["skipped"] += len(x)
+            continue
+        for runs, blk, canon in ((sa, x, canon_a), (sb, y, canon_b)):
+            for line in blk:
+                rec = _record(line, canon)
+                if rec is not None:
+                    runs.add(rec, len(rec) + 64)
+    for _, grp in itertools.groupby(_join(sa, sb, st), key=lambda d: d[1].split(_SEP, 1)[0]):
+        rows = [(op, json.loads(rec.split(_SEP, 1)[1])) for op, rec in grp]
+        if len(rows) == 2 and {op for op, _ in rows} == {"added", "removed"} and isinstance(rows[0][1], dict) and "key" in rows[0][1]:
+            old = next(r for op, r in rows if op == "removed")
+            new = next(r for op, r in rows if op == "added")
+            st["changed"] += 1
+            yield {"op": "changed", "type": old.get("type"), "key": old.get("key"), "asset_id": old.get("asset_id"), "old": old, "new": new}
+            continue
+        for op, r in rows:
+            st[op] += 1
+            yield {"op": op, "row": r}
+
 def main(argv=None) -> int:
-    import argparse
+    import argparse, sys
     ap = argparse.ArgumentParser(prog="pcc-receipt-diff", description="Diff two receipts.jsonl files at node level")
     ap.add_argument("--old", required=True)
     ap.add_argument("--new", required=True)
+    ap.add_argument("--old-root", help="root.txt of --old (default: root.txt beside it, if any)")
+    ap.add_argument("--new-root", help="root.txt of --new (default: root.txt beside it, if any)")
+    ap.add_argument("--mem-mb", type=int, default=MEM_BYTES >> 20, help="sort memory per log before spilling to temp files")
+    ap.add_argument("--tmp-dir", help="where sorted runs are spilled (default: the system temp dir)")
+    ap.add_argument("--jsonl", action="store_true", help="one typed record per line as found, instead of one summary object")
     args = ap.parse_args(argv)
-    def load(path):
-        rows = []
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    rows.append(json.loads(line))
-        return rows
-    a = load(args.old)
-    b = load(args.new)
-    sa = {json.dumps(r, sort_keys=True) for r in a}
-    sb = {json.dumps(r, sort_keys=True) for r in b}
-    added = [json.loads(s) for s in sb - sa]
-    removed = [json.loads(s) for s in sa - sb]
-    out = {"added": added, "removed": removed, "added_count": len(added), "removed_count": len(removed)}
+    diffs = diff_receipts(args.old, args.new, args.old_root, args.new_root, args.mem_mb << 20, args.tmp_dir)
+    if args.jsonl:
+        for d in diffs:
+            sys.stdout.write(json.dumps(d, ensure_ascii=False) + "\n")
+        return 0
+    out: Dict[str, list] = {"added": [], "removed": [], "changed": []}
+    for d in diffs:
+        out[d["op"]].append(d if d["op"] == "changed" else d["row"])
+    out.update(added_count=len(out["added"]), removed_count=len(out["removed"]), changed_count=len(out["changed"]))
     print(json.dumps(out, ensure_ascii=False))
     return 0
 if __name__ == "__main__":
@@ -0,0 +1,112 @@
+from __future__ import annotations
+import hashlib, json, os
+from typing import Iterable, Optional
+from .canonical import canonical_json
+from .manifest import files
+from .merkle import ROOT_FORMAT, TreeBuilder, iter_leaf_hashes, write_root_file
+from .receipt_bin import is_binary
+
+PROBE = 1 << 16  # bytes at each end of the checkpointed prefix that resume re-reads
+
+def _probe(path: str, end: int) -> str:
+    # sha256 of the first and last PROBE bytes of path[:end] (all of it when short): a log regenerated or
+    # rewritten since the checkpoint shows up there, and checking it costs two small reads, not the whole log
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        h.update(f.read(min(PROBE, end)))
+        if end > PROBE:
+            f.seek(max(PROBE, end - PROBE))
+            h.update(f.read(end - f.tell()))
+    return h.hexdigest()
+
+class ReceiptLog:
+    """Append-only receipts.jsonl whose merkle-v1 root is kept current as lines are written.
+
+    The tree state is the TreeBuilder stack: a Merkle mountain range with one
+    perfect subtree per set bit of the line count, so an append costs O(log n)
+    hashes and memory does not grow with the log. checkpoint() flushes the
+    file and saves size, byte length and peaks to <log>.peaks; a later
+    ReceiptLog on the same path picks up from there without re-reading the
+    log (lines appended after the last checkpoint are hashed from disk). The
+    checkpoint also keeps a digest of the head and tail of the bytes it
+    covers; when the log no longer has them (rewritten, regenerated, cut
+    short) the peaks are dropped and the whole log is hashed again. The
+    root at any checkpoint is the root pcc-verify computes for the file as it
+    stands.
+    """
+    def __init__(self, path: str, resume: bool = True):
+        self.path = path
+        self.state_path = path + ".peaks"
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if resume and os.path.exists(path):
+            self._tree, self._bytes = self._load()
+            self._f = files.open(path, "ab")
+        else:
+            self._tree, self._bytes = TreeBuilder(), 0
+            self._f = files.open(path, "wb")
+            if os.path.exists(self.state_path):
+                os.remove(self.state_path)
+
+    def _load(self):
+        if is_binary(self.path):
+            raise ValueError(f"{self.path} is a binary receipts file; export it to JSONL to append to it")
+        size = os.path.getsize(self.path)
+        tree, done = TreeBuilder(), 0
+        if os.path.exists(self.state_path):
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                st = json.load(f)
+            if st.get("format") == ROOT_FORMAT and st["bytes"] <= size and st.get("probe") == _probe(self.path, st["bytes"]):
+                tree, done = TreeBuilder.resume(st["size"], [bytes.fromhex(h) for h in st["peaks"]]), st["bytes"]
+        if done < size:
+            with open(self.path, "rb") as f:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    raise ValueError(f"{self.path} ends in a partial line; cannot append to it")
+            # lines no checkpoint covers (all of them without a .peaks file) are hashed from disk once
+            for h in iter_leaf_hashes(self.path, start=done):
+                tree.add_hash(h)
+        return tree, size
+
+    @property
+    def size(self) -> int:
+        return self._tree.size
+
+    def append(self, row: dict) -> None:
+        self.append_line(canonical_json(row))
+
+    def append_line(self, b: bytes) -> None:
+        """Append one line already in canonical form, newline included."""
+        self._f.write(b)
+        self._tree.add(b)
+        self._bytes += len(b)
+
+    def extend(self, rows: Iterable[dict]) -> None:
+        for r in rows:
+            self.append(r)
+
+    def root(self) -> str:
+        return self._tree.root().hex()
+
+    def checkpoint(self, root_path: Optional[str] = None) -> str:
+        """Flush, save the peaks, and (given root_path) publish root.txt for the log as it stands; returns the root."""
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8", newline="\n") as f:
+            json.dump({"format": ROOT_FORMAT, "size": self.size, "bytes": self._bytes, "probe": _probe(self.path, self._bytes),
+                       "peaks": [p.hex() for p in self._tree.peaks]}, f)
+        os.replace(tmp, self.state_path)
+        root = self.root()
+        if root_path:
+            write_root_file(root_path, root, self.size)
+        return root
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self._f.close()
+
+    def __enter__(self) -> "ReceiptLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
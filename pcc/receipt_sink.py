@@ -0,0 +1,50 @@
+from __future__ import annotations
+from operator import itemgetter
+from typing import Iterable, Optional, Tuple
+from .canonical import canonical_json
+from .extsort import MEM_BYTES, ExternalSort
+from .receipt_log import ReceiptLog
+
+def receipt_order(row: dict) -> Tuple:
+    """Sort key of a receipt in receipts.jsonl: asset, token, time, type; equal keys keep arrival order."""
+    return (row.get("asset_id", ""), row.get("token", ""), row.get("ts", ""), row.get("type", ""))
+
+class ReceiptSink:
+    """receipts.jsonl in receipt_order for any number of rows, in memory bounded by mem_bytes.
+
+    Rows are canonicalized as they are added and kept with their key in an
+    ExternalSort, which spills sorted runs to temp files once past mem_bytes.
+    close() merges them into a ReceiptLog, so each line is hashed into the
+    tree and the manifest digest as it is written and the file is never read
+    back.
+    """
+    def __init__(self, path: str, mem_bytes: int = MEM_BYTES, tmp_dir: Optional[str] = None):
+        self.path = path
+        self._rows = ExternalSort(itemgetter(0), mem_bytes, tmp_dir)
+        self.root: Optional[str] = None
+        self.size = 0
+
+    def add(self, row: dict) -> None:
+        b = canonical_json(row)
+        # the line plus the key tuple, its strings and the pair holding both
+        self._rows.add((receipt_order(row), b), len(b) + 320)
+
+    def extend(self, rows: Iterable[dict]) -> None:
+        for r in rows:
+            self.add(r)
+
+    def close(self) -> str:
+        """Write the file and return its merkle-v1 root; later calls return the same root."""
+        if self.root is None:
+            with ReceiptLog(self.path, resume=False) as log:
+                for _, b in self._rows:
+                    log.append_line(b)
+            self.root, self.size = log.root(), log.size
+        return self.root
+
+    def __enter__(self) -> "ReceiptSink":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
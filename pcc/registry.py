@@ -0,0 +1,39 @@
+from __future__ import annotations
+import importlib
+
+# runner name -> (module, one-line description). Modules are imported only when
+# a runner is resolved, so listing or dispatching costs nothing up front.
+RUNNERS: dict[str, tuple[str, str]] = {
+    "digest": ("pcc.digest", "Generic tender digest (ITT, Bilag10, Rammeavtale, krav/price CSVs)"),
+    "ssa_v": ("pcc.ssa_v", "SSA-V service/maintenance packs"),
+    "renhold_facility": ("pcc.renhold_facility", "Cleaning services (renhold) packs"),
+    "ns8407_total": ("pcc.ns8407_total", "NS 8407 total contracts"),
+    "hso_byggc": ("pcc.hso_byggc", "HSØ Bygg C building packs"),
+    "dps": ("pcc.dps", "Dynamic purchasing systems, SSA-B, DPA 2020"),
+    "ns8406_simple": ("pcc.ns8406_simple", "NS 8406 simplified construction contracts"),
+    "multilot_office": ("pcc.multilot_office", "Multi-lot office supplies"),
+    "hmn_invasive": ("pcc.hmn_invasive", "HMN medical equipment (invasive pressure sets)"),
+}
+
+# subcommand -> (module, attribute, description)
+COMMANDS: dict[str, tuple[str, str, str]] = {
+    "verify": ("pcc.verify", "main", "Recompute the receipts root and compare to root.txt"),
+    "prove": ("pcc.prove", "main", "Emit a Merkle inclusion proof for one receipt"),
+    "detect": ("pcc.detect", "main", "Score runner families for a tender zip by member names"),
+    "patterns": ("pcc.patterns", "main", "Merge pattern_stats.json files and list the costliest patterns"),
+    "receipt-diff": ("pcc.receipt_diff", "main", "Diff two receipts.jsonl files"),
+    "receipts": ("pcc.receipt_bin", "main", "Convert receipts between canonical JSONL and the binary format"),
+    "index": ("pcc.warehouse", "index_main", "Ingest run receipts and matrices into the SQLite warehouse"),
+    "query": ("pcc.warehouse", "query_main", "Run read-only SQL over the SQLite warehouse"),
+    "batch": ("pcc.batch", "main", "Digest a directory or glob of tender zips over a process pool"),
+    "serve": ("pcc.serve", "main", "Prefork daemon serving digests over a socket"),
+}
+for _name, (_mod, _desc) in RUNNERS.items():
+    COMMANDS[_name.replace("_", "-")] = (_mod, "main", _desc)
+
+def load_runner(name: str):
+    return importlib.import_module(RUNNERS[name][0])
+
+def resolve(command: str):
+    mod, attr, _ = COMMANDS[command]
+    return getattr(importlib.import_module(mod), attr)
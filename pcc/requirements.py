@@ -1,5 +1,6 @@
 from __future__ import annotations
 import os, zipfile, hashlib, re
+from .patterns import rx
 
 MANDATORY_MARKERS = [r"\bMUST\b", r"\bSHALL\b", r"\bREQUIRED\b", r"\bSKAL\b", r"\bMÅ\b"]
 STOPWORDS = {
@@ -16,7 +17,7 @@ def _normalize_text(s: str) -> str:
     return s.replace("\r\n","\n").replace("\r","\n")
 
 def _keywords(s: str):
-    toks = re.findall(r"[A-Za-zÅÄÖÆØåäöæø]{3,}", s)
+    toks = rx.findall(r"[A-Za-zÅÄÖÆØåäöæø]{3,}", s)
     toks = [t.lower() for t in toks if t.lower() not in STOPWORDS]
     seen = []
     for t in toks:
@@ -44,7 +45,7 @@ def extract_requirements(tender_zip_path: str):
                 if not line_stripped:
                     offset += len(line) + 1
                     continue
-                if any(re.search(p, line_stripped, flags=re.IGNORECASE) for p in MANDATORY_MARKERS):
+                if any(rx.search(p, line_stripped, flags=re.IGNORECASE) for p in MANDATORY_MARKERS):
                     reqs.append({
                         "req_id": f"R-{rid:04d}",
                         "priority": "mandatory",
@@ -0,0 +1,129 @@
+from __future__ import annotations
+import re
+from typing import Iterator, List, Optional, Tuple
+from .patterns import rx
+
+WINDOW = 3000
+
+# Heading lines: "6.1 Tildelingskriterier", "Kapittel 3 ...", "Bilag 5 - Tjenestenivå",
+# "Vedlegg 02 Kravspesifikasjon". Numbered titles start with a capital and do not end
+# in a full stop, a digit or %, which keeps sentences and rows like "1. Pris 50 %" out;
+# parse() also drops numbers that do not continue the heading sequence.
+_HEADING = re.compile(
+    r"^[ \t]*(?:"
+    r"(?P<att>(?:Bilag|Vedlegg)[ \t]+\d{1,2}[A-Za-z]?)\b[ \t]*[-:.]?[ \t]*(?P<atitle>[^\n]{0,100}?)"
+    r"|Kapittel[ \t]+(?P<chap>\d{1,2})\b[ \t]*[-:.]?[ \t]*(?P<ctitle>[^\n]{0,100}?)"
+    r"|(?P<num>\d{1,2}(?:\.\d{1,2}){0,4})\.?[ \t]+(?P<ntitle>[A-ZÆØÅ][^\n]{0,99}?)"
+    r")[ \t]*$", re.M)
+
+class Section:
+    __slots__ = ("number", "title", "level", "start", "end")
+    def __init__(self, number: str, title: str, level: int, start: int, end: int):
+        self.number, self.title, self.level, self.start, self.end = number, title, level, start, end
+    def __repr__(self):
+        return f"Section({self.number!r}, {self.title!r}, {self.start}:{self.end})"
+
+def parse(text: str) -> List[Section]:
+    """Headings of text in document order, each spanning to the next heading of the same or a higher level.
+
+    Bilag/Vedlegg are level 0, "Kapittel N" and "N Title" level 1, "N.M Title" level 2 and so on.
+    A numbered heading must continue the sequence: above the last one at its level, and
+    under the last one a level up ("6.2" after "6" or "6.1"). A numbered list inside a
+    section ("1 Pris" under "6 Tildelingskriterier") is then read as text, not headings.
+    """
+    out: List[Section] = []
+    open_: List[Section] = []
+    last: List[Tuple[int, ...]] = []  # numbers of the last accepted heading per level, outermost first
+    for m in _HEADING.finditer(text):
+        if m.group("att"):
+            if m.group("atitle").endswith("."):
+                continue
+            num, title, level = " ".join(m.group("att").split()), m.group("atitle"), 0
+            last = []  # an attachment numbers its headings afresh
+        elif m.group("chap"):
+            num, title, level = m.group("chap"), m.group("ctitle"), 1
+            last = [(int(num),)]
+        else:
+            title = m.group("ntitle")
+            if title[-1] in ".%" or title[-1].isdigit():
+                continue
+            num = m.group("num")
+            n = tuple(int(x) for x in num.split("."))
+            level, k = len(n), len(last)
+            if level <= k:
+                prev = last[level - 1]
+                if n[:-1] != prev[:-1] or n[-1] <= prev[-1]:
+                    continue
+            elif k and n[:k] != last[-1]:
+                continue
+            last = [n[:i] for i in range(1, level + 1)]
+        while open_ and open_[-1].level >= level:
+            open_.pop().end = m.start()
+        s = Section(num, title.strip(), level, m.start(), len(text))
+        out.append(s)
+        open_.append(s)
+    return out
+
+class SectionIndex:
+    """Heading tree of one text, with searches bounded to named sections or windows."""
+    def __init__(self, text: str):
+        self.text = text
+        self.sections = parse(text)
+
+    def find(self, name: str) -> List[Section]:
+        """Sections numbered name ("6.1", "Bilag 5"), else those whose number and title match name as a regex, case-insensitively."""
+        key = " ".join(name.split())
+        hits = [s for s in self.sections if s.number.lower() == key.lower()]
+        if hits:
+            return hits
+        rxn = re.compile(name, re.I)
+        return [s for s in self.sections if rxn.search(f"{s.number} {s.title}")]
+
+    def windows(self, start: int = 0, end: Optional[int] = None, size: int = WINDOW) -> Iterator[Tuple[int, int]]:
+        """Overlapping spans of about 2*size chars, cut at line ends, stepping size.
+
+        Every stretch of at most size chars inside start:end lies wholly in one of them.
+        """
+        t = self.text
+        end = len(t) if end is None else end
+        a = start
+        while True:
+            b = t.find("\n", a + 2 * size)
+            b = end if b < 0 or b > end else b
+            yield (t.rfind("\n", start, a) + 1 if a > start else start), b
+            if b >= end:
+                return
+            a += size
+
+    def spans(self, section: Optional[str] = None, window: Optional[int] = WINDOW) -> Iterator[Tuple[int, int]]:
+        secs = self.find(section) if section else []
+        bounds: List[Tuple[int, int]] = []
+        for s in secs:  # a subsection of a section already listed adds nothing
+            if not bounds or s.start >= bounds[-1][1]:
+                bounds.append((s.start, s.end))
+        for a, b in bounds or [(0, len(self.text))]:
+            if window:
+                yield from self.windows(a, b, window)
+            else:
+                yield a, b
+
+    def search(self, pattern, flags: int = 0, section: Optional[str] = None, window: Optional[int] = WINDOW):
+        """rx.search in the sections found for section, then (on a miss, or when there are none) the whole
+        text; unless window is None, matches are bounded to about window chars.
+
+        A `.*` between two terms then spans a clause, not the rest of the document.
+        """
+        m = rx.search_within(pattern, self.text, self.spans(section, window), flags)
+        if m is None and section and self.find(section):
+            # the index only narrows where to look first; a miss there is checked over the whole text
+            m = rx.search_within(pattern, self.text, self.spans(None, window), flags)
+        return m
+
+_last: Optional[SectionIndex] = None
+
+def index(text: str) -> SectionIndex:
+    """The SectionIndex of text; consecutive calls on the same text object parse it once."""
+    global _last
+    if _last is None or _last.text is not text:
+        _last = SectionIndex(text)
+    return _last
@@ -0,0 +1,181 @@
+from __future__ import annotations
+import importlib, inspect, ipaddress, json, os, pkgutil, signal, socket, socketserver, sys, time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, List
+from .batch import run_one, tender_name
+from .registry import RUNNERS, load_runner
+
+def warm() -> Dict[str, int]:
+    """Import every runner and extractor module and touch each extractor once.
+
+    Calling extract_* with empty strings compiles the patterns they use into
+    the pattern registry before workers fork, so children share them
+    copy-on-write instead of compiling per request.
+    """
+    import pcc
+    mods = 0; fns = 0
+    for r in RUNNERS:
+        load_runner(r)
+        mods += 1
+    for info in pkgutil.iter_modules(pcc.__path__):
+        if not info.name.startswith("extract_"):
+            continue
+        mod = importlib.import_module(f"pcc.{info.name}")
+        mods += 1
+        for name, fn in inspect.getmembers(mod, inspect.isfunction):
+            if not name.startswith("extract_") or fn.__module__ != mod.__name__:
+                continue
+            try:
+                fn(*[""] * len(inspect.signature(fn).parameters))
+                fns += 1
+            except Exception:
+                pass
+    return {"modules": mods, "extractors": fns}
+
+def _inside(root: str, path: str) -> bool:
+    root = os.path.realpath(root)
+    return os.path.commonpath([root, os.path.realpath(path)]) == root
+
+def _loopback(host: str) -> bool:
+    try:
+        addrs = {a[4][0] for a in socket.getaddrinfo(host, None)}
+    except socket.gaierror:
+        return False
+    return bool(addrs) and all(ipaddress.ip_address(a.split("%")[0]).is_loopback for a in addrs)
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "pcc-serve"
+    def log_message(self, fmt, *args):
+        sys.stderr.write("pcc-serve[%d] %s\n" % (os.getpid(), fmt % args))
+    def _send(self, code: int, obj: Dict) -> None:
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {"ok": True, "pid": os.getpid(), "jobs": self.server.jobs})
+        else:
+            self._send(404, {"ok": False, "error": "not found"})
+    def do_POST(self):
+        if self.path != "/digest":
+            self._send(404, {"ok": False, "error": "not found"}); return
+        try:
+            n = int(self.headers.get("Content-Length") or 0)
+            req = json.loads(self.rfile.read(n) or b"{}")
+            zip_path = req["tender_zip"]
+        except (ValueError, KeyError):
+            self._send(400, {"ok": False, "error": "body must be JSON with tender_zip"}); return
+        runner = req.get("runner", "digest")
+        if runner not in RUNNERS:
+            self._send(400, {"ok": False, "error": f"unknown runner {runner}"}); return
+        # everything a request makes the runner write or unpickle stays under --out-root: out (relative to
+        # it when not absolute) and --out/--since/--cache-dir in args, checked as the runner will parse them
+        root = self.server.out_root
+        out = os.path.join(root, req.get("out") or f"run-{tender_name(zip_path)}-{int(time.time() * 1000)}")
+        extra = [str(a) for a in req.get("args", [])]
+        try:
+            ns = load_runner(runner).build_parser().parse_args(["--tender-zip", zip_path, "--out", out] + extra)
+        except SystemExit:
+            self._send(400, {"ok": False, "error": "args do not parse for runner " + runner}); return
+        bad = [p for p in (ns.out, getattr(ns, "since", None), getattr(ns, "cache_dir", None)) if p and not _inside(root, p)]
+        if bad:
+            self._send(403, {"ok": False, "error": f"{bad[0]} is outside the out root {root}"}); return
+        t0 = time.perf_counter()
+        res = run_one(runner, zip_path, out, extra)
+        res["elapsed_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+        self.server.jobs += 1
+        self._send(200 if res["ok"] else 500, res)
+
+class _UnixServer(socketserver.UnixStreamServer):
+    def get_request(self):
+        conn, _ = self.socket.accept()
+        return conn, ("unix", 0)
+
+def _listen(args) -> socket.socket:
+    if args.socket:
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+        s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        s.bind(args.socket)
+    else:
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind((args.host, args.port))
+    s.listen(128)
+    return s
+
+def _worker(lsock: socket.socket, args) -> None:
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    cls = _UnixServer if args.socket else HTTPServer
+    srv = cls(lsock.getsockname(), Handler, bind_and_activate=False)
+    srv.socket.close()
+    srv.socket = lsock
+    srv.out_root = args.out_root
+    srv.jobs = 0
+    while args.max_jobs <= 0 or srv.jobs < args.max_jobs:
+        srv.handle_request()
+    os._exit(0)
+
+def _spawn(lsock, args) -> int:
+    pid = os.fork()
+    if pid == 0:
+        try:
+            _worker(lsock, args)
+        finally:
+            os._exit(1)
+    return pid
+
+def main(argv=None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(prog="pcc-serve", description="Warm PCC once, prefork workers and serve digests over a Unix socket or localhost HTTP")
+    ap.add_argument("--socket", help="Unix socket path (default: TCP on --host/--port)")
+    ap.add_argument("--host", default="127.0.0.1", help="Loopback address to listen on (others need --allow-remote)")
+    ap.add_argument("--allow-remote", action="store_true", help="Allow a non-loopback --host; anyone who can reach it can run digests")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    ap.add_argument("--max-jobs", type=int, default=0, help="Recycle a worker after N jobs (0 = never)")
+    ap.add_argument("--out-root", default="out", help="Runs go here; a request's out and path args must resolve inside it")
+    args = ap.parse_args(argv)
+    if not args.socket and not args.allow_remote and not _loopback(args.host):
+        ap.error(f"--host {args.host} is not a loopback address; pass --allow-remote to serve it anyway")
+    args.out_root = os.path.realpath(args.out_root)
+
+    stats = warm()
+    lsock = _listen(args)
+    where = args.socket or f"http://{args.host}:{lsock.getsockname()[1]}"
+    children: List[int] = [_spawn(lsock, args) for _ in range(max(1, args.workers))]
+    print(json.dumps({"serving": where, "workers": len(children), **stats}), flush=True)
+
+    stopping = False
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    while children:
+        try:
+            pid, _ = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        if pid in children:
+            children.remove(pid)
+            if not stopping:
+                children.append(_spawn(lsock, args))
+    lsock.close()
+    if args.socket and os.path.exists(args.socket):
+        os.unlink(args.socket)
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,26 @@
 import re, json
+from .patterns import rx
+
+# (feature_key, needle, sl0, sl1, sl2, param_name, ref_requirement_id)
+FEATURES = [
+    ("time_price_only","Timepris for arbeid",True,False,False,None,None),
+    ("preventive_maintenance","Preventivt vedlikehold",False,True,True,None,None),
+    ("pv_parts_and_recommended","Deler som inngår i produsentens PV",False,True,True,None,None),
+    ("safety_check","Sikkerhetskontroll",False,True,True,None,None),
+    ("security_updates","Sikkerhetsoppdateringer",False,True,True,None,None),
+    ("spare_parts_lead","Maksimum xx timers (y døgn) leveringstid på reservedeler",True,True,True,"parts_lead_time","L3"),
+    ("all_service_costs_included","Alle serviceutgifter inkludert",False,False,True,None,None),
+    ("acute_response_time","Maksimum oppmøtetid ved akuttservice",False,False,True,"acute_response_time","L5"),
+    ("phone_support_1h","Telefonsupport innen 1 time",True,True,True,None,None),
+    ("os_av_updates","Jevnlig sikkerhetsoppdatering av virusbeskyttelse og operativsystem",True,True,True,None,None),
+    ("software_upgrades","Alle Programvareoppdateringer inkludert nye versjoner",True,True,True,None,None),
+]
+
 def extract(text, asset_id):
-    t = text.lower()
+    found = rx.literals(text, [f[1] for f in FEATURES])
     rows = []
-    def add(key, needle, sl0, sl1, sl2, param_name=None, ref=None):
-        if needle.lower() in t:
+    for key, needle, sl0, sl1, sl2, param_name, ref in FEATURES:
+        if needle in found:
             rows.append({
                 "feature_key": key,
                 "feature_text": needle,
@@ -15,17 +32,6 @@ def extract(text, asset_id):
                 "ref_requirement_id": ref or "",
                 "source_snippet": needle
             })
-    add("time_price_only","Timepris for arbeid",True,False,False,None,None)
-    add("preventive_maintenance","Preventivt vedlikehold",False,True,True,None,None)
-    add("pv_parts_and_recommended","Deler som inngår i produsentens PV",False,True,True,None,None)
-    add("safety_check","Sikkerhetskontroll",False,True,True,None,None)
-    add("security_updates","Sikkerhetsoppdateringer",False,True,True,None,None)
-    add("spare_parts_lead","Maksimum xx timers (y døgn) leveringstid på reservedeler",True,True,True,"parts_lead_time","L3")
-    add("all_service_costs_included","Alle serviceutgifter inkludert",False,False,True,None,None)
-    add("acute_response_time","Maksimum oppmøtetid ved akuttservice",False,False,True,"acute_response_time","L5")
-    add("phone_support_1h","Telefonsupport innen 1 time",True,True,True,None,None)
-    add("os_av_updates","Jevnlig sikkerhetsoppdatering av virusbeskyttelse og operativsystem",True,True,True,None,None)
-    add("software_upgrades","Alle Programvareoppdateringer inkludert nye versjoner",True,True,True,None,None)
     receipts = []
     for r in rows:
         receipts.append({
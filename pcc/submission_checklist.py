@@ -1,4 +1,5 @@
 import re
+from .patterns import rx
 
 def extract_from_itt(text):
     rows=[]
@@ -10,7 +11,7 @@ def extract_from_itt(text):
             phase="prequal"
         elif "tilbud" in low and "dokument" in low:
             phase="offer"
-        for m in re.finditer(r'\bDOK\s*0?(\d{1,3})\b', line, flags=re.I):
+        for m in rx.finditer(r'\bDOK\s*0?(\d{1,3})\b', line, flags=re.I):
             code_num=m.group(1)
             code=f"DOK{int(code_num):02d}"
             title=line[m.end():].strip(" :\u2013-")
@@ -1,16 +1,17 @@
 import re
+from .patterns import rx
 
 def scan_text_params(text):
     params = {}
     receipts = []
 
-    m = re.search(r'(overtakelse|overlevering|innflytting)[^\n\r]{0,60}(\d{1,3})\s*måneder', text, flags=re.I)
+    m = rx.search(r'(overtakelse|overlevering|innflytting)[^\n\r]{0,60}(\d{1,3})\s*måneder', text, flags=re.I)
     if m:
         val = int(m.group(2))
         params['spec:handover_months_max'] = val
         receipts.append({'type':'spec_param','key':'handover_months_max','value':val,'unit':'months','snippet':m.group(0)})
 
-    m = re.search(r'(dagmulkt|dagbot|forsinkelse)[^\n\r]{0,80}([0-9][0-9 .]{1,12})\s*(kr|kroner)[^\n\r]{0,30}\bper\b[^\n\r]{0,5}(arbeidsdag|kalenderdag)', text, flags=re.I)
+    m = rx.search(r'(dagmulkt|dagbot|forsinkelse)[^\n\r]{0,80}([0-9][0-9 .]{1,12})\s*(kr|kroner)[^\n\r]{0,30}\bper\b[^\n\r]{0,5}(arbeidsdag|kalenderdag)', text, flags=re.I)
     if m:
         raw = m.group(2)
         val = int(raw.replace(' ', '').replace('.', ''))
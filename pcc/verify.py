@@ -1,22 +1,43 @@
 from __future__ import annotations
 def main(argv=None) -> int:
-    import argparse
-    from .merkle import merkle_root
+    import argparse, json, os
+    from .merkle import BUF_SIZE, MANIFEST_NAME, ROOT_FORMAT, file_root, leaf_hash, read_root, root_from_proof
     ap = argparse.ArgumentParser(prog="pcc-verify", description="Recompute Merkle root over receipts.jsonl and compare to root.txt")
-    ap.add_argument("--receipts", required=True, help="Path to receipts.jsonl")
+    ap.add_argument("--receipts", help="Path to receipts.jsonl (or its binary form, see pcc-receipts)")
     ap.add_argument("--root", required=True, help="Path to root.txt")
+    ap.add_argument("--mmap", action="store_true", help="Read receipts.jsonl through mmap instead of fixed-size buffers")
+    ap.add_argument("--buf-size", type=int, default=BUF_SIZE, help="Read buffer in bytes (default 1 MiB)")
+    ap.add_argument("--manifest", nargs="?", const="", metavar="PATH",
+                    help="Also re-hash the files listed in manifest.json (default: next to root.txt) against the digest root.txt binds")
+    ap.add_argument("--proof", help="Inclusion proof from pcc-prove: checks that one receipt against root.txt, without receipts.jsonl")
     args = ap.parse_args(argv)
-    with open(args.receipts, "rb") as f:
-        lines = f.read().splitlines(keepends=True)
-    computed = merkle_root(lines)
-    want = None
-    with open(args.root, "r", encoding="utf-8") as f:
-        for line in f:
-            if line.startswith("root:"):
-                want = line.split(":",1)[1].strip()
-                break
-    ok = bool(want) and computed == want
-    print(f'{{"verified": {str(ok).lower()}, "computed":"{computed}","expected":"{want or ""}"}}')
+    if not args.receipts and not args.proof and args.manifest is None:
+        ap.error("one of --receipts, --proof or --manifest is required")
+    meta = read_root(args.root)
+    want, fmt = meta.get("root"), meta["root_format"]
+    if args.proof:
+        with open(args.proof, "r", encoding="utf-8") as f:
+            p = json.load(f)
+        r = None
+        # a flat root commits to the whole file only; it has no inclusion proofs
+        if fmt == ROOT_FORMAT and p.get("proof_format") == ROOT_FORMAT and str(p.get("size")) == meta.get("lines", str(p.get("size"))):
+            r = root_from_proof(leaf_hash(p["receipt"].encode("utf-8")), p["index"], p["size"], [bytes.fromhex(h) for h in p["path"]])
+        computed = r.hex() if r else ""
+        ok = bool(want) and computed == want
+        print(json.dumps({"verified": ok, "format": fmt, "index": p.get("index"), "size": p.get("size"), "computed": computed, "expected": want or ""}))
+        return 0 if ok else 1
+    m = None
+    if args.manifest is not None:
+        from .manifest import check_manifest
+        m = check_manifest(args.manifest or os.path.join(os.path.dirname(os.path.abspath(args.root)), MANIFEST_NAME), meta.get("manifest"))
+    mok = m is None or (m["bound"] and not m["mismatched"])
+    if not args.receipts:
+        print(json.dumps({"verified": mok, "manifest": m}))
+        return 0 if mok else 1
+    computed, _ = file_root(args.receipts, fmt, args.buf_size, args.mmap)
+    ok = bool(want) and computed == want and mok
+    extra = "" if m is None else f',"manifest":{json.dumps(m)}'
+    print(f'{{"verified": {str(ok).lower()}, "computed":"{computed}","expected":"{want or ""}","format":"{fmt}"{extra}}}')
     return 0 if ok else 1
 if __name__ == "__main__":
     raise SystemExit(main())
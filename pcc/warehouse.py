@@ -0,0 +1,213 @@
+from __future__ import annotations
+import csv, glob, json, os, sqlite3, time
+from typing import Dict, Iterator, List, Optional, Tuple
+from .canonical import canonical_json
+from .merkle import read_root
+from .receipt_bin import receipt_lines
+
+# A run is a directory with proof/root.txt (out/run-*, or out/run-*/<family> for multi-family digests).
+# Its receipts and the matrix CSVs below get typed tables; every table carries run_id and asset_id.
+SCHEMA_VERSION = 1
+DEFAULT_DB = os.path.join("out", "pcc-index.sqlite")
+
+# matrix csv -> columns as (csv header, column, sqlite type), and the indexed columns
+MATRIX: Dict[str, Tuple[List[Tuple[str, str, str]], List[Tuple[str, ...]]]] = {
+    "contract_terms": ([("key", "key", "TEXT"), ("value", "value", "TEXT")], [("key", "asset_id")]),
+    "requirements_matrix": ([("req_id", "req_id", "TEXT"), ("section", "section", "TEXT"), ("kind", "kind", "TEXT"),
+                             ("prompt_kind", "prompt_kind", "TEXT"), ("value_hint", "value_hint", "TEXT"), ("krav_text", "krav_text", "TEXT"),
+                             ("source_file", "source_file", "TEXT"), ("source_sheet", "source_sheet", "TEXT"), ("source_row", "source_row", "INTEGER")],
+                            [("kind", "req_id", "asset_id")]),
+    "criteria_and_formula": ([("criterion", "criterion", "TEXT"), ("weight_pct", "weight_pct", "REAL"), ("group", "group_name", "TEXT"),
+                              ("total_pct", "total_pct", "REAL"), ("price_model", "price_model", "TEXT"), ("scoring_model", "scoring_model", "TEXT"),
+                              ("model_anchor", "model_anchor", "TEXT")],
+                             [("group_name", "criterion", "asset_id")]),
+}
+
+def _schema() -> str:
+    out = [
+        "CREATE TABLE IF NOT EXISTS runs (run_id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, asset_id TEXT, root TEXT,"
+        " root_format TEXT, manifest TEXT, ts TEXT, tool_version TEXT, receipts INTEGER, indexed_at TEXT)",
+        "CREATE TABLE IF NOT EXISTS receipts (run_id INTEGER NOT NULL, line INTEGER NOT NULL, type TEXT, key TEXT, asset_id TEXT,"
+        " value TEXT, value_num REAL, source_file TEXT, json TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS receipts_type_key_asset ON receipts(type, key, asset_id)",
+        "CREATE INDEX IF NOT EXISTS receipts_run ON receipts(run_id)",
+    ]
+    for table, (cols, indexes) in MATRIX.items():
+        num = ", value_num REAL" if table == "contract_terms" else ""
+        defs = ", ".join(f"{c} {t}" for _, c, t in cols)
+        out.append(f"CREATE TABLE IF NOT EXISTS {table} (run_id INTEGER NOT NULL, asset_id TEXT, {defs}{num}, row_json TEXT)")
+        for ix in indexes:
+            out.append(f"CREATE INDEX IF NOT EXISTS {table}_{'_'.join(ix)} ON {table}({', '.join(ix)})")
+        out.append(f"CREATE INDEX IF NOT EXISTS {table}_run ON {table}(run_id)")
+    return ";\n".join(out) + ";"
+
+def connect(db: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(os.path.abspath(db)), exist_ok=True)
+    con = sqlite3.connect(db)
+    ver = con.execute("PRAGMA user_version").fetchone()[0]
+    if ver not in (0, SCHEMA_VERSION):
+        con.close()
+        raise ValueError(f"{db} has schema version {ver}, this pcc writes {SCHEMA_VERSION}; index into a new file")
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
+    con.executescript(_schema())
+    con.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    return con
+
+def _num(v) -> Optional[float]:
+    # numbers, numeric strings and True/False (as 1/0), so "value_num > 30" works on any of them
+    if isinstance(v, bool) or v in ("True", "False", "true", "false"):
+        return float(v in (True, "True", "true"))
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, str):
+        try:
+            return float(v.strip().replace(",", "."))
+        except ValueError:
+            return None
+    return None
+
+def _text(v) -> Optional[str]:
+    if v is None or isinstance(v, str):
+        return v
+    return canonical_json(v)[:-1].decode("utf-8")
+
+def _typed(v: str, t: str):
+    if v == "" or v is None:
+        return None
+    if t == "TEXT":
+        return v
+    n = _num(v)
+    return int(n) if t == "INTEGER" and n is not None and n.is_integer() else n
+
+def find_runs(specs: List[str]) -> List[str]:
+    """Run directories under the given dirs or globs: each directory holding proof/root.txt."""
+    runs = set()
+    for spec in specs:
+        for top in glob.glob(spec) or [spec]:
+            for root_txt in glob.glob(os.path.join(glob.escape(top), "**", "proof", "root.txt"), recursive=True):
+                runs.add(os.path.abspath(os.path.dirname(os.path.dirname(root_txt))))
+    return sorted(runs)
+
+def _receipts(path: str, run_id: int, seen: list) -> Iterator[tuple]:
+    dec = json.JSONDecoder().decode
+    for i, line in enumerate(receipt_lines(path)):
+        line = line.rstrip(b"\n")
+        if not line:
+            continue
+        s = line.decode("utf-8")
+        r = dec(s)
+        if not isinstance(r, dict):
+            yield run_id, i, None, None, None, None, None, None, s
+            continue
+        a = r.get("asset_id")
+        if len(seen) < 2 and isinstance(a, str) and a not in seen:
+            seen.append(a)
+        v = r.get("value")
+        yield (run_id, i, _text(r.get("type")), _text(r.get("key")), _text(r.get("asset_id")), _text(v), _num(v),
+               _text(r.get("source_file")), s)
+
+def _matrix(run_dir: str, table: str, run_id: int, asset_id: Optional[str]) -> Iterator[tuple]:
+    path = os.path.join(run_dir, "matrix", table + ".csv")
+    if not os.path.exists(path):
+        return
+    cols = MATRIX[table][0]
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            vals = [_typed(row.get(h), t) for h, _, t in cols]
+            if table == "contract_terms":
+                vals.append(_num(row.get("value")))
+            yield (run_id, asset_id, *vals, json.dumps(row, ensure_ascii=False))
+
+def index_run(con: sqlite3.Connection, run_dir: str) -> Tuple[str, int]:
+    """Index one run; ("unchanged", 0) when its root (and manifest) are what the database already holds."""
+    path = os.path.abspath(run_dir)
+    meta = read_root(os.path.join(path, "proof", "root.txt"))
+    old = con.execute("SELECT run_id, root, manifest FROM runs WHERE path = ?", (path,)).fetchone()
+    if old and (old[1], old[2]) == (meta.get("root"), meta.get("manifest")):
+        return "unchanged", 0
+    with con:
+        if old:
+            run_id = old[0]
+            for table in ("receipts", *MATRIX):
+                con.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+        else:
+            run_id = con.execute("INSERT INTO runs (path) VALUES (?)", (path,)).lastrowid
+        receipts, seen = os.path.join(path, "proof", "receipts.jsonl"), []
+        n = 0
+        if os.path.exists(receipts):
+            n = con.executemany("INSERT INTO receipts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", _receipts(receipts, run_id, seen)).rowcount
+        # receipts without an asset_id (contract terms, say) belong to the run's asset; a batch log has many, so they stay NULL
+        asset_id = None if len(seen) > 1 else seen[0] if seen else os.path.basename(path)
+        if asset_id is not None:
+            con.execute("UPDATE receipts SET asset_id = ? WHERE run_id = ? AND asset_id IS NULL", (asset_id, run_id))
+        for table, (cols, _) in MATRIX.items():
+            width = 3 + len(cols) + (table == "contract_terms")
+            con.executemany(f"INSERT INTO {table} VALUES ({', '.join('?' * width)})", _matrix(path, table, run_id, asset_id))
+        con.execute("UPDATE runs SET asset_id = ?, root = ?, root_format = ?, manifest = ?, ts = ?, tool_version = ?, receipts = ?,"
+                    " indexed_at = ? WHERE run_id = ?",
+                    (asset_id, meta.get("root"), meta["root_format"], meta.get("manifest"), meta.get("ts"), meta.get("tool_version"), n,
+                     time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), run_id))
+    return "indexed", n
+
+def prune(con: sqlite3.Connection) -> int:
+    """Drop runs whose directory is gone."""
+    gone = [r for r, p in con.execute("SELECT run_id, path FROM runs") if not os.path.isdir(p)]
+    with con:
+        for run_id in gone:
+            for table in ("receipts", *MATRIX, "runs"):
+                con.execute(f"DELETE FROM {table} WHERE run_id = ?", (run_id,))
+    return len(gone)
+
+def index_main(argv=None) -> int:
+    import argparse
+    ap = argparse.ArgumentParser(prog="pcc-index", description="Ingest run outputs (proof/receipts.jsonl, matrix/*.csv) into a SQLite warehouse")
+    ap.add_argument("runs", nargs="*", default=[os.path.join("out", "run-*")], help="Run dirs, parents of runs, or globs (default: out/run-*)")
+    ap.add_argument("--db", default=DEFAULT_DB)
+    ap.add_argument("--prune", action="store_true", help="Also drop runs whose directory no longer exists")
+    args = ap.parse_args(argv)
+    t0 = time.perf_counter()
+    con = connect(args.db)
+    counts = {"indexed": 0, "unchanged": 0, "receipts": 0}
+    try:
+        for run in find_runs(args.runs):
+            status, n = index_run(con, run)
+            counts[status] += 1
+            counts["receipts"] += n
+        if args.prune:
+            counts["pruned"] = prune(con)
+    finally:
+        con.close()
+    print(json.dumps({"db": args.db, **counts, "elapsed_ms": round((time.perf_counter() - t0) * 1000)}))
+    return 0
+
+def query_main(argv=None) -> int:
+    import argparse, sys
+    ap = argparse.ArgumentParser(prog="pcc-query", description="Run SQL over the pcc-index warehouse (read-only)")
+    ap.add_argument("sql", help="SQL statement, or @file.sql")
+    ap.add_argument("--db", default=DEFAULT_DB)
+    ap.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    args = ap.parse_args(argv)
+    sql = args.sql
+    if sql.startswith("@"):
+        with open(sql[1:], "r", encoding="utf-8") as f:
+            sql = f.read()
+    if not os.path.exists(args.db):
+        ap.error(f"{args.db} does not exist; run pcc-index first")
+    con = sqlite3.connect(f"file:{os.path.abspath(args.db)}?mode=ro", uri=True)
+    try:
+        cur = con.execute(sql)
+        cols = [d[0] for d in cur.description or ()]
+        if args.format == "csv":
+            w = csv.writer(sys.stdout)
+            w.writerow(cols)
+            w.writerows(cur)
+        else:
+            for row in cur:
+                sys.stdout.write(json.dumps(dict(zip(cols, row)), ensure_ascii=False) + "\n")
+    except sqlite3.Error as e:
+        sys.stderr.write(f"pcc-query: {e}\n")
+        return 1
+    finally:
+        con.close()
+    return 0
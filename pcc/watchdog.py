@@ -0,0 +1,50 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+DEFAULT_BUDGET_S = 120.0
+REARM_S = 0.05
+
+class ExtractorTimeout(Exception):
+    pass
+
+def can_bound() -> bool:
+    import signal, threading
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+@contextmanager
+def time_budget(seconds: Optional[float]) -> Iterator[None]:
+    """Raise ExtractorTimeout in the block once it has run for seconds of wall-clock time.
+
+    Uses SIGALRM, which the re engine also honours inside long matches. The
+    alarm repeats every REARM_S until the block is left. Once it has fired
+    the block ends in ExtractorTimeout however it ends: an extractor that
+    catches the timeout and returns, or raises something else, still gets
+    it on the way out, so a cut-short result never passes for a whole one.
+    Without setitimer or off the main thread the block runs unbounded.
+    """
+    if not seconds or seconds <= 0 or not can_bound():
+        yield
+        return
+    import signal
+    live, fired = [True], [False]
+    def on_alarm(signum, frame):
+        if live[0]:
+            fired[0] = True
+            raise ExtractorTimeout(seconds)
+    prev = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds, REARM_S)
+    try:
+        yield
+    except ExtractorTimeout:
+        raise
+    except Exception as e:
+        if fired[0]:
+            raise ExtractorTimeout(seconds) from e
+        raise
+    finally:
+        live[0] = False
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, prev)
+    if fired[0]:
+        raise ExtractorTimeout(seconds)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Byte-for-byte check and benchmark of pcc.canonical.canonical_json against json.dumps.
+
+First encodes a fuzz set (every scalar kind, NaN/Infinity, nested values,
+escapes, % in keys, non-str keys, dict subclasses, one-key and empty rows)
+and --rows synthetic receipts of the hot types (krav_req, contract_term,
+service_feature, price_schema) with both encoders and fails on the first
+line that differs. Then times both over the receipts; fails below
+--min-speedup.
+"""
+import argparse, enum, json, os, random, sys, time
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pcc.canonical import canonical_json
+
+def reference(obj):
+    s = json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return (s + "\n").encode("utf-8")
+
+class Level(enum.IntEnum):
+    LOW = 1
+
+def fuzz(rng, n):
+    strs = ["", "%", "%s", "a\"b\\c", "æøå ÆØÅ", "tab\tnl\n", "\x00\x1f\x7f", " ", "😀", "x" * 300]
+    scalars = [True, False, None, 0, 1, -1, 2 ** 70, 1.0, -0.0, 1e-9, 1.5e300, float("nan"), float("inf"), float("-inf"), Level.LOW]
+    def val(d=0):
+        r = rng.random()
+        if r < .4:
+            return rng.choice(strs) + str(rng.randint(0, 9))
+        if r < .7:
+            return rng.choice(scalars)
+        if r < .85 and d < 3:
+            return {rng.choice(strs): val(d + 1) for _ in range(rng.randint(0, 3))}
+        if d < 3:
+            return [val(d + 1) for _ in range(rng.randint(0, 3))]
+        return rng.randint(0, 10 ** 6)
+    keys = ["type", "key", "value", "asset_id", "%", "%(x)s", "ø", "", "\"q\""]
+    out = [{}, {"type": "x"}, {1: "a", 2: "b"}, OrderedDict(b=1, a=2), [1, {"b": 1, "a": 2}], "s", 3, None]
+    for _ in range(n):
+        out.append({rng.choice(keys): val() for _ in range(rng.randint(0, 6))})
+    return out
+
+def receipts(rng, n):
+    files = ["Kravspesifikasjon.csv", "Rammeavtale.docx", "Prisskjema.xlsx", "SSA-V_Bilag5_SLA.docx"]
+    for j in range(n):
+        asset = f"tender:pack/t{j // 500}"
+        k = j % 4
+        if k == 0:
+            yield {"type": "krav_req", "asset_id": asset, "req_id": f"M{j % 90}", "section": "", "kind": "mandatory",
+                   "prompt_kind": "boolean", "sheet_hash": "%064x" % (j // 500), "snippet": f"Leverandøren skal tilby garanti på minst {j % 60} måneder. Bekreft.",
+                   "file": files[0], "row": j % 300}
+        elif k == 1:
+            yield {"type": "contract_term", "key": f"payment:days_{j % 40}", "value": rng.choice([True, 30, "Ja", None, 12.5]),
+                   "source_file": files[1], "snippet": "betalingsbetingelsen fri leveringstid + 30 dager"[: j % 48], "asset_id": asset}
+        elif k == 2:
+            yield {"type": "service_feature", "key": f"sla:response_{j % 12}", "value": f"{j % 24}h", "source_file": files[3], "asset_id": asset}
+        else:
+            yield {"type": "price_schema", "sheet": f"Prisskjema_{j % 7}", "source_file": files[2], "asset_id": asset}
+
+def timed(fn, rows):
+    t0 = time.perf_counter()
+    for r in rows:
+        fn(r)
+    return time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=1000000)
+    ap.add_argument("--fuzz", type=int, default=20000)
+    ap.add_argument("--min-speedup", type=float, default=1.5)
+    args = ap.parse_args()
+    rng = random.Random(7)
+    rows = list(receipts(rng, args.rows))
+    for i, r in enumerate(fuzz(rng, args.fuzz) + rows):
+        a, b = reference(r), canonical_json(r)
+        if a != b:
+            print(json.dumps({"ok": False, "row": i, "reference": a.decode("utf-8"), "canonical_json": b.decode("utf-8")}, ensure_ascii=False))
+            return 1
+    ref_s, new_s = timed(reference, rows), timed(canonical_json, rows)
+    speedup = ref_s / new_s
+    ok = speedup >= args.min_speedup
+    print(json.dumps({"rows": len(rows), "equivalent": True, "json_dumps_s": round(ref_s, 2), "canonical_json_s": round(new_s, 2),
+                      "rows_per_s": round(len(rows) / new_s), "speedup": round(speedup, 2), "min_speedup": args.min_speedup, "ok": ok}))
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Peak-RSS regression for pcc.ingest.iter_zip_members.
+
+Builds synthetic zips with one large (highly compressible) member per size
+step, hashes each in a fresh interpreter, and fails when peak RSS grows with
+member size. Sizes are in MB; the default steps reach 2 GB.
+"""
+import argparse, json, os, subprocess, sys, tempfile, zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROBE = (
+    "import resource, sys\n"
+    "from pcc.ingest import iter_zip_members\n"
+    "iter_zip_members(sys.argv[1], stream=sys.argv[2] == '1')\n"
+    "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+)
+
+def make_zip(path, size_mb):
+    block = b"\0" * (1 << 20)
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as z:
+        z.writestr("ITT.txt", "Konkurransebestemmelser\n")
+        with z.open("Vedlegg 09 Tegninger.pdf", "w", force_zip64=True) as f:
+            for _ in range(size_mb):
+                f.write(block)
+
+def peak_rss_kb(zip_path, stream):
+    out = subprocess.run([sys.executable, "-c", PROBE, zip_path, "1" if stream else "0"],
+                         capture_output=True, text=True, check=True, cwd=ROOT)
+    return int(out.stdout.strip().splitlines()[-1])
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes-mb", default="64,512,2048")
+    ap.add_argument("--budget-mb", type=float, default=16.0, help="allowed RSS growth from smallest to largest size")
+    ap.add_argument("--no-stream", action="store_true", help="measure the read-whole-member path instead")
+    args = ap.parse_args()
+    sizes = [int(s) for s in args.sizes_mb.split(",")]
+    results = []
+    with tempfile.TemporaryDirectory() as td:
+        for mb in sizes:
+            zp = os.path.join(td, f"synthetic-{mb}.zip")
+            make_zip(zp, mb)
+            rss = peak_rss_kb(zp, not args.no_stream)
+            os.remove(zp)
+            results.append({"member_mb": mb, "peak_rss_mb": round(rss / 1024, 1)})
+            print(json.dumps(results[-1]))
+    growth = results[-1]["peak_rss_mb"] - results[0]["peak_rss_mb"]
+    ok = growth <= args.budget_mb
+    print(json.dumps({"rss_growth_mb": round(growth, 1), "budget_mb": args.budget_mb, "ok": ok}))
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Time PDF-to-text conversion of a large annex: serial, parallel, then cached.
+
+Writes a plain N-page PDF (no dependencies), zips it and converts it with
+pcc.pdftext using poppler. Needs pdftotext and pdfinfo on PATH.
+"""
+import argparse, json, os, sys, tempfile, time, zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pcc.ingest import MemberTable
+from pcc.pdftext import PopplerConverter, convert_pdf_members
+
+def write_pdf(path, pages, lines=50):
+    objs = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for p in range(pages):
+        body = "BT /F1 9 Tf 40 800 Td 11 TL " + " ".join(f"(Krav {p + 1}.{i + 1}: Leverandoren skal dokumentere oppetid og responstid.) '" for i in range(lines)) + " ET"
+        objs.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(body), body.encode("latin-1")))
+        objs.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objs))
+        kids.append(len(objs))
+    objs[1] = b"<< /Type /Pages /Count %d /Kids [%s] >>" % (pages, " ".join(f"{k} 0 R" for k in kids).encode())
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, o in enumerate(objs, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (i, o)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objs) + 1)
+    out += b"".join(b"%010d 00000 n \n" % off for off in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objs) + 1, xref)
+    with open(path, "wb") as f:
+        f.write(out)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=400)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    args = ap.parse_args()
+    if not PopplerConverter.available():
+        print(json.dumps({"skipped": "pdftotext/pdfinfo not found"}))
+        return 2
+    conv = PopplerConverter()
+    with tempfile.TemporaryDirectory() as td:
+        pdf = os.path.join(td, "Vedlegg 01 Teknisk bilag.pdf")
+        write_pdf(pdf, args.pages)
+        zpath = os.path.join(td, "pack.zip")
+        with zipfile.ZipFile(zpath, "w", zipfile.ZIP_DEFLATED) as z:
+            z.write(pdf, os.path.basename(pdf))
+        res = {"pages": args.pages, "workers": args.workers}
+        for label, workers, cache in (("serial_s", 1, None), ("parallel_s", args.workers, os.path.join(td, "cache")),
+                                      ("cached_s", args.workers, os.path.join(td, "cache"))):
+            members = MemberTable.from_zip(zpath)
+            t0 = time.perf_counter()
+            added = convert_pdf_members(zpath, members, conv, cache_dir=cache, workers=workers)
+            res[label] = round(time.perf_counter() - t0, 3)
+            res["chars"] = len(added[0].text)
+    print(json.dumps(res))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
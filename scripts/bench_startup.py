@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Cold-start budget for `pcc verify` and `pcc digest --help`, measured with python -X importtime.
+
+Runs `pcc verify` through the dispatcher and through pcc.verify directly, and
+`pcc digest --help`, in fresh interpreters, sums the self import time of every
+module that `python -m` on an empty module does not already load, and fails
+when the verify median exceeds --budget-ms, when the dispatcher costs more
+than --overhead-ms over the direct entry point, when the digest --help median
+exceeds --digest-budget-ms, or when either imports an extractor module (or,
+for --help, the modules a digest run needs: bedrock, ingest, pickle, zipfile,
+subprocess, concurrent.futures).
+"""
+import argparse, hashlib, json, os, statistics, subprocess, sys, tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def importtime(argv, cwd=ROOT):
+    p = subprocess.run([sys.executable, "-X", "importtime"] + argv, capture_output=True, text=True, cwd=cwd)
+    mods = {}
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        mods[name.strip()] = int(self_us)
+    return p.returncode, mods
+
+def main():
+    ap = argparse.ArgumentParser()
+    # measured ~45-50 ms here, nearly all argparse (re, shutil, locale), json and hashlib; pcc's own modules are ~1 ms
+    ap.add_argument("--budget-ms", type=float, default=65.0)
+    ap.add_argument("--overhead-ms", type=float, default=10.0)  # the dispatcher adds pcc.registry (<1 ms); the rest is run-to-run noise
+    # measured ~75-85 ms here: verify's set plus typing and shutil (bz2, lzma); ~225 ms while build_parser pulled in bedrock and the pool
+    ap.add_argument("--digest-budget-ms", type=float, default=95.0)
+    ap.add_argument("--runs", type=int, default=7)
+    args = ap.parse_args()
+    with tempfile.TemporaryDirectory() as td:
+        receipts = os.path.join(td, "receipts.jsonl"); root = os.path.join(td, "root.txt")
+        with open(receipts, "wb") as f:
+            f.write(b'{"type":"summary"}\n')
+        with open(root, "w") as f:
+            f.write("root: " + hashlib.sha256(b'{"type":"summary"}\n').hexdigest() + "\n")
+        # the baseline is `python -m` on an empty module: runpy's own imports are not pcc's
+        with open(os.path.join(td, "noop.py"), "w") as f:
+            f.write("")
+        _, base = importtime(["-m", "noop"], cwd=td)
+        def measure(argv):
+            samples = []; extra = {}
+            for _ in range(args.runs):
+                rc, mods = importtime(argv)
+                if rc != 0:
+                    raise SystemExit(json.dumps({"ok": False, "error": f"{' '.join(argv)} exited {rc}"}))
+                extra = {m: us for m, us in mods.items() if m not in base}
+                samples.append(sum(extra.values()) / 1000.0)
+            return statistics.median(samples), extra
+        med, extra = measure(["-m", "pcc.cli", "verify", "--receipts", receipts, "--root", root])
+        direct, _ = measure(["-m", "pcc.verify", "--receipts", receipts, "--root", root])
+        help_med, help_extra = measure(["-m", "pcc.cli", "digest", "--help"])
+    heavy = sorted(m for m in extra if m.startswith("pcc.extract_") or m in ("pcc.digest", "pcc.matrix"))
+    run_only = ("pcc.bedrock", "pcc.ingest", "pickle", "zipfile", "subprocess", "concurrent.futures")
+    help_heavy = sorted(m for m in help_extra if m.startswith("pcc.extract_") or m in run_only)
+    top = lambda mods: [[m, round(us / 1000, 2)] for m, us in sorted(mods.items(), key=lambda kv: -kv[1])[:5]]
+    ok = med <= args.budget_ms and med - direct <= args.overhead_ms and help_med <= args.digest_budget_ms and not heavy and not help_heavy
+    print(json.dumps({"median_import_ms": round(med, 2), "direct_ms": round(direct, 2), "budget_ms": args.budget_ms, "modules": len(extra),
+                      "top": top(extra), "unexpected": heavy,
+                      "digest_help": {"median_import_ms": round(help_med, 2), "budget_ms": args.digest_budget_ms, "modules": len(help_extra),
+                                      "top": top(help_extra), "unexpected": help_heavy}, "ok": ok}))
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Throughput and peak-RSS regression for pcc-verify on large receipts logs.
+
+Writes synthetic receipts.jsonl files of growing size (receipt-shaped
+canonical lines), roots them, then verifies each in a fresh interpreter with
+buffered reads and with --mmap. Reports GB/s per run and fails when peak RSS
+grows with file size or throughput drops below --min-gbps. Sizes are in MB.
+"""
+import argparse, json, os, subprocess, sys, tempfile, time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from pcc.merkle import ROOT_FORMAT, file_root
+
+PROBE = (
+    "import resource, sys\n"
+    "from pcc.verify import main\n"
+    "rc = main(sys.argv[1:])\n"
+    "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+    "sys.exit(rc)\n"
+)
+
+def make_receipts(path, size_mb):
+    target = size_mb << 20
+    done = i = 0
+    with open(path, "wb") as f:
+        while done < target:
+            block = b"".join(
+                json.dumps({"type": "contract_term", "asset_id": "tender:pack/bench", "key": f"term:{j}",
+                            "value": "x" * (j % 97), "source_file": "Rammeavtale.txt", "source_snippet": f"punkt {j} " * 8},
+                           ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8") + b"\n"
+                for j in range(i, i + 4096))
+            f.write(block)
+            done += len(block); i += 4096
+
+def verify(receipts, root, mmap):
+    argv = [sys.executable, "-c", PROBE, "--receipts", receipts, "--root", root] + (["--mmap"] if mmap else [])
+    t0 = time.perf_counter()
+    out = subprocess.run(argv, capture_output=True, text=True, cwd=ROOT)
+    dt = time.perf_counter() - t0
+    if out.returncode != 0:
+        raise SystemExit(json.dumps({"ok": False, "error": out.stdout + out.stderr}))
+    return dt, int(out.stdout.strip().splitlines()[-1])
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes-mb", default="64,512")
+    ap.add_argument("--budget-mb", type=float, default=16.0, help="allowed RSS growth from smallest to largest size")
+    ap.add_argument("--min-gbps", type=float, default=0.02, help="floor for the slowest run; catches a verify that stops streaming")
+    ap.add_argument("--dir", help="scratch directory (default: a temporary one)")
+    args = ap.parse_args()
+    sizes = [int(s) for s in args.sizes_mb.split(",")]
+    results = []
+    with tempfile.TemporaryDirectory(dir=args.dir) as td:
+        receipts, root = os.path.join(td, "receipts.jsonl"), os.path.join(td, "root.txt")
+        for mb in sizes:
+            make_receipts(receipts, mb)
+            size = os.path.getsize(receipts)
+            r, n = file_root(receipts)
+            with open(root, "w", encoding="utf-8", newline="\n") as f:
+                f.write(f"root: {r}\nroot_format: {ROOT_FORMAT}\nlines: {n}\n")
+            for mmap in (False, True):
+                dt, rss = verify(receipts, root, mmap)
+                results.append({"file_mb": round(size / (1 << 20)), "lines": n, "mmap": mmap, "s": round(dt, 2),
+                                "gbps": round(size / dt / 1e9, 3), "peak_rss_mb": round(rss / 1024, 1)})
+                print(json.dumps(results[-1]))
+            os.remove(receipts)
+    growth = max(r["peak_rss_mb"] for r in results if r["file_mb"] == results[-1]["file_mb"]) - \
+        min(r["peak_rss_mb"] for r in results if r["file_mb"] == results[0]["file_mb"])
+    slowest = min(r["gbps"] for r in results)
+    ok = growth <= args.budget_mb and slowest >= args.min_gbps
+    print(json.dumps({"rss_growth_mb": round(growth, 1), "budget_mb": args.budget_mb, "min_gbps": slowest, "ok": ok}))
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
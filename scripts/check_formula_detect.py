@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Check pcc.formula_detect against the line-then-150-char-chunk detector it replaced.
+
+The reference collapses every whitespace run to one space and looks for the
+three terms (lowest price, points, proportional) on one line or in one
+150-char chunk. detect_formula_in_text must find every text the reference
+finds. The cases are a layout-padded award table as pdftotext -layout prints
+it, and --cases generated texts: the terms on separate lines with column
+padding, blank lines and filler words between them. Exits 1 on the first text
+the reference finds and pcc misses.
+"""
+import argparse, json, os, random, re, sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pcc.formula_detect import detect_formula_in_text
+
+R1 = r'(laveste\s*(total)?\s*(pris|kostnad)|lowest\s*(total\s*)?(price|cost))'
+R2 = r'(poeng|score|points)'
+R3 = r'(proporsjon|propor|proportional|forholdsmessig)'
+
+def reference(text, win=150):
+    for line in text.splitlines():
+        s = line.strip()
+        if re.search(R1, s, re.I) and re.search(R2, s, re.I) and re.search(R3, s, re.I):
+            return True, s
+    for m in re.finditer(r'.{1,%d}' % win, re.sub(r'\s+', ' ', text), re.S):
+        s = m.group(0)
+        if re.search(R1, s, re.I) and re.search(R2, s, re.I) and re.search(R3, s, re.I):
+            return True, s.strip()
+    return False, ""
+
+LAYOUT = (
+    "6 Tildelingskriterier\n\n"
+    "     Tildelingskriterium                              Vekt          Dokumentasjon\n\n"
+    "     Pris                                             50 %          Vedlegg 3 Prisskjema\n"
+    "                                                                    Laveste pris gis 10 poeng,\n"
+    "                                                                    øvrige tilbud gis poeng\n"
+    "                                                                    forholdsmessig.\n\n"
+    "     Kvalitet                                         50 %          Vedlegg 2\n"
+)
+
+def generated(rng):
+    terms = [rng.choice(["Laveste pris", "laveste totalkostnad", "Lowest price"]), rng.choice(["poeng", "points", "score"]),
+             rng.choice(["forholdsmessig", "proporsjonalt", "proportional"])]
+    filler = ["gis", "10", "tilbud", "øvrige", "beregnes", "etter", "modell", "i", "forhold", "til"]
+    out = []
+    for t in terms:
+        out.append(" ".join(rng.choice(filler) for _ in range(rng.randint(0, 16))) + rng.choice([" ", "\n"]))
+        out.append(" " * rng.randint(0, 60) + t + " " * rng.randint(0, 60) + "\n" * rng.randint(1, 4))
+    return "Tildeling\n" + "".join(out)
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cases", type=int, default=5000)
+    args = ap.parse_args()
+    rng = random.Random(11)
+    texts = [LAYOUT] + [generated(rng) for _ in range(args.cases)]
+    found = 0
+    for i, t in enumerate(texts):
+        want = reference(t)[0]
+        got = detect_formula_in_text(t)[0]
+        if want and not got:
+            print(json.dumps({"ok": False, "case": i, "text": t}, ensure_ascii=False))
+            return 1
+        found += got
+    if not detect_formula_in_text(LAYOUT)[0]:
+        print(json.dumps({"ok": False, "case": 0, "text": LAYOUT}, ensure_ascii=False))
+        return 1
+    print(json.dumps({"ok": True, "cases": len(texts), "found": found}))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,4 +16,6 @@ python3 scripts/cli/pcc_riskcard.py --matrix "$MATRIX_WITH_CT" --format md --out
 echo "ci: verify goldens exist"
 count=$(find golden -type f -name receipts.jsonl | wc -l | awk '{print $1}')
 if [ "$count" -lt 1 ]; then echo "no golden receipts present"; exit 2; fi
+echo "ci: formula detector vs reference"
+python3 scripts/check_formula_detect.py >/dev/null
 echo "ci: ok"
@@ -1,25 +1,16 @@
 #!/usr/bin/env python3
-import argparse, hashlib, json, sys
+import argparse, hashlib, json, os, sys
 
-def read_lines(path):
-    with open(path, "rb") as f:
-        return [ln.rstrip(b"\n") for ln in f]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pcc.canonical import canonical_json
+from pcc.receipt_diff import diff_receipts
 
-def sha(b):
-    return hashlib.sha256(b).hexdigest()
+def sha(row):
+    return hashlib.sha256(canonical_json(row)[:-1]).hexdigest()
 
-def load_index(lines):
-    idx = {}
-    for b in lines:
-        h = sha(b)
-        idx[h] = b
-    return idx
-
-def summarize(b):
-    try:
-        obj = json.loads(b.decode("utf-8", "ignore"))
-    except Exception:
-        return b[:120].decode("utf-8", "ignore")
+def summarize(obj):
+    if not isinstance(obj, dict):
+        return json.dumps(obj)[:160]
     keys = ["type","key","asset_id","sheet","item"]
     vals = []
     for k in keys:
@@ -27,39 +18,32 @@ def summarize(b):
             vals.append(f"{k}={obj[k]}")
     return ", ".join(vals) if vals else json.dumps(obj)[:160]
 
+def section(title, items, line):
+    if not items:
+        return
+    print(f"\n{title}:")
+    for d in items[:50]:
+        print(line(d))
+    if len(items) > 50:
+        print("...")
+
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument("old")
     ap.add_argument("new")
+    ap.add_argument("--mem-mb", type=int, default=64)
     args = ap.parse_args()
 
-    old_lines = read_lines(args.old)
-    new_lines = read_lines(args.new)
-    old_idx = load_index(old_lines)
-    new_idx = load_index(new_lines)
-
-    old_set = set(old_idx.keys())
-    new_set = set(new_idx.keys())
-
-    added = sorted(new_set - old_set)
-    removed = sorted(old_set - new_set)
-    unchanged = sorted(new_set & old_set)
-
-    print(f"added={len(added)} removed={len(removed)} unchanged={len(unchanged)}")
-
-    if added:
-        print("\nADDED:")
-        for h in added[:50]:
-            print(f"{h} :: {summarize(new_idx[h])}")
-        if len(added) > 50:
-            print("...")
+    # only the first 50 of each kind are printed, so only those are kept
+    stats, shown = {}, {"added": [], "removed": [], "changed": []}
+    for d in diff_receipts(args.old, args.new, mem_bytes=args.mem_mb << 20, stats=stats):
+        if len(shown[d["op"]]) <= 50:
+            shown[d["op"]].append(d)
 
-    if removed:
-        print("\nREMOVED:")
-        for h in removed[:50]:
-            print(f"{h} :: {summarize(old_idx[h])}")
-        if len(removed) > 50:
-            print("...")
+    print(f"added={stats['added']} removed={stats['removed']} changed={stats['changed']} unchanged={stats['unchanged'] + stats['skipped']}")
+    section("ADDED", shown["added"], lambda d: f"{sha(d['row'])} :: {summarize(d['row'])}")
+    section("REMOVED", shown["removed"], lambda d: f"{sha(d['row'])} :: {summarize(d['row'])}")
+    section("CHANGED", shown["changed"], lambda d: f"{sha(d['old'])} -> {sha(d['new'])} :: {summarize(d['new'])}")
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""Catastrophic-backtracking audit of the extractor regexes.
+
+lint: parses every pattern handed to rx.* or index(t).search in pcc/ (string
+literals found in the source, plus patterns built at run time once the fuzz
+has registered them) and flags repeats nested inside unbounded repeats,
+repeated alternations with overlapping arms, neighbouring unbounded repeats
+over overlapping characters, and chains of two or more unbounded .*-like
+repeats.
+
+fuzz: runs each extract_* function on adversarial texts of doubling size,
+each (extractor, input) in a child process that is killed at --timeout.
+The inputs are the patterns' own literals on one long line (as a broken
+pdftotext export gives), the same wrapped into lines, and long runs of
+spaces, digits and letters. Reports p99 latency per extractor and per
+pattern (per call, averaged within a run) and the growth exponent between
+the two largest sizes. Exits 1 when anything grows faster than
+--max-exponent or times out; --strict also fails on lint findings.
+"""
+import argparse, ast, glob, importlib, inspect, json, math, multiprocessing as mp, os, random, string, sys, time
+import re
+from multiprocessing.connection import wait
+from re import _compiler, _constants as C, _parser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from pcc.patterns import _flag_names, _required, rx
+
+RX_FLAGS_ARG = {"search": 2, "match": 2, "fullmatch": 2, "findall": 2, "finditer": 2, "sub": 4, "split": 3,
+                "compile": 1, "search_within": 3}
+ALPHABET = string.printable + "æøåÆØÅéü§– "
+REPEATS = (C.MAX_REPEAT, C.MIN_REPEAT)
+MIN_MS = 20.0  # below this the exponent is noise
+
+# ---- harvest ----
+
+def _flags(node):
+    if node is None:
+        return 0
+    try:
+        return int(eval(compile(ast.Expression(node), "<flags>", "eval"), {"re": re, "_re": re}))
+    except Exception:
+        return 0
+
+def harvest(paths):
+    """{(pattern, flags): "file:line"} for literal patterns passed to rx.* and index(...).search."""
+    found = {}
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        for n in ast.walk(tree):
+            if not (isinstance(n, ast.Call) and isinstance(n.func, ast.Attribute) and n.args):
+                continue
+            fn, obj = n.func.attr, n.func.value
+            if isinstance(obj, ast.Name) and obj.id == "rx" and fn in RX_FLAGS_ARG:
+                k = RX_FLAGS_ARG[fn]
+            elif fn == "search" and isinstance(obj, ast.Call) and getattr(obj.func, "id", None) == "index":
+                k = 1
+            else:
+                continue
+            p = n.args[0]
+            if not (isinstance(p, ast.Constant) and isinstance(p.value, str)):
+                continue
+            fl = next((kw.value for kw in n.keywords if kw.arg == "flags"), n.args[k] if len(n.args) > k else None)
+            found.setdefault((p.value, _flags(fl)), f"{os.path.relpath(path, ROOT)}:{n.lineno}")
+    return found
+
+# ---- lint ----
+
+_chars_memo = {}
+
+def _chars(items, state, flags):
+    """Characters of ALPHABET that some single-character node within items can consume."""
+    out = set()
+    for op, av in items:
+        if op in (C.LITERAL, C.NOT_LITERAL, C.ANY, C.IN):
+            key = (op, repr(av), flags)
+            cs = _chars_memo.get(key)
+            if cs is None:
+                r = _compiler.compile(_parser.SubPattern(state, [(op, av)]), flags)
+                cs = _chars_memo[key] = frozenset(c for c in ALPHABET if r.fullmatch(c))
+            out |= cs
+        elif op is C.SUBPATTERN:
+            out |= _chars(av[-1], state, flags)
+        elif op is C.BRANCH:
+            for arm in av[1]:
+                out |= _chars(arm, state, flags)
+        elif op in REPEATS:
+            out |= _chars(av[2], state, flags)
+        elif op is C.GROUPREF:
+            out |= set(ALPHABET)
+    return frozenset(out)
+
+def _first(items, state, flags):
+    for op, av in items:
+        if op in (C.AT, C.ASSERT, C.ASSERT_NOT):
+            continue
+        if op in REPEATS and av[0] == 0:
+            return set(ALPHABET)  # nullable lead: anything may come first
+        return _chars([(op, av)], state, flags)
+    return set()
+
+def _unbounded(op, av):
+    return op in REPEATS and av[1] == C.MAXREPEAT
+
+def _nullable(op, av):
+    return op in (C.AT, C.ASSERT, C.ASSERT_NOT) or (op in REPEATS and av[0] == 0)
+
+def _flat(items):
+    for op, av in items:
+        if op is C.SUBPATTERN:
+            yield from _flat(av[-1])
+        else:
+            yield op, av
+
+def _has_unbounded(items):
+    for op, av in items:
+        if _unbounded(op, av):
+            return True
+        if op is C.SUBPATTERN and _has_unbounded(av[-1]):
+            return True
+        if op is C.BRANCH and any(_has_unbounded(a) for a in av[1]):
+            return True
+        if op in REPEATS and _has_unbounded(av[2]):
+            return True
+    return False
+
+def _walk(items, state, flags, out):
+    seq = list(_flat(items))
+    prev, dots = None, 0
+    for op, av in seq:
+        if _unbounded(op, av):
+            cs = _chars(av[2], state, flags)
+            if len(cs) >= 0.9 * len(ALPHABET):
+                dots += 1
+            if prev is not None and prev & cs:
+                out.add(("overlapping_quantifiers", "neighbouring unbounded repeats share characters"))
+            prev = cs
+            body = av[2]
+            if _has_unbounded(body) or any(o in REPEATS and a[1] > 1 for o, a in _flat(body)):
+                out.add(("nested_quantifier", "repeat inside an unbounded repeat"))
+            for o, a in _flat(body):
+                if o is C.BRANCH:
+                    firsts = [_first(arm, state, flags) for arm in a[1]]
+                    if any(firsts[i] & firsts[j] for i in range(len(firsts)) for j in range(i + 1, len(firsts))):
+                        out.add(("overlapping_alternation", "repeated alternation whose arms can start alike"))
+        elif not _nullable(op, av):
+            prev = None
+        if op in REPEATS:
+            _walk(av[2], state, flags, out)
+        elif op is C.BRANCH:
+            for arm in av[1]:
+                _walk(arm, state, flags, out)
+    if dots >= 2:
+        out.add(("dotstar_chain", f"{dots} unbounded .*-like repeats in sequence"))
+
+def lint(pattern, flags):
+    try:
+        p = _parser.parse(pattern, flags)
+    except re.error as e:
+        return [("invalid", str(e))]
+    out = set()
+    _walk(p.data, p.state, p.state.flags, out)
+    return sorted(out)
+
+# ---- fuzz ----
+
+def extractors():
+    out = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "pcc", "extract_*.py"))):
+        mod = importlib.import_module("pcc." + os.path.basename(path)[:-3])
+        for name, fn in inspect.getmembers(mod, inspect.isfunction):
+            if fn.__module__ != mod.__name__ or name.startswith("_"):
+                continue
+            ps = list(inspect.signature(fn).parameters)
+            if len(ps) == 2 and ps[0] in ("text", "t"):
+                out.append(f"{mod.__name__}:{name}")
+    return out
+
+def seed_words(patterns):
+    words = set()
+    for pat, fl in patterns:
+        try:
+            r = _required(_parser.parse(pat, fl).data)
+        except Exception:
+            continue
+        words.update(x.strip() for x in r or () if x.strip())
+    words = sorted(words)
+    random.Random(0).shuffle(words)
+    return words
+
+def make_text(gen, words, size):
+    if gen == "runs":
+        head = " ".join(words)
+        runs = "".join(c * 997 for c in " 9a.%\t0Z,")
+        body = (runs * (size // len(runs) + 1))[:max(0, size - len(head))]
+        return head + body
+    line = " ".join(words) + " "
+    s = (line * (size // len(line) + 1))[:size]
+    if gen == "lines":
+        s = "\n".join(s[i:i + 80] for i in range(0, len(s), 80))
+    return s
+
+def _child(conn, ext, gen, words, sizes, repeats):
+    mod, name = ext.split(":")
+    fn = getattr(importlib.import_module(mod), name)
+    for size in sizes:
+        text = make_text(gen, words, size)
+        for _ in range(repeats):
+            rx.reset()
+            t0 = time.perf_counter()
+            try:
+                fn(text, "fuzz.txt")
+                err = None
+            except Exception as e:
+                err = f"{type(e).__name__}: {e}"
+            ms = (time.perf_counter() - t0) * 1e3
+            stats = [(st.rx.pattern, st.rx.flags, st.ns / 1e6, st.calls) for st in rx._by_key.values() if st.calls]
+            conn.send((size, ms, err, stats))
+    conn.send(None)
+    conn.close()
+
+def p99(xs):
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, math.ceil(0.99 * len(xs)) - 1)] if xs else 0.0
+
+def exponent(by_size, sizes):
+    """Growth exponent of the (min) time between the two largest sizes reached."""
+    got = [s for s in sizes if by_size.get(s)]
+    if len(got) < 2:
+        return None
+    a, b = got[-2], got[-1]
+    ta, tb = min(by_size[a]), min(by_size[b])
+    if tb < MIN_MS or ta <= 0:
+        return None
+    return round(math.log(tb / ta) / math.log(b / a), 2)
+
+def fuzz(exts, words, sizes, repeats, timeout, workers):
+    jobs = [(e, g) for e in exts for g in ("line", "lines", "runs")]
+    runs, timeouts, errors = {}, [], {}
+    active = {}
+    ctx = mp.get_context("fork")
+    while jobs or active:
+        while jobs and len(active) < workers:
+            job = jobs.pop(0)
+            r, w = ctx.Pipe(duplex=False)
+            proc = ctx.Process(target=_child, args=(w, job[0], job[1], words, sizes, repeats), daemon=True)
+            proc.start()
+            w.close()
+            active[r] = (job, proc, time.monotonic() + timeout, [0])
+        now = time.monotonic()
+        for r in wait(list(active), timeout=max(0.0, min(v[2] for v in active.values()) - now)):
+            job, proc, _, last = active[r]
+            try:
+                msg = r.recv()
+            except EOFError:
+                msg = None
+            if msg is None:
+                proc.join(); r.close(); del active[r]
+                continue
+            size, ms, err, stats = msg
+            last[0] = size
+            if err:
+                errors.setdefault(job[0], err)
+            runs.setdefault(job, []).append((size, ms, stats))
+        for r, (job, proc, deadline, last) in list(active.items()):
+            if time.monotonic() > deadline:
+                proc.kill(); proc.join(); r.close(); del active[r]
+                timeouts.append({"extractor": job[0], "input": job[1], "timeout_s": timeout, "last_size": last[0]})
+    return runs, timeouts, errors
+
+def report(runs, sizes, max_exp):
+    ext_rows, pat = [], {}
+    by_ext = {}
+    for (ext, gen), rs in runs.items():
+        by_size = {}
+        for size, ms, stats in rs:
+            by_size.setdefault(size, []).append(ms)
+            for p, fl, pms, calls in stats:
+                d = pat.setdefault((p, fl), {"where": set(), "calls": {}, "by": {}})
+                d["where"].add(ext)
+                d["by"].setdefault((ext, gen), {}).setdefault(size, []).append(pms)
+                if size == max(s for s, _, _ in rs):
+                    d["calls"].setdefault("top", []).append(pms / calls)
+        e = by_ext.setdefault(ext, {"extractor": ext, "p99_ms": 0.0, "exponent": None, "worst_input": None})
+        top = by_size[max(by_size)]
+        e["p99_ms"] = max(e["p99_ms"], round(p99(top), 3))
+        x = exponent(by_size, sizes)
+        if x is not None and (e["exponent"] is None or x > e["exponent"]):
+            e["exponent"], e["worst_input"] = x, gen
+    for e in by_ext.values():
+        e["superlinear"] = e["exponent"] is not None and e["exponent"] > max_exp
+        ext_rows.append(e)
+    pat_rows = []
+    for (p, fl), d in pat.items():
+        xs = [x for by in d["by"].values() for x in [exponent(by, sizes)] if x is not None]
+        x = max(xs) if xs else None
+        pat_rows.append({"pattern": p, "flags": _flag_names(fl), "p99_ms": round(p99(d["calls"].get("top", [])), 3),
+                         "exponent": x, "superlinear": x is not None and x > max_exp, "extractors": sorted(d["where"])})
+    ext_rows.sort(key=lambda r: -r["p99_ms"])
+    pat_rows.sort(key=lambda r: -r["p99_ms"])
+    return ext_rows, pat_rows, {k: "runtime:" + sorted(d["where"])[0] for k, d in pat.items()}
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--lint-only", action="store_true")
+    ap.add_argument("--strict", action="store_true", help="Fail on lint findings too")
+    ap.add_argument("--sizes", default="8192,16384,32768,65536", help="Text sizes in chars, ascending")
+    ap.add_argument("--repeats", type=int, default=3)
+    ap.add_argument("--timeout", type=float, default=30.0, help="Seconds per extractor and input, all sizes")
+    ap.add_argument("--max-exponent", type=float, default=1.5)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--only", default=None, help="Regex on module:function to fuzz")
+    ap.add_argument("--top", type=int, default=20)
+    ap.add_argument("--out", default=None, help="Write the full report as JSON here")
+    args = ap.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    where = harvest(sorted(glob.glob(os.path.join(ROOT, "pcc", "*.py"))))
+    res = {"patterns": len(where)}
+    fail = []
+    if not args.lint_only:
+        exts = [e for e in extractors() if not args.only or re.search(args.only, e)]
+        runs, timeouts, errors = fuzz(exts, seed_words(where), sizes, args.repeats, args.timeout, args.workers)
+        ext_rows, pat_rows, seen = report(runs, sizes, args.max_exponent)
+        for k, w in seen.items():  # patterns built at run time (f-strings, loops)
+            where.setdefault(k, w)
+        res.update({"extractors": ext_rows, "slow_patterns": pat_rows, "timeouts": timeouts, "errors": errors})
+        fail += [r for r in ext_rows if r["superlinear"]] + [r for r in pat_rows if r["superlinear"]] + timeouts
+    findings = [{"pattern": p, "flags": _flag_names(fl), "where": w, "kind": k, "detail": d}
+                for (p, fl), w in sorted(where.items(), key=lambda kv: kv[1]) for k, d in lint(p, fl)]
+    res["lint"] = findings
+    if args.strict:
+        fail += findings
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(res, f, ensure_ascii=False, indent=1)
+    kinds = {}
+    for f in findings:
+        kinds[f["kind"]] = kinds.get(f["kind"], 0) + 1
+    for f in findings:
+        print(json.dumps({"lint": f["kind"], "where": f["where"], "pattern": f["pattern"], "flags": f["flags"]}, ensure_ascii=False))
+    if not args.lint_only:
+        for r in res["extractors"]:
+            print(json.dumps(r, ensure_ascii=False))
+        shown = [r for r in res["slow_patterns"] if r["superlinear"]] or res["slow_patterns"][:args.top]
+        for r in shown:
+            print(json.dumps(r, ensure_ascii=False))
+        for t in res["timeouts"]:
+            print(json.dumps({"timeout": t}, ensure_ascii=False))
+    print(json.dumps({"patterns": res["patterns"], "lint": kinds, "fuzzed": len(res.get("extractors", [])),
+                      "superlinear": len([f for f in fail if "kind" not in f]), "ok": not fail}))
+    return 1 if fail else 0
+
+if __name__ == "__main__":
+    sys.exit(main())